@@ -0,0 +1,78 @@
+"""
+Measure the time needed to import gamarts and to access its main attributes.
+
+Every scenario is run in a new interpreter, several times, and the median is reported,
+with the heavy dependencies imported by the scenario.
+
+Usage:
+----
+- ``python benchmarks/import_time.py`` prints the measures.
+- ``python benchmarks/import_time.py --repeat 20 --max-import-ms 50`` fails if the median time of ``import gamarts`` exceeds 50 ms,
+or if ``import gamarts`` imports a heavy dependency.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+HEAVY_DEPENDENCIES = ('numpy', 'PIL', 'pygame', 'pygamecv', 'cv2', 'ZOCallable')
+
+SCENARIOS = {
+    'import gamarts': 'import gamarts',
+    'gamarts.ImageFile': 'import gamarts; gamarts.ImageFile',
+    'gamarts.transform.Zoom': 'import gamarts; gamarts.transform.Zoom',
+    'gamarts.mask.Circle': 'import gamarts; gamarts.mask.Circle',
+    'everything': 'from gamarts import *; from gamarts.transform import *; from gamarts.mask import *',
+}
+
+_PROBE = """
+import sys, time, json
+start = time.perf_counter()
+{statement}
+elapsed = (time.perf_counter() - start)*1000
+print(json.dumps({{'ms': elapsed, 'modules': [name for name in {heavy!r} if name in sys.modules]}}))
+"""
+
+def measure(statement: str, repeat: int) -> tuple[float, list[str]]:
+    """Return the median time in ms of a statement run in new interpreters, and the heavy dependencies it imported."""
+    times = []
+    modules = []
+    env = dict(os.environ, PYTHONPATH=ROOT + os.pathsep + os.environ.get('PYTHONPATH', ''), PYGAME_HIDE_SUPPORT_PROMPT='1')
+    for _ in range(repeat):
+        output = subprocess.run(
+            [sys.executable, '-c', _PROBE.format(statement=statement, heavy=HEAVY_DEPENDENCIES)],
+            capture_output=True, text=True, check=True, env=env, cwd=ROOT
+        ).stdout
+        result = json.loads(output.strip().splitlines()[-1])
+        times.append(result['ms'])
+        modules = result['modules']
+    return statistics.median(times), modules
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--repeat', type=int, default=10, help="number of interpreters started per scenario")
+    parser.add_argument('--max-import-ms', type=float, default=None, help="maximum median time of 'import gamarts', in ms")
+    args = parser.parse_args()
+
+    results = {}
+    width = max(len(name) for name in SCENARIOS)
+    for name, statement in SCENARIOS.items():
+        median, modules = measure(statement, args.repeat)
+        results[name] = (median, modules)
+        print(f"{name:<{width}}  {median:8.1f} ms  {', '.join(modules) or '-'}")
+
+    failed = False
+    median, modules = results['import gamarts']
+    if modules:
+        print(f"'import gamarts' imported heavy dependencies: {', '.join(modules)}")
+        failed = True
+    if args.max_import_ms is not None and median > args.max_import_ms:
+        print(f"'import gamarts' took {median:.1f} ms, more than {args.max_import_ms} ms")
+        failed = True
+    return 1 if failed else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -2,11 +2,34 @@
 gamarts is a python library used to represent animations and static images with the same Art class.
 It also introduce clever loading and unloading methods.
 """
-from gamarts.art import (
-    GIFFile, ImageFile, ImageFolder, Rectangle, RoundedRectangle, Circle, Ellipse, Polygon,
-    TexturedCircle, TexturedEllipse, TexturedPolygon, TexturedRoundedRectangle, Art
-)
-import gamarts.mask as mask
-import gamarts.transform as transform
+from typing import TYPE_CHECKING
+from ._lazy import lazy_exports
+
+# The arts, the masks and the transformations, and their dependencies, are imported at their first access.
+__getattr__, __dir__, __all__ = lazy_exports(__name__, {
+    '.art': (
+        'GIFFile', 'WebPFile', 'APNGFile', 'ImageFile', 'ImageFolder', 'SpriteSheet', 'Rectangle', 'RoundedRectangle', 'Circle', 'Ellipse', 'Polygon',
+        'TexturedCircle', 'TexturedEllipse', 'TexturedPolygon', 'TexturedRoundedRectangle', 'Art', 'ArtGroup', 'MemoryManager', 'memory_manager',
+        'Preloader', 'preloader', 'TransformationExecutor', 'transformation_executor', 'ResultCache', 'result_cache',
+        'DiskCache', 'disk_cache', 'Bundle', 'BundleArt', 'write_bundle', 'Manifest', 'manifest', 'write_manifest',
+        'StreamArt', 'gather_load', 'RotationCache'
+    ),
+    '._workers': ('ThreadBudget', 'thread_budget'),
+    '.mask': (),
+    '.transform': (),
+})
+__all__.append('LD_KWARGS')
+
+if TYPE_CHECKING:
+    from gamarts.art import (
+        GIFFile, WebPFile, APNGFile, ImageFile, ImageFolder, SpriteSheet, Rectangle, RoundedRectangle, Circle, Ellipse, Polygon,
+        TexturedCircle, TexturedEllipse, TexturedPolygon, TexturedRoundedRectangle, Art, ArtGroup, MemoryManager, memory_manager,
+        Preloader, preloader, TransformationExecutor, transformation_executor, ResultCache, result_cache,
+        DiskCache, disk_cache, Bundle, BundleArt, write_bundle, Manifest, manifest, write_manifest,
+        StreamArt, gather_load, RotationCache
+    )
+    from gamarts._workers import ThreadBudget, thread_budget
+    import gamarts.mask as mask
+    import gamarts.transform as transform
 
 LD_KWARGS = {'antialias': False, 'cost_threshold': 200_000}
@@ -1,8 +1,48 @@
 """The commone module contains the LoadingError Exception and some common objects."""
-from typing import Union, Tuple, Sequence
-from pygame import Color
+from typing import Union, Tuple, Sequence, Hashable
+from hashlib import sha1
+import numpy as np
+from pygame import Color, Rect
 
 class LoadingError(Exception):
     """Error to be raised when an error related to the loading of an Art occurs."""
 
 ColorValue = Union[Color, int, str, Tuple[int, int, int], Tuple[int, int, int, int], Sequence[int]]
+
+def fingerprint_of(value) -> Hashable | None:
+    """
+    Return a hashable value identifying a value, stable from one run to another, or None if the value cannot be identified.
+    Transformations, masks and arts are identified by their .fingerprint() method. Functions, iterators and other objects cannot be identified.
+    """
+    if value is None or isinstance(value, (bool, int, float, str, bytes)):
+        return (type(value).__name__, value)
+    if isinstance(value, (np.integer, np.floating, np.bool_)):
+        return fingerprint_of(value.item())
+    if isinstance(value, (Color, Rect)):
+        return (type(value).__name__, tuple(value))
+    if isinstance(value, slice):
+        return ('slice', value.start, value.stop, value.step)
+    if isinstance(value, np.ndarray):
+        return ('ndarray', value.shape, str(value.dtype), sha1(np.ascontiguousarray(value).tobytes()).hexdigest())
+    if isinstance(value, (tuple, list)):
+        items = tuple(fingerprint_of(item) for item in value)
+        return None if None in items else ('sequence', items)
+    if isinstance(value, dict):
+        items = tuple((fingerprint_of(key), fingerprint_of(item)) for key, item in value.items())
+        return None if any(None in pair for pair in items) else ('dict', tuple(sorted(items, key=repr)))
+    if not isinstance(value, type) and hasattr(value, 'fingerprint'):
+        return value.fingerprint()
+    return None
+
+def fingerprint_attributes(obj, exclude: Sequence[str] = ()) -> Hashable | None:
+    """Return a hashable value identifying an object by its class and its attributes, or None if one of the attributes cannot be identified."""
+    attributes = []
+    for name, value in sorted(vars(obj).items()):
+        if name in exclude:
+            continue
+        fingerprint = fingerprint_of(value)
+        if fingerprint is None:
+            return None
+        attributes.append((name, fingerprint))
+    cls = type(obj)
+    return (f"{cls.__module__}.{cls.__qualname__}", tuple(attributes))
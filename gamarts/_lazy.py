@@ -0,0 +1,34 @@
+"""The lazy module contains the function used by the packages to import their submodules at the first access to one of their attributes."""
+from importlib import import_module
+from typing import Callable
+
+def lazy_exports(package: str, exports: dict[str, tuple[str]]) -> tuple[Callable[[str], object], Callable[[], list[str]], list[str]]:
+    """
+    Return the __getattr__ and __dir__ functions and the __all__ list of a package whose attributes are imported from its submodules when accessed.
+
+    Params:
+    ----
+    - package: str, the name of the package, its __name__.
+    - exports: dict[str, tuple[str]], the names exported by the package, by relative name of the submodule defining them.
+    If the tuple of a submodule is empty, the submodule itself is exported.
+    """
+    origins = {}
+    for module, names in exports.items():
+        for name in names or (module.lstrip('.'),):
+            origins[name] = (module, bool(names))
+    namespace = import_module(package).__dict__
+
+    def __getattr__(name: str):
+        if name not in origins:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        module, is_attribute = origins[name]
+        value = import_module(module, package)
+        if is_attribute:
+            value = getattr(value, name)
+        namespace[name] = value # The next accesses do not call __getattr__.
+        return value
+
+    def __dir__():
+        return sorted(set(namespace) | set(origins))
+
+    return __getattr__, __dir__, list(origins)
@@ -0,0 +1,72 @@
+"""The raw module contains the functions used to store the frames of the arts as raw pixels and to map them back as surfaces."""
+from typing import BinaryIO, Sequence
+import mmap
+from pygame import Surface, SRCALPHA
+from pygame.image import tobytes, frombuffer
+
+ALIGNMENT = 64 # The frames are aligned in the files to be read directly by the pixel routines.
+
+def surface_format(surf: Surface) -> str:
+    """Return the format used to store the pixels of a surface: BGRA for surfaces with an alpha channel, RGBX otherwise."""
+    return 'BGRA' if surf.get_flags() & SRCALPHA else 'RGBX'
+
+def write_frames(file: BinaryIO, surfaces: Sequence[Surface], start: int = 0) -> list[dict]:
+    """
+    Write the pixels of the surfaces in a file, each frame being aligned.
+    A surface present several times is written once.
+
+    Params:
+    ----
+    - file: BinaryIO, the file opened in binary mode.
+    - surfaces: Sequence[Surface], the frames.
+    - start: int = 0, the offset of the current position of the file in the final file, used to align the frames.
+
+    Returns:
+    ----
+    - frames: list[dict], the description of each frame, to be given to read_frames.
+    """
+    frames = []
+    written: dict[int, dict] = {}
+    position = start
+    for surf in surfaces:
+        if id(surf) not in written:
+            padding = -position % ALIGNMENT
+            file.write(b'\0'*padding)
+            position += padding
+            fmt = surface_format(surf)
+            pixels = tobytes(surf, fmt)
+            file.write(pixels)
+            written[id(surf)] = {
+                'offset': position,
+                'length': len(pixels),
+                'size': list(surf.get_size()),
+                'format': fmt,
+                'alpha': surf.get_alpha(),
+                'colorkey': list(surf.get_colorkey()) if surf.get_colorkey() is not None else None,
+            }
+            position += len(pixels)
+        frames.append(written[id(surf)])
+    return frames
+
+def read_frames(buffer, frames: Sequence[dict]) -> tuple[Surface]:
+    """
+    Create the surfaces described by write_frames from a buffer. The surfaces share the memory of the buffer.
+    Frames written once for a surface present several times give one surface.
+    """
+    view = memoryview(buffer)
+    surfaces: dict[int, Surface] = {}
+    for frame in frames:
+        offset = frame['offset']
+        if offset not in surfaces:
+            surf = frombuffer(view[offset: offset + frame['length']], tuple(frame['size']), frame['format'])
+            if frame['colorkey'] is not None:
+                surf.set_colorkey(frame['colorkey'])
+            if frame['alpha'] is not None and frame['alpha'] != 255:
+                surf.set_alpha(frame['alpha'])
+            surfaces[offset] = surf
+    return tuple(surfaces[frame['offset']] for frame in frames)
+
+def map_file(path: str) -> mmap.mmap:
+    """Map a file in memory. The pages are read when they are accessed, and modifications of the memory are not written in the file."""
+    with open(path, 'rb') as file:
+        return mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_COPY)
@@ -0,0 +1,267 @@
+"""The workers module contains the threads shared by all the pools used to load and transform the arts in the background."""
+from concurrent.futures import Future, wait
+from heapq import heappush, heappop
+from itertools import count
+from threading import Thread, Lock, Condition, current_thread
+from time import perf_counter
+from typing import Callable
+from weakref import WeakSet
+import os
+
+class Task(Future):
+    """
+    A Task is the future of a function submitted to a WorkerPool.
+    A thread waiting for the result of a task that no worker has started executes it itself: the tasks waiting for other tasks,
+    like the loading of an ImageFolder waiting for the decoding of its images, cannot use all the threads and wait forever.
+    """
+
+    def __init__(self, function: Callable, args: tuple, kwargs: dict) -> None:
+        super().__init__()
+        self._call = (function, args, kwargs)
+        self._claimed = False
+        self._claim_lock = Lock()
+
+    def _claim(self) -> bool:
+        """Return True if the calling thread is the first one to claim the execution of the task."""
+        with self._claim_lock:
+            if self._claimed:
+                return False
+            self._claimed = True
+            return True
+
+    def _run(self):
+        if not self.set_running_or_notify_cancel(): # The task has been cancelled.
+            self._call = None
+            return
+        function, args, kwargs = self._call
+        self._call = None # The task must not keep its arguments alive.
+        try:
+            result = function(*args, **kwargs)
+        except BaseException as error: # pylint: disable=broad-exception-caught
+            self.set_exception(error)
+        else:
+            self.set_result(result)
+
+    def run_if_pending(self) -> bool:
+        """Execute the task on the calling thread if no worker has started it. Return True if it has been executed."""
+        if self.done() or not self._claim():
+            return False
+        self._run()
+        return True
+
+    def result(self, timeout: float = None):
+        self.run_if_pending()
+        return super().result(timeout)
+
+    def exception(self, timeout: float = None):
+        self.run_if_pending()
+        return super().exception(timeout)
+
+def wait_for(future: Future):
+    """Wait for a future to be done, without raising its exception. A task that no worker has started is executed on the calling thread."""
+    if isinstance(future, Task):
+        future.run_if_pending()
+    wait((future,))
+
+class ThreadBudget:
+    """
+    The ThreadBudget is the set of threads shared by all the WorkerPools: the decoding of the files, the preloading, the transformations,
+    the mip maps, the rotations, the encoding and the disk cache. The total number of threads is bounded by the budget,
+    and the threads execute the tasks of all the pools by order of priority, each pool limiting the number of its tasks executed at once.
+    The budget reports the number of tasks waiting in all the pools and the utilisation of all the threads.
+
+    Example:
+    ----
+    - ``thread_budget.threads = 4`` limits the number of threads used in the background to 4. It must be set before the first tasks are submitted.
+    - ``thread_budget.utilisation`` returns the proportion of time the threads spent executing tasks.
+    """
+
+    def __init__(self, threads: int = None) -> None:
+        """
+        Create a ThreadBudget.
+
+        Params:
+        ----
+        - threads: int = None, the maximum number of threads. If None, the number of cores is used.
+        """
+        self.threads = threads if threads is not None else (os.cpu_count() or 1)
+        self._condition = Condition()
+        self._counter = count() # Used to keep the order of submission between tasks of the same priority.
+        self._pools: WeakSet['WorkerPool'] = WeakSet()
+        self._workers: list[Thread] = []
+        self._idle = 0
+        self._statistics_start = perf_counter()
+
+    @property
+    def pools(self) -> tuple['WorkerPool']:
+        """Return the pools whose tasks are executed by the threads."""
+        with self._condition:
+            return tuple(self._pools)
+
+    @property
+    def queue_depth(self) -> int:
+        """Return the number of tasks waiting to be executed in all the pools."""
+        return sum(pool.queue_depth for pool in self.pools)
+
+    @property
+    def active_workers(self) -> int:
+        """Return the number of threads currently executing a task."""
+        return sum(pool.active_workers for pool in self.pools)
+
+    @property
+    def utilisation(self) -> float:
+        """Return the proportion of time the threads spent executing tasks since the creation of the budget or the last reset of the statistics."""
+        now = perf_counter()
+        elapsed = (now - self._statistics_start)*self.threads
+        return sum(pool._busy(now) for pool in self.pools)/elapsed if elapsed > 0 else 0.
+
+    def reset_statistics(self):
+        """Reset the measure of the utilisation of the threads and of all the pools."""
+        for pool in self.pools:
+            pool.reset_statistics()
+        self._statistics_start = perf_counter()
+
+    def is_worker(self) -> bool:
+        """Return True if the calling thread is one of the threads of the budget."""
+        return current_thread() in self._workers
+
+    def _register(self, pool: 'WorkerPool'):
+        with self._condition:
+            self._pools.add(pool)
+
+    def _push(self, pool: 'WorkerPool', priority: int, task: Task):
+        with self._condition:
+            heappush(pool._queue, (-priority, next(self._counter), task))
+            if self._idle == 0 and len(self._workers) < self.threads:
+                thread = Thread(target=self._work, name=f"gamarts-{len(self._workers)}", daemon=True)
+                self._workers.append(thread)
+                thread.start()
+            self._condition.notify()
+
+    def _next(self) -> tuple['WorkerPool', Task]:
+        """Wait for the next task of the pools that can execute one more task, by order of priority."""
+        with self._condition:
+            while True:
+                best = None
+                for pool in self._pools:
+                    while pool._queue and (pool._queue[0][2]._claimed or pool._queue[0][2].cancelled()):
+                        heappop(pool._queue) # Executed by a waiting thread, or cancelled.
+                    if pool._queue and not pool._is_full() and (best is None or pool._queue[0] < best._queue[0]):
+                        best = pool
+                if best is not None:
+                    task = heappop(best._queue)[2]
+                    if task._claim():
+                        best._active += 1
+                        return best, task
+                    continue
+                self._idle += 1
+                self._condition.wait()
+                self._idle -= 1
+
+    def _work(self):
+        while True:
+            pool, task = self._next()
+            start = perf_counter()
+            with pool._lock:
+                pool._busy_since[id(task)] = start
+            task._run()
+            with pool._lock:
+                pool._busy_time += perf_counter() - pool._busy_since.pop(id(task))
+            with self._condition:
+                pool._active -= 1
+                self._condition.notify_all() # A pool limited by its number of workers can execute its next task.
+            pool = task = None # The task must not be kept alive while the thread waits for the next one.
+
+thread_budget = ThreadBudget()
+
+class WorkerPool:
+    """
+    A WorkerPool is a queue of tasks executed by order of priority by the threads of the thread budget,
+    with a maximum number of tasks executed at once.
+    The pool reports the number of tasks waiting in its queue and the utilisation of its workers.
+    """
+
+    def __init__(self, workers: int = None, name: str = "gamarts") -> None:
+        """
+        Create a WorkerPool.
+
+        Params:
+        ----
+        - workers: int = None, the maximum number of tasks of this pool executed at once. If None, it is only limited by the thread budget.
+        - name: str = "gamarts", the name of the pool.
+        """
+        self.workers = workers
+        self.name = name
+        self._queue: list[tuple[int, int, Task]] = []
+        self._active = 0
+        self._lock = Lock()
+        self._unfinished = 0
+        self._finished = Condition(self._lock)
+        self._busy_time = 0.
+        self._busy_since: dict[int, float] = {}
+        self._statistics_start = perf_counter()
+        thread_budget._register(self)
+
+    @property
+    def queue_depth(self) -> int:
+        """Return the number of tasks waiting to be executed."""
+        with thread_budget._condition:
+            return sum(not task._claimed and not task.cancelled() for _, _, task in self._queue)
+
+    @property
+    def active_workers(self) -> int:
+        """Return the number of threads currently executing a task of the pool."""
+        return self._active
+
+    def _is_full(self) -> bool:
+        return self.workers is not None and self._active >= self.workers
+
+    def _busy(self, now: float) -> float:
+        with self._lock:
+            return self._busy_time + sum(now - start for start in self._busy_since.values())
+
+    @property
+    def utilisation(self) -> float:
+        """Return the proportion of time the workers spent executing tasks since the creation of the pool or the last reset of the statistics."""
+        now = perf_counter()
+        elapsed = (now - self._statistics_start)*min(self.workers or thread_budget.threads, thread_budget.threads)
+        return self._busy(now)/elapsed if elapsed > 0 else 0.
+
+    def reset_statistics(self):
+        """Reset the measure of the utilisation of the workers."""
+        now = perf_counter()
+        with self._lock:
+            self._busy_time = 0.
+            self._busy_since = {key: now for key in self._busy_since}
+            self._statistics_start = now
+
+    def submit(self, function: Callable, *args, priority: int = 0, **kwargs) -> Task:
+        """
+        Submit a task to the pool.
+
+        Params:
+        ----
+        - function: Callable, the function to execute.
+        - *args, **kwargs: the arguments of the function.
+        - priority: int = 0, tasks with higher priorities are executed first.
+
+        Returns:
+        ----
+        - task: Task, the future of the result of the function.
+        """
+        task = Task(function, args, kwargs)
+        with self._lock:
+            self._unfinished += 1
+        task.add_done_callback(self._task_done)
+        thread_budget._push(self, priority, task)
+        return task
+
+    def _task_done(self, _):
+        with self._lock:
+            self._unfinished -= 1
+            self._finished.notify_all()
+
+    def join(self, timeout: float = None) -> bool:
+        """Wait for all the tasks submitted to the pool to be done. Return True if they are all done."""
+        with self._lock:
+            return self._finished.wait_for(lambda: self._unfinished == 0, timeout)
@@ -1,4 +1,39 @@
 """The art module contains all the available arts for your game. You should look to arts based on geometries or on files."""
-from .art import Art
-from .file import ImageFile, ImageFolder, GIFFile
-from .geometry import Polygon, Rectangle, RoundedRectangle, Circle, Ellipse, TexturedCircle, TexturedEllipse, TexturedPolygon, TexturedRoundedRectangle
+from typing import TYPE_CHECKING
+from .._lazy import lazy_exports
+# The manifest module is imported eagerly: once imported, the submodule would otherwise hide the manifest singleton of the same name.
+from .manifest import Manifest, manifest
+
+# The submodules are imported at the first access to one of their arts.
+__getattr__, __dir__, __all__ = lazy_exports(__name__, {
+    '.art': ('Art',),
+    '.group': ('ArtGroup',),
+    '.file': ('ImageFile', 'ImageFolder', 'GIFFile', 'WebPFile', 'APNGFile', 'SpriteSheet', 'write_manifest'),
+    '.geometry': (
+        'Polygon', 'Rectangle', 'RoundedRectangle', 'Circle', 'Ellipse', 'TexturedCircle', 'TexturedEllipse', 'TexturedPolygon',
+        'TexturedRoundedRectangle'
+    ),
+    '.memory': ('MemoryManager', 'memory_manager'),
+    '.preload': ('Preloader', 'preloader', 'gather_load'),
+    '.executor': ('TransformationExecutor', 'transformation_executor'),
+    '.cache': ('ResultCache', 'result_cache'),
+    '.disk': ('DiskCache', 'disk_cache'),
+    '.bundle': ('Bundle', 'BundleArt', 'write_bundle'),
+    '.stream': ('StreamArt',),
+    '.rotation': ('RotationCache',),
+})
+__all__ += ['Manifest', 'manifest']
+
+if TYPE_CHECKING:
+    from .art import Art
+    from .group import ArtGroup
+    from .file import ImageFile, ImageFolder, GIFFile, WebPFile, APNGFile, SpriteSheet, write_manifest
+    from .geometry import Polygon, Rectangle, RoundedRectangle, Circle, Ellipse, TexturedCircle, TexturedEllipse, TexturedPolygon, TexturedRoundedRectangle
+    from .memory import MemoryManager, memory_manager
+    from .preload import Preloader, preloader, gather_load
+    from .executor import TransformationExecutor, transformation_executor
+    from .cache import ResultCache, result_cache
+    from .disk import DiskCache, disk_cache
+    from .bundle import Bundle, BundleArt, write_bundle
+    from .stream import StreamArt
+    from .rotation import RotationCache
@@ -1,38 +1,88 @@
 """The art class is the base for all the surfaces and animated surfaces of the game."""
 from abc import ABC, abstractmethod
-from threading import Thread
-from pygame import Surface, image, surfarray as sa, Rect
-from PIL import Image
-from ..transform import Transformation, Pipeline, ExtractSlice, ExtractOne
-from .._common import LoadingError
+from bisect import bisect_right
+from itertools import accumulate
+from concurrent.futures import Future
+import asyncio
+from functools import partial
+from threading import RLock
+from weakref import ref
+from time import perf_counter
+from pygame import Surface, Rect
+from ..transform import Transformation, Pipeline, ExtractSlice, ExtractOne, cost_model, optimizer, mipmaps
+from .._common import LoadingError, fingerprint_of
+from .memory import memory_manager, surfaces_bytesize, root_surface
+from .executor import transformation_executor
+from .cache import result_cache, ld_kwargs_fingerprint
+from .disk import disk_cache
+from .lazy import DeferredFrames, LazyFrames, TransformedFrames, decoded_frames
+from .save import save_frames
+from .preload import preloader
+from .._workers import wait_for
+
+def _apply_framewise(steps: tuple[Transformation], width: int, height: int, ld_kwargs: dict, surf: Surface) -> Surface:
+    """Apply framewise transformations on one frame."""
+    surfaces = (surf,)
+    for step in steps:
+        surfaces, _, _, _, width, height = step.apply(surfaces, (0,), 0, 0, width, height, **ld_kwargs)
+    return surfaces[0]
+
+def _copy_and_apply_framewise(steps: tuple[Transformation], width: int, height: int, ld_kwargs: dict, surf: Surface) -> Surface:
+    """Apply framewise transformations on a copy of one frame, as some of them modify the pixels of the frame."""
+    return _apply_framewise(steps, width, height, ld_kwargs, surf.copy())
+
+def _resize(art_ref: ref):
+    """Update the size of an art in the memory manager, when one of its frames transformed lazily has been kept."""
+    art = art_ref()
+    if art is not None and art.is_loaded():
+        memory_manager.resize(art)
+
+def _is_lazy(steps: tuple[Transformation], ld_kwargs: dict) -> bool:
+    """Return True if the steps are applied to each frame when it is accessed."""
+    return bool(ld_kwargs.get('lazy_transform')) and bool(steps) and all(step.framewise for step in steps)
 
 class Art(ABC):
     """The Art class is the base for all the surfaces and animated surfaces of the game. They cannot be instanciated."""
 
-    def __init__(self, transformation: Transformation = None) -> None:
+    _groupable = True # False for the arts whose animation cannot be computed by an ArtGroup.
+
+    def __init__(self, transformation: Transformation = None, permanent: bool = False) -> None:
         """
         Creates an Art.
 
         Params:
         ----
         - transformation: transform.Transformation = None. Any transformation (or Pipeline) that will be applied to the art when it is loaded.
+        - permanent: bool = False. If True, the art is never unloaded by the memory manager.
         """
         super().__init__()
         self._surfaces: tuple[Surface] = ()
+        self._shared_surfaces: set[int] = set() # The ids of the surfaces shared with other arts, copied before being modified.
         self._durations: tuple[int] = ()
         self._introduction = 0
         self._loaded = False
+        self._fingerprint = None # Identifies the current frames, used as a key of the result cache.
 
         self._time_since_last_change = 0
         self._index = 0
+        self._group = None # The ArtGroup updating the animation of this art, if any.
+        self._group_slot = 0
+        self._cumulated_durations = (0,)
+        self._cumulated_durations_source = None # The durations used to compute the cumulated durations.
 
         self._height = -1
         self._width = -1
         self._on_loading_transformation = transformation
+        self.permanent = permanent
 
         self._buffer_transfo_pipeline = Pipeline()
+        # The transformations applied since the loading, used to reload an evicted art. None if they have not been recorded.
+        self._applied_transfo_pipeline = Pipeline()
 
-        self._transfo_thread = None
+        self._transfo_future = None # The future of the transformation being applied by the executor.
+        self._loading_lock = RLock()
+        self._preloading = None # The future of the loading, if the art is being preloaded.
+        self._placeholder: Surface = None
         self._has_changed = False
         self._copies: list[_ArtAsCopy] = []
         self._references: list[_ArtAsReference] = []
@@ -59,6 +109,8 @@ class Art(ABC):
 
     def _verify_sizes(self):
         """verify that all surfaces have the same sizes."""
+        if isinstance(self.surfaces, DeferredFrames): # The frames are verified when they are decoded.
+            return
         heights = set(surf.get_height() for surf in self.surfaces)
         widths = set(surf.get_width() for surf in self.surfaces)
         if len(heights) != 1:
@@ -85,6 +137,26 @@ class Art(ABC):
         """Return true if the art is loaded"""
         return self._loaded
 
+    @property
+    def bytesize(self) -> int:
+        """Return the number of bytes used by the surfaces of the art, and by their mip maps."""
+        frames = decoded_frames(self._surfaces)
+        return surfaces_bytesize(tuple(frames) + tuple(level for surf in frames for level in mipmaps.levels(surf)))
+
+    def fingerprint(self):
+        """
+        Return a hashable value identifying the current frames of the art, or None if the art is not loaded or its frames cannot be identified.
+        Fingerprints are computed only when the result cache is enabled.
+        """
+        return self._fingerprint if self.is_loaded() else None
+
+    def _source_fingerprint(self):
+        """
+        Return a hashable value identifying what is loaded by the art, or None if it cannot be identified.
+        Arts of the same class with the same source fingerprint load the same frames, which are then shared through the result cache.
+        """
+        return None
+
     @property
     def total_duration(self):
         """Return the durations of the frames in the art."""
@@ -102,17 +174,49 @@ class Art(ABC):
     @property
     def index(self):
         """Return the current index of the frame displayed."""
+        if self._group is not None:
+            return int(self._group.indices[self._group_slot])
         return self._index
 
     def unload(self):
         """Unload the surfaces and reset."""
         self.reset() # Reset the index.
-        if self._transfo_thread is not None:
-            # Wait for the transformation thread to stop to not get surfaces still loaded in memory.
-            self._transfo_thread.join()
+        if self._transfo_future is not None:
+            # Wait for the transformation to be done to not get surfaces still loaded in memory.
+            wait_for(self._transfo_future)
+            self._transfo_future = None
+        if isinstance(self._surfaces, DeferredFrames):
+            self._surfaces.close()
         self._surfaces = ()
+        self._shared_surfaces = set()
         self._durations = ()
         self._loaded = False
+        self._fingerprint = None
+        self._applied_transfo_pipeline = Pipeline()
+        memory_manager.forget(self)
+
+    def _is_evictable(self) -> bool:
+        """Return True if the art can be unloaded by the memory manager, because the transformations applied since its loading are known."""
+        return not self.permanent and self._applied_transfo_pipeline is not None
+
+    def _record_transformation(self, transformation: Transformation):
+        """
+        Record a transformation applied to the surfaces, to apply it again if the art is evicted.
+        Nothing is recorded if the art cannot be evicted: the art cannot be evicted until its next loading then.
+        """
+        if self._applied_transfo_pipeline is None:
+            return
+        if memory_manager.budget is None or self.permanent:
+            self._applied_transfo_pipeline = None
+            return
+        for step in transformation.steps():
+            self._applied_transfo_pipeline.add_transformation(step)
+
+    def _evict(self):
+        """Unload the art to free memory. The transformations applied since the loading will be applied again at the next get."""
+        pending = Pipeline(*self._applied_transfo_pipeline.steps(), *self._buffer_transfo_pipeline.steps())
+        self.unload()
+        self._buffer_transfo_pipeline = pending
 
     def load(self, **ld_kwargs):
         """Load the art and all its copies. If the Art is already loaded, only the copies not loaded are loaded. 
@@ -124,17 +228,82 @@ class Art(ABC):
         need them.
         """
 
-        if not self._loaded:
-            self.reset()
-            self._load(**ld_kwargs)
-            self._verify_sizes()
-            self._loaded = True
-            if not self._on_loading_transformation is None:
-                self._transform(self._on_loading_transformation, **ld_kwargs)
+        with self._loading_lock: # The art might be loaded at the same time by the preloader.
+            if not self.is_loaded():
+                self.reset()
+                disk_key = self._disk_key(**ld_kwargs)
+                if disk_key is None or not self._load_from_disk(disk_key):
+                    self._load_frames(**ld_kwargs)
+                    self._verify_sizes()
+                    if self._surfaces and not isinstance(self._surfaces, DeferredFrames):
+                        # The size might be the size after the on-loading transformation, computed at the creation of the art, or before an eviction.
+                        self._width, self._height = self._surfaces[0].get_size()
+                    if not self._on_loading_transformation is None:
+                        self._transform(self._on_loading_transformation, **ld_kwargs)
+                    if disk_key is not None:
+                        self._save_to_disk(disk_key)
+                self._loaded = True
+                memory_manager.register(self)
+                memory_manager.enforce(keep=self)
 
         for copy in self._copies:
             copy.load(**ld_kwargs)
 
+    def _load_frames(self, **ld_kwargs):
+        """Load the frames of the art, or reuse the frames of an art of the same class loaded from the same source."""
+        source = self._source_fingerprint() if result_cache.enabled else None
+        kwargs = ld_kwargs_fingerprint(ld_kwargs) if source is not None else None
+        key = None if kwargs is None else ('load', type(self).__module__, type(self).__qualname__, source, kwargs)
+        result = result_cache.get(key) if key is not None else None
+        self._fingerprint = key
+        if result is not None:
+            self._surfaces, self._durations, self._introduction, self._width, self._height = result
+            self._share_surfaces(self._surfaces)
+        else:
+            self._load(**ld_kwargs)
+            if key is not None and result_cache.put(
+                key, (self._surfaces, self._durations, self._introduction, self._width, self._height), self._surfaces
+            ):
+                self._share_surfaces(self._surfaces)
+
+    def _disk_key(self, **ld_kwargs):
+        """Return the key of the frames of the art in the disk cache, or None if the art cannot be stored in it."""
+        if not disk_cache.enabled:
+            return None
+        source = self._source_fingerprint()
+        transformation = fingerprint_of(self._on_loading_transformation)
+        kwargs = ld_kwargs_fingerprint(ld_kwargs)
+        if source is None or transformation is None or kwargs is None:
+            return None
+        return (type(self).__module__, type(self).__qualname__, source, transformation, kwargs)
+
+    def _load_from_disk(self, disk_key) -> bool:
+        """Map the frames stored in the disk cache, or reuse the frames of an art already mapped. Return False if there are none."""
+        key = ('disk', disk_key)
+        result = result_cache.get(key) if result_cache.enabled else None
+        if result is None:
+            result = disk_cache.load(disk_key)
+            if result is None:
+                return False
+            if result_cache.enabled:
+                result_cache.put(key, result, result[0])
+        self._surfaces, self._durations, self._introduction, self._width, self._height = result
+        self._fingerprint = key if result_cache.enabled else None
+        self._share_surfaces(self._surfaces)
+        return True
+
+    def _save_to_disk(self, disk_key):
+        """Store the frames in the disk cache, and share them with the arts loaded the same way."""
+        if isinstance(self._surfaces, TransformedFrames): # All the frames are written anyway.
+            self._surfaces = tuple(self._surfaces)
+        result = (self._surfaces, self._durations, self._introduction, self._width, self._height)
+        disk_cache.save(disk_key, *result)
+        if result_cache.enabled:
+            key = ('disk', disk_key)
+            result_cache.put(key, result, self._surfaces)
+            self._fingerprint = key
+        self._share_surfaces(self._surfaces) # The frames must not be modified while they are written.
+
     def update(self, loop_duration: float) -> bool:
         """
         Update the instance animation.
@@ -147,27 +316,78 @@ class Art(ABC):
         ---
         - has_changed: bool, whether the index changed or a transformation have been applied since the last call.
         """
+        memory_manager.enforce_deferred()
         if len(self.surfaces) > 1:
-            self._time_since_last_change += loop_duration
-            if self._time_since_last_change >= self.durations[self._index]:
-                self._time_since_last_change -= self.durations[self._index]
-                self._index += 1
-                # Loop
-                if self._index == len(self.surfaces):
-                    self._index = self.introduction
-                # If the loop_duration is too long, we reset the time to 0.
-                if self._time_since_last_change >= self.durations[self._index]:
-                    self._time_since_last_change = 0
-
-                self._has_changed = True
+            index, time_since_last_change = self._animation_state()
+            cumulated_durations = self._get_cumulated_durations()
+            time = cumulated_durations[index] + time_since_last_change + loop_duration
+            if time >= cumulated_durations[-1] and cumulated_durations[-1] == cumulated_durations[self.introduction]:
+                # The frames of the loop last 0 ms and cannot be found from the time: one frame is displayed per update.
+                self._set_state(index + 1 if index + 1 < len(self.surfaces) else self.introduction, 0)
+            else:
+                self._set_time(time)
         has_changed = self._has_changed # This can be set to True if the a transformation has been a applied recently, or if the index changed.
         self._has_changed = False
         return has_changed 
 
+    def seek(self, time: float):
+        """
+        Set the animation to the frame displayed at a given time.
+
+        Params:
+        ----
+        - time: float, the time since the start of the animation, in ms. If the time is after the total duration of the animation,
+        the frames are looped, avoiding the frames before the introduction.
+        """
+        if len(self.surfaces) > 1:
+            self._set_time(time)
+
+    def _get_cumulated_durations(self) -> tuple[float]:
+        """Return the times at which each frame starts to be displayed, followed by the total duration."""
+        durations = self.durations
+        if durations is not self._cumulated_durations_source:
+            self._cumulated_durations = tuple(accumulate(durations, initial=0))
+            self._cumulated_durations_source = durations
+        return self._cumulated_durations
+
+    def _animation_state(self) -> tuple[int, float]:
+        """Return the index and the time since the last change, read from the group of the art if it has one."""
+        if self._group is not None:
+            return self._group._member_state(self)
+        return self._index, self._time_since_last_change
+
+    def _set_time(self, time: float):
+        """
+        Set the index and the time since the last change to match the time since the start of the animation.
+        The members of an ArtGroup set them in the group.
+        """
+        cumulated_durations = self._get_cumulated_durations()
+        total_duration = cumulated_durations[-1]
+        if time >= total_duration: # Loop over the frames after the introduction.
+            loop_start = cumulated_durations[self.introduction]
+            loop_duration = total_duration - loop_start
+            if loop_duration == 0: # The frames of the loop last 0 ms, the loop starts again.
+                self._set_state(min(self.introduction, len(cumulated_durations) - 2), 0)
+                return
+            time = loop_start + (time - loop_start) % loop_duration
+        index = min(bisect_right(cumulated_durations, time) - 1, len(cumulated_durations) - 2)
+        self._set_state(index, time - cumulated_durations[index])
+
+    def _set_state(self, index: int, time_since_last_change: float):
+        """Set the index and the time since the last change. The members of an ArtGroup set them in the group."""
+        if index != self._animation_state()[0]:
+            self._has_changed = True
+        self._index = index
+        self._time_since_last_change = time_since_last_change
+        if self._group is not None:
+            self._group._set_member_state(self, index, time_since_last_change)
+
     def reset(self):
         """Reset the animation."""
         self._index = 0
         self._time_since_last_change = 0
+        if self._group is not None:
+            self._group._reset_member(self)
 
     def get(self, match: 'Art' = None, **ld_kwargs) -> Surface:
         """
@@ -180,23 +400,39 @@ class Art(ABC):
         if they are not provided, default values are used: False for antialias and 200_000 for the cost. Other entries can be given if some custom arts
         need them.
         """
-        if not self._loaded: # Load the art
+        memory_manager.enforce_deferred(keep=self)
+        if not self.is_loaded(): # Load the art
+            if self._placeholder is not None and self._preloading is not None and not self._preloading.done():
+                return self._placeholder # The art is being loaded in the background.
             self.load(**ld_kwargs)
+        if isinstance(self._surfaces, DeferredFrames) and self._surfaces.is_complete():
+            self._surfaces = tuple(self._surfaces) # The decoding is over, the frames are registered with their full size.
+            memory_manager.register(self)
+        memory_manager.touch(self)
+
+        if self._transfo_future is not None and self._transfo_future.done():
+            future, self._transfo_future = self._transfo_future, None
+            if future.exception() is not None: # The transformation failed in the executor.
+                raise future.exception()
 
         if (
             not self._buffer_transfo_pipeline.is_empty()
-            and (self._transfo_thread is None or not self._transfo_thread.is_alive())
-        ): # Apply a transformation only if the last thread is finished
-            if self._buffer_transfo_pipeline.cost(self.width, self.height, len(self), **ld_kwargs) < ld_kwargs.get("cost_threshold", 200_000):
-                args = self._buffer_transfo_pipeline.copy(), # On a separate thread, in this case the transformation may be visible later.
+            and self._transfo_future is None
+        ): # Apply a transformation only if the last one is finished
+            # Lazy transformations only transform the current frame now.
+            length = 1 if _is_lazy(self._buffer_transfo_pipeline.steps(), ld_kwargs) else len(self)
+            if transformation_executor.routes_to_background(self._buffer_transfo_pipeline, self.width, self.height, length, **ld_kwargs):
+                pipeline = self._buffer_transfo_pipeline.copy() # On the executor, in this case the transformation may be visible later.
+                self._record_transformation(pipeline)
                 self._buffer_transfo_pipeline.clear()
-                self._transfo_thread = Thread(target=self._transform, args=args, kwargs=ld_kwargs)
-                self._transfo_thread.start()
+                self._transfo_future = transformation_executor.submit(partial(self._transform, pipeline, **ld_kwargs))
             else:
+                self._record_transformation(self._buffer_transfo_pipeline)
                 self._transform(self._buffer_transfo_pipeline, **ld_kwargs) # Or directly on the main thread.
                 self._buffer_transfo_pipeline.clear()
+                memory_manager.enforce(keep=self)
 
-        index = self._index if match is None else match.index
+        index = self.index if match is None else match.index
         return self.surfaces[index] # The current surface
     
     def transform(self, transformation: Transformation):
@@ -208,6 +444,44 @@ class Art(ABC):
         """
         self._buffer_transfo_pipeline.add_transformation(transformation)
 
+    async def aload(self, **ld_kwargs):
+        """
+        Load the art without blocking the event loop. The art is loaded in the background by the preloader,
+        whose number of workers limits the number of arts loaded at once. See load.
+        """
+        if not self.is_loaded():
+            await asyncio.wrap_future(preloader.preload(self, **ld_kwargs)[0])
+        for copy in self._copies:
+            await copy.aload(**ld_kwargs)
+
+    async def atransform(self, transformation: Transformation, **ld_kwargs):
+        """
+        Apply a transformation now, with the transformations waiting to be applied, without blocking the event loop.
+        The art is loaded if needed, and the transformation is applied by the transformation executor, whatever its cost.
+
+        Params:
+        ----
+        - transformation: Transformation, the transformation to apply.
+        - **ld_kwargs: the loading kwargs.
+        """
+        await self.aload(**ld_kwargs)
+        self.transform(transformation)
+        if self._transfo_future is not None: # The previous transformation must be applied first.
+            future = self._transfo_future
+            await asyncio.wrap_future(future)
+            if self._transfo_future is future:
+                self._transfo_future = None
+        pipeline = self._buffer_transfo_pipeline.copy()
+        self._record_transformation(pipeline)
+        self._buffer_transfo_pipeline.clear()
+        future = self._transfo_future = transformation_executor.submit(partial(self._transform, pipeline, **ld_kwargs))
+        try:
+            await asyncio.wrap_future(future)
+        finally:
+            if self._transfo_future is future:
+                self._transfo_future = None
+        memory_manager.enforce(keep=self)
+
     def _transform(self, transformation: Transformation, **ld_kwargs):
         """
         Apply a transformation.
@@ -219,32 +493,102 @@ class Art(ABC):
         if they are not provided, default values are used: False for antialias and 200_000 for the cost. Other entries can be given if some custom arts
         need them.
         """
-        (   self._surfaces,
-            self._durations,
-            self._introduction,
-            index,
-            self._width,
-            self._height
-        ) = transformation.apply(
-            self._surfaces,
-            self._durations,
-            self._introduction,
-            self._index,
-            self._width,
-            self._height,
-            **ld_kwargs
-        )
-        if index is not None:
-            self._index = index
-        self._buffer_transfo_pipeline.clear()
+        steps = optimizer.optimize(transformation.steps(), self._width, self._height)
+        key = None
+        if self._fingerprint is not None:
+            fingerprints = tuple(step.fingerprint() for step in steps)
+            kwargs = ld_kwargs_fingerprint(ld_kwargs)
+            if None not in fingerprints and kwargs is not None:
+                key = (self._fingerprint, fingerprints, kwargs)
+        result = result_cache.get(key) if key is not None else None
+
+        if result is not None: # The same transformation has already been applied on the same frames.
+            surfaces, durations, introduction, new_index, width, height = result
+            self._share_surfaces(surfaces)
+        else:
+            surfaces, durations, introduction, index, width, height = (
+                self._surfaces, self._durations, self._introduction, self._index, self._width, self._height
+            )
+            new_index = None
+            if isinstance(surfaces, LazyFrames) and steps and all(step.framewise for step in steps):
+                # The frames of streaming arts are transformed when they are decoded.
+                surfaces = surfaces.map(partial(_apply_framewise, steps, width, height, ld_kwargs))
+                width, height = surfaces[index].get_size()
+            elif _is_lazy(steps, ld_kwargs) and len(surfaces) > 1:
+                # The frames are transformed when they are accessed, the source frames might be shared.
+                apply = _copy_and_apply_framewise if any(step.in_place for step in steps) else _apply_framewise
+                if not isinstance(surfaces, TransformedFrames):
+                    surfaces = TransformedFrames(
+                        len(surfaces), surfaces.__getitem__, surfaces, introduction, ld_kwargs.get('lazy_prefetch', 4), partial(_resize, ref(self))
+                    )
+                surfaces = surfaces.map(partial(apply, steps, width, height, ld_kwargs))
+                width, height = surfaces[index].get_size()
+                key = None # Frames transformed later are not shared through the result cache.
+            else:
+                # The steps are applied one by one to be timed separately when the cost model is calibrating.
+                for step in steps:
+                    if step.in_place:
+                        surfaces = self._own_surfaces(surfaces)
+                    if cost_model.calibrating:
+                        start = perf_counter()
+                        length = len(surfaces)
+                    surfaces, durations, introduction, idx, new_width, new_height = step.apply(
+                        surfaces, durations, introduction, index, width, height, **ld_kwargs
+                    )
+                    if cost_model.calibrating:
+                        cost_model.record(step, width, height, length, (perf_counter() - start)*1000)
+                    if step.in_place: # The mip maps of the modified frames are outdated.
+                        mipmaps.discard(surfaces)
+                    width, height = new_width, new_height
+                    if idx is not None:
+                        index = new_index = idx
+            if key is not None and result_cache.put(key, (surfaces, durations, introduction, new_index, width, height), surfaces):
+                self._share_surfaces(surfaces)
+
+        # The fingerprint is the same whether the steps are applied in one pipeline or one by one.
+        fingerprint = self._fingerprint
+        if key is not None:
+            for step_fingerprint in key[1]:
+                fingerprint = (fingerprint, step_fingerprint)
+        else:
+            fingerprint = None
+
+        # The new state is set at once as the transformation might be applied in the background.
+        self._surfaces, self._durations, self._introduction, self._width, self._height = surfaces, durations, introduction, width, height
+        self._fingerprint = fingerprint
+        if new_index is not None:
+            self._index = new_index
         self._has_changed = True
         for reference in self._references:
             reference._has_changed = True
+        if self._loaded:
+            memory_manager.register(self)
+
+    def _share_surfaces(self, surfaces: tuple[Surface]):
+        """Mark surfaces as shared with another art, they will be copied before being modified."""
+        self._shared_surfaces.update(id(root_surface(surf)) for surf in decoded_frames(surfaces))
+
+    def _own_surfaces(self, surfaces: tuple[Surface]) -> tuple[Surface]:
+        """
+        Return the surfaces where the surfaces shared with other arts, and the subsurfaces, are replaced by copies,
+        to modify them without modifying the other arts or the surfaces the subsurfaces are views of.
+        """
+        copies: dict[int, Surface] = {}
+        owned = []
+        for surf in surfaces:
+            if surf.get_parent() is not None or id(root_surface(surf)) in self._shared_surfaces:
+                if id(surf) not in copies: # A surface present several times is copied once.
+                    copies[id(surf)] = surf.copy()
+                surf = copies[id(surf)]
+            owned.append(surf)
+        self._shared_surfaces.difference_update(id(root_surface(surf)) for surf in surfaces)
+        return tuple(owned)
 
     def copy(self, additional_transformation: Transformation = None) -> '_ArtAsCopy':
         """
         Return an independant copy of the art. The copy's initial surfaces will be the same as its original. If a copy is created after the loading
         of the original, its initial surfaces is the original's current surfaces and not the original's initial surfaces.
+        The surfaces are shared by the copy and its original until a transformation modifies their pixels, then the modified frames are copied.
 
         Params:
         ---
@@ -268,27 +612,50 @@ class Art(ABC):
         rect = Rect(0, 0, self.width, self.height)
         return rect
 
-    def save(self, path: str, index: int | slice = None):
+    def build_mipmaps(self, **ld_kwargs) -> Future:
+        """
+        Build the mip map pyramids of the frames of the art in the background, loading the art now if needed.
+        The smooth zooms and resizes of the art then scale the smallest level larger than their target size, which makes zoom outs faster.
+        The pyramids of the frames created by the next transformations are not built.
+
+        Returns:
+        ----
+        - future: concurrent.futures.Future, done when all the pyramids have been built.
+        """
+        if not self.is_loaded():
+            self.load(**ld_kwargs)
+        future = mipmaps.build(decoded_frames(self.surfaces))
+        # The size of the art includes its mip maps.
+        future.add_done_callback(lambda _: memory_manager.register(self) if self.is_loaded() else None)
+        return future
+
+    def save(self, path: str, index: int | slice = None, **options) -> Future:
         """
-        Save the art as a gif or as an image.
+        Save the art as an image, an animation or a sequence of images. The pixels are copied on the calling thread,
+        and the frames are encoded in the background.
         
         Params:
         ----
-        - path: str, the path where the art should be saved.
+        - path: str, the path where the art should be saved. Its extension gives the format: arts with several frames are saved
+        as animated .gif, .webp or .png (other extensions give gifs), and paths with a format field, like "frames/walk_{:03d}.png",
+        save every frame as an image, encoded in parallel.
         - index: int | slice = None, the index or indices of the frames in the animation that will be saved.
-        
+        - **options: the options given to Pillow to encode the images, like quality or lossless for webps.
+
+        Returns:
+        ----
+        - future: concurrent.futures.Future, the future of the encoding. ``art.save(path).result()`` waits for the file to be written.
         """
         if not self.is_loaded():
             raise LoadingError("Cannot save an unloaded art.")
         if len(self.surfaces) == 1:
-            image.save(self.surfaces[0], path)
+            surfaces, durations = self.surfaces[:1], self.durations[:1]
         elif index is not None and isinstance(index, int):
-            image.save(self.surfaces[index%len(self.surfaces)], path)
+            surfaces, durations = (self.surfaces[index%len(self.surfaces)],), (self.durations[index%len(self.surfaces)],)
         else:
             surfaces = self.surfaces[index] if isinstance(index, slice) else self.surfaces
             durations = self.durations[index] if isinstance(index, slice) else self.durations
-            pil_images = [Image.fromarray(sa.array3d(surf)) for surf in surfaces]
-            pil_images[0].save(path, format='GIF', save_all=True, append_images = pil_images[1:], duration=durations)
+        return save_frames(path, surfaces, durations, **options)
 
     def __len__(self):
         return len(self._surfaces)
@@ -316,10 +683,20 @@ class _ArtAsCopy(Art):
         if not self._original.is_loaded():
             self._original.load(**ld_kwargs)
 
-        self._surfaces = tuple(surf.copy() for surf in self._original.surfaces)
+        # The surfaces are shared with the original, and copied only when a transformation modifies them.
+        self._surfaces = tuple(self._original.surfaces)
+        self._fingerprint = self._original.fingerprint()
+        self._share_surfaces(self._surfaces)
+        self._original._share_surfaces(self._surfaces)
         self._durations = self._original.durations
         self._introduction = self._original.introduction
 
+    @property
+    def bytesize(self):
+        # The surfaces shared with the original are counted by the original.
+        original_surfaces = {id(root_surface(surf)) for surf in decoded_frames(self._original.surfaces)}
+        return surfaces_bytesize(surf for surf in decoded_frames(self._surfaces) if id(root_surface(surf)) not in original_surfaces)
+
 class _ArtAsReference(Art):
     """ArtAsReference represent an Art created with the .reference() method of another art."""
 
@@ -330,6 +707,23 @@ class _ArtAsReference(Art):
         self._height = self._original.height
         self._width = self._original.width
 
+    def is_loaded(self):
+        # The original might have been unloaded by the memory manager.
+        return self._loaded and self._original.is_loaded()
+
+    @property
+    def bytesize(self):
+        # The surfaces are owned by the original.
+        return 0
+
+    def fingerprint(self):
+        return self._original.fingerprint()
+
+    def get(self, match: Art = None, **ld_kwargs):
+        # The original is loaded and its pending transformations are applied, if it has been evicted.
+        self._original.get(**ld_kwargs)
+        return super().get(match, **ld_kwargs)
+
     def _load(self, **ld_kwargs):
         if not self._original.is_loaded():
             self._original.load(**ld_kwargs)
@@ -337,6 +731,13 @@ class _ArtAsReference(Art):
     def _transform(self, transformation: Transformation, **ld_kwargs):
         self._original._transform(transformation, **ld_kwargs)
 
+    def _record_transformation(self, transformation: Transformation):
+        # The transformations modify the surfaces of the original, they must be applied again if the original is evicted.
+        self._original._record_transformation(transformation)
+
+    def _share_surfaces(self, surfaces: tuple[Surface]):
+        self._original._share_surfaces(surfaces)
+
     @property
     def surfaces(self):
         return self._original.surfaces
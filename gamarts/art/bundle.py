@@ -0,0 +1,173 @@
+"""The bundle module contains the bundles, files storing the frames of many arts, ready to be mapped in memory, and the BundleArt."""
+from threading import Lock
+from typing import Mapping
+import json
+import os
+import struct
+from .art import Art
+from .file import _file_fingerprint
+from .._common import LoadingError
+from .._raw import write_frames, read_frames, map_file
+from ..transform import Transformation
+
+_MAGIC = b'GAMARTS\0'
+_VERSION = 1
+_HEADER = struct.Struct('<8sIIQQ') # magic, version, reserved, index offset, index length
+
+def write_bundle(path: str, arts: Mapping[str, Art], **ld_kwargs):
+    """
+    Write a bundle containing the frames of arts, as they are after their loading and their on-loading transformation.
+    The arts are loaded if needed. The frames are stored as raw pixels in the format of the display, and an index stores
+    the size, the durations and the introduction of every art.
+
+    Params:
+    ----
+    - path: str, the path to the bundle file.
+    - arts: Mapping[str, Art], the arts, by name.
+    - **ld_kwargs: the loading kwargs used to load the arts.
+    """
+    index = {}
+    with open(path + '.tmp', 'wb') as file:
+        file.write(b'\0'*_HEADER.size)
+        position = _HEADER.size
+        for name, art in arts.items():
+            art.load(**ld_kwargs)
+            surfaces = tuple(art.surfaces)
+            frames = write_frames(file, surfaces, position)
+            position = file.tell()
+            index[name] = {
+                'frames': frames,
+                'durations': list(art.durations),
+                'introduction': art.introduction,
+                'width': art.width,
+                'height': art.height,
+            }
+        description = json.dumps({'version': _VERSION, 'arts': index}).encode('utf-8')
+        file.write(description)
+        file.seek(0)
+        file.write(_HEADER.pack(_MAGIC, _VERSION, 0, position, len(description)))
+    # The file is written under a temporary name and then renamed, to never read a partially written bundle.
+    os.replace(path + '.tmp', path)
+
+class Bundle:
+    """
+    A Bundle is a file storing the frames of many arts, written by write_bundle.
+    Only the index is read when the bundle is opened. The file is mapped in memory at the first loading of one of its arts,
+    and the frames are surfaces sharing the mapped memory: loading an art reads the pages of its frames, without decoding them.
+
+    Example:
+    ----
+    - ``write_bundle("assets/level1.gamarts", {"hero": GIFFile("hero.gif"), "coin": ImageFolder("coin/", 50)})`` writes the bundle,
+    during the build of the game.
+    - ``hero = Bundle.open("assets/level1.gamarts").art("hero")`` or ``hero = BundleArt("assets/level1.gamarts", "hero")`` creates an art
+    displaying the frames of the bundled hero.
+    """
+
+    _opened: dict[str, 'Bundle'] = {}
+    _opened_lock = Lock()
+
+    def __init__(self, path: str) -> None:
+        """
+        Open a bundle and read its index.
+
+        Params:
+        ----
+        - path: str, the path to the bundle file.
+
+        Raises:
+        ----
+        - LoadingError if the file is not a bundle or was written by another version of gamarts.
+        """
+        self.path = path
+        with open(path, 'rb') as file:
+            header = file.read(_HEADER.size)
+            if len(header) != _HEADER.size:
+                raise LoadingError(f"The file {path} is not a bundle.")
+            magic, version, _, index_offset, index_length = _HEADER.unpack(header)
+            if magic != _MAGIC:
+                raise LoadingError(f"The file {path} is not a bundle.")
+            if version != _VERSION:
+                raise LoadingError(f"The bundle {path} has the version {version}, while the version {_VERSION} is expected.")
+            file.seek(index_offset)
+            self._index: dict[str, dict] = json.loads(file.read(index_length).decode('utf-8'))['arts']
+        self._fingerprint = _file_fingerprint(path)
+        self._buffer = None
+        self._lock = Lock()
+
+    @classmethod
+    def open(cls, path: str) -> 'Bundle':
+        """Return the bundle stored at this path, opened only once."""
+        key = os.path.abspath(path)
+        with cls._opened_lock:
+            if key not in cls._opened:
+                cls._opened[key] = cls(path)
+            return cls._opened[key]
+
+    @property
+    def names(self) -> tuple[str]:
+        """Return the names of the arts of the bundle."""
+        return tuple(self._index)
+
+    def __contains__(self, name: str):
+        return name in self._index
+
+    def entry(self, name: str) -> dict:
+        """Return the description of an art of the bundle."""
+        if name not in self._index:
+            raise KeyError(f"The bundle {self.path} has no art named {name!r}.")
+        return self._index[name]
+
+    def frames(self, name: str):
+        """Return the frames of an art of the bundle, as surfaces sharing the mapped memory."""
+        with self._lock:
+            if self._buffer is None:
+                self._buffer = map_file(self.path)
+        return read_frames(self._buffer, self.entry(name)['frames'])
+
+    def art(self, name: str, transformation: Transformation = None, permanent: bool = False) -> 'BundleArt':
+        """Return a new art displaying the frames of an art of the bundle."""
+        return BundleArt(self, name, transformation, permanent)
+
+class BundleArt(Art):
+    """
+    A BundleArt is an Art whose frames are stored in a bundle. Its frames are mapped from the bundle file instead of being decoded.
+    See Bundle and write_bundle.
+    """
+
+    def __init__(self, bundle: Bundle | str, name: str, transformation: Transformation = None, permanent: bool = False) -> None:
+        """
+        A BundleArt is an Art whose frames are stored in a bundle.
+
+        Params:
+        ----
+        - bundle: Bundle | str, the bundle or the path to the bundle file.
+        - name: str, the name of the art in the bundle.
+        - transformation: transform.Transformation = None. Any transformation (or Pipeline) that will be applied to the art when it is loaded.
+        - permanent: bool = False. If True, the art is never unloaded by the memory manager.
+
+        Raises:
+        ----
+        - KeyError if the bundle has no art with this name.
+        """
+        super().__init__(transformation, permanent)
+        self.bundle = Bundle.open(bundle) if isinstance(bundle, str) else bundle
+        self.name = name
+        entry = self.bundle.entry(name)
+        self._width, self._height = entry['width'], entry['height']
+        self._find_initial_dimension()
+
+    def _load(self, **ld_kwargs):
+        entry = self.bundle.entry(self.name)
+        self._surfaces = self.bundle.frames(self.name)
+        self._durations = tuple(entry['durations'])
+        self._introduction = entry['introduction']
+        # The mapped memory is shared by all the arts loaded from the bundle, the frames are copied before being modified.
+        self._share_surfaces(self._surfaces)
+
+    def _source_fingerprint(self):
+        return (self.bundle._fingerprint, self.name)
+
+    def _disk_key(self, **ld_kwargs):
+        if not self._on_loading_transformation: # The frames are already stored in the bundle.
+            return None
+        return super()._disk_key(**ld_kwargs)
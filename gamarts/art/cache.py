@@ -0,0 +1,100 @@
+"""The cache module contains the ResultCache, used to share the results of identical loadings and transformations between arts."""
+from collections import OrderedDict
+from threading import Lock
+from typing import Hashable
+from pygame import Surface
+from .._common import fingerprint_of
+from .memory import surfaces_bytesize
+
+_ROUTING_KWARGS = ('cost_threshold', 'time_threshold') # Loading kwargs that do not change the result of a loading or a transformation.
+
+def ld_kwargs_fingerprint(ld_kwargs: dict) -> Hashable | None:
+    """Return a hashable value identifying the loading kwargs that can change the result of a loading or a transformation."""
+    return fingerprint_of({key: value for key, value in ld_kwargs.items() if key not in _ROUTING_KWARGS})
+
+class ResultCache:
+    """
+    The ResultCache stores the frames obtained by loading and transforming arts, keyed by the fingerprints of the sources and the transformations.
+    When an art is loaded or transformed exactly like another one, the frames of the other art are reused instead of being computed again.
+    Reused frames are shared between the arts until a transformation modifies their pixels.
+    The least recently used results are removed when the size of the stored frames exceeds the budget.
+
+    Example:
+    ----
+    - ``result_cache.budget = 128*2**20`` enables the cache, with 128 MiB of frames.
+    - ``result_cache.budget = 0`` disables the cache, which is the default.
+    """
+
+    def __init__(self, budget: int = 0) -> None:
+        """
+        Create a ResultCache.
+
+        Params:
+        ----
+        - budget: int = 0, the number of bytes the frames stored by the cache can use. If 0, the cache is disabled.
+        """
+        self.budget = budget
+        self._entries: OrderedDict[Hashable, tuple[tuple, int]] = OrderedDict()
+        self._usage = 0
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def enabled(self) -> bool:
+        """Return True if the cache stores results."""
+        return self.budget > 0
+
+    @property
+    def usage(self) -> int:
+        """Return the number of bytes used by the frames stored in the cache."""
+        return self._usage
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> tuple | None:
+        """Return the result stored for this key, or None if there is none."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key: Hashable, result: tuple, surfaces: tuple[Surface]) -> bool:
+        """
+        Store a result.
+
+        Params:
+        ----
+        - key: Hashable, the key of the result.
+        - result: tuple, the result.
+        - surfaces: tuple[Surface], the frames of the result, used to compute its size.
+
+        Returns:
+        ----
+        - stored: bool, False if the result is larger than the budget and has not been stored.
+        """
+        size = surfaces_bytesize(surfaces)
+        with self._lock:
+            if size > self.budget:
+                return False
+            if key in self._entries:
+                self._usage -= self._entries.pop(key)[1]
+            while self._entries and self._usage + size > self.budget:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self._usage -= evicted_size
+            self._entries[key] = (result, size)
+            self._usage += size
+            return True
+
+    def clear(self):
+        """Remove all the results."""
+        with self._lock:
+            self._entries.clear()
+            self._usage = 0
+
+result_cache = ResultCache()
@@ -0,0 +1,118 @@
+"""The disk module contains the DiskCache, used to store the loaded arts on the disk and map them back in the next runs."""
+from concurrent.futures import Future
+from hashlib import sha1
+from typing import Hashable
+import json
+import os
+from pygame import Surface
+from .._raw import write_frames, read_frames, map_file
+from .._workers import WorkerPool
+
+_VERSION = 1
+
+class DiskCache:
+    """
+    The DiskCache stores the frames of the arts, as they are after their loading and their on-loading transformation, in a directory.
+    In the next runs, the frames are mapped back in memory instead of being decoded and transformed again.
+    The frames are keyed by the fingerprint of the source of the art (the path, the version of the file and the constructor arguments),
+    of the on-loading transformation and of the loading kwargs. Only the arts loaded from files are stored.
+
+    Example:
+    ----
+    - ``disk_cache.directory = "cache/arts"`` enables the cache. The directory is created if needed.
+    - ``disk_cache.directory = None`` disables the cache, which is the default.
+    """
+
+    def __init__(self, directory: str = None) -> None:
+        """
+        Create a DiskCache.
+
+        Params:
+        ----
+        - directory: str = None, the directory where the frames are stored. If None, the cache is disabled.
+        """
+        self.directory = directory
+        self._writer = WorkerPool(1, "gamarts-disk-cache") # The files are written in the background.
+
+    @property
+    def enabled(self) -> bool:
+        """Return True if the cache stores the frames of the arts."""
+        return self.directory is not None
+
+    def _paths(self, key: Hashable) -> tuple[str, str]:
+        name = sha1(repr(key).encode('utf-8')).hexdigest()
+        return os.path.join(self.directory, name + '.frames'), os.path.join(self.directory, name + '.json')
+
+    def load(self, key: Hashable) -> tuple[tuple[Surface], tuple[int], int, int, int] | None:
+        """
+        Return the surfaces, durations, introduction, width and height stored for this key, or None if there are none.
+        The surfaces share the memory of the mapped file.
+        """
+        frames_path, description_path = self._paths(key)
+        try:
+            with open(description_path, 'r', encoding='utf-8') as file:
+                description = json.load(file)
+            if description['version'] != _VERSION or description['key'] != repr(key):
+                return None
+            surfaces = read_frames(map_file(frames_path), description['frames'])
+        except (OSError, ValueError, KeyError):
+            return None
+        return surfaces, tuple(description['durations']), description['introduction'], description['width'], description['height']
+
+    def save(self, key: Hashable, surfaces: tuple[Surface], durations: tuple[int], introduction: int, width: int, height: int) -> Future:
+        """
+        Store the frames of an art. The frames are written in the background and must not be modified until then,
+        the arts mark them as shared to copy them before modifying them.
+
+        Returns:
+        ----
+        - future: concurrent.futures.Future, the future of the writing.
+        """
+        frames_path, description_path = self._paths(key)
+        return self._writer.submit(
+            self._write, frames_path, description_path, repr(key), tuple(surfaces), tuple(durations), introduction, width, height
+        )
+
+    def _write(
+        self,
+        frames_path: str,
+        description_path: str,
+        key: str,
+        surfaces: tuple[Surface],
+        durations: tuple[int],
+        introduction: int,
+        width: int,
+        height: int
+    ):
+        os.makedirs(os.path.dirname(frames_path) or '.', exist_ok=True)
+        # The files are written under temporary names and then renamed, to never read a partially written file.
+        with open(frames_path + '.tmp', 'wb') as file:
+            frames = write_frames(file, surfaces)
+        os.replace(frames_path + '.tmp', frames_path)
+        description = {
+            'version': _VERSION,
+            'key': key,
+            'frames': frames,
+            'durations': list(durations),
+            'introduction': introduction,
+            'width': width,
+            'height': height
+        }
+        with open(description_path + '.tmp', 'w', encoding='utf-8') as file:
+            json.dump(description, file)
+        os.replace(description_path + '.tmp', description_path)
+
+    def wait(self):
+        """Wait for all the frames to be written."""
+        self._writer.join()
+
+    def clear(self):
+        """Remove all the stored frames from the directory."""
+        self.wait()
+        if self.directory is None or not os.path.isdir(self.directory):
+            return
+        for name in os.listdir(self.directory):
+            if name.endswith(('.frames', '.json')):
+                os.remove(os.path.join(self.directory, name))
+
+disk_cache = DiskCache()
@@ -0,0 +1,45 @@
+"""The executor module contains the TransformationExecutor, used to apply costly transformations in the background."""
+import os
+from ..transform import Transformation
+from .._workers import WorkerPool
+
+class TransformationExecutor(WorkerPool):
+    """
+    The TransformationExecutor is the bounded pool on which the costly transformations of the arts are applied, by the threads of the thread budget.
+    The transformations whose cost is above the 'cost_threshold' entry of the loading kwargs are applied by the executor,
+    the others are applied directly on the calling thread.
+    The queue_depth, active_workers and utilisation properties can be used to monitor the executor,
+    and the same properties of the thread budget to monitor all the work done in the background.
+    """
+
+    def __init__(self, workers: int = None) -> None:
+        """
+        Create a TransformationExecutor.
+
+        Params:
+        ----
+        - workers: int = None, the maximum number of transformations applied at once. If None, one per core, except one for the main thread.
+        """
+        if workers is None:
+            workers = max(1, (os.cpu_count() or 1) - 1)
+        super().__init__(workers, "gamarts-transformation")
+
+    def routes_to_background(self, transformation: Transformation, width: int, height: int, length: int, **ld_kwargs) -> bool:
+        """
+        Return True if the transformation is costly enough to be applied by the executor rather than on the calling thread.
+
+        Params:
+        ----
+        - transformation: Transformation, the transformation to be applied.
+        - width, height, length: int, the dimensions and the number of frames of the art.
+        - **ld_kwargs: the loading kwargs. If the 'time_threshold' entry is provided, in milliseconds, and the duration of the transformation
+        can be predicted by the calibrated cost model, the predicted duration is compared to it.
+        Otherwise, the cost is compared to the 'cost_threshold' entry. If it is not provided, 200_000 is used.
+        """
+        if "time_threshold" in ld_kwargs:
+            duration = transformation.estimate_duration(width, height, length, **ld_kwargs)
+            if duration is not None:
+                return duration >= ld_kwargs["time_threshold"]
+        return transformation.cost(width, height, length, **ld_kwargs) >= ld_kwargs.get("cost_threshold", 200_000)
+
+transformation_executor = TransformationExecutor()
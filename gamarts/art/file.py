@@ -1,12 +1,49 @@
 """The file module contains classes to open images, gifs and folders as arts."""
 from typing import Iterable
+from threading import Lock
 import os
+import re
 from PIL import Image
-from pygame.image import load, fromstring
+from pygame import Surface
+from pygame.image import load, frombuffer
 from .art import Art
-from .._common import LoadingError
+from .lazy import LazyFrames, ProgressiveFrames
+from .manifest import manifest, write_manifest_entries
+from .._common import LoadingError, fingerprint_of
+from .._workers import WorkerPool
 from ..transform import Transformation
 
+_folder_loader = WorkerPool(None, "gamarts-folder") # pygame releases the GIL while decoding the images.
+
+def _list_images(folder: str) -> list[str]:
+    """Return the paths of the files of a folder, in natural order."""
+    return [
+        os.path.join(folder, f)
+        for f in sorted(os.listdir(folder), key=_natural_key)
+        if os.path.isfile(os.path.join(folder, f))
+    ]
+
+def _file_fingerprint(path: str):
+    """Return a hashable value identifying a file and its version."""
+    stat = os.stat(path)
+    return (os.path.abspath(path), stat.st_mtime_ns, stat.st_size)
+
+def _image_size(path: str) -> tuple[int, int]:
+    """Return the size of an image, from the manifest if it has an entry for it, else by reading the header of the file."""
+    entry = manifest.entry(path)
+    if entry is not None:
+        return tuple(entry['size'])
+    return _read_size(path)
+
+def _read_size(path: str) -> tuple[int, int]:
+    """Return the size of an image by reading the header of the file."""
+    with Image.open(path) as im:
+        return im.size
+
+def _natural_key(name: str):
+    """Return a key sorting names in natural order, the numbers being compared by value: 'frame2' is before 'frame10'."""
+    return tuple(int(part) if part.isdigit() else part.lower() for part in re.split(r'(\d+)', name)), name
+
 class ImageFile(Art):
     """
     The ImageFile class is an Art loaded from an image.
@@ -18,7 +55,7 @@ class ImageFile(Art):
     - ``ImageFile("characters/char1.jpeg", False)`` will load an the image stored at "characyers/char1.jpeg" and convert it in the RGB format
     """
 
-    def __init__(self, file: str, transparency: bool = True, transformation: Transformation = None) -> None:
+    def __init__(self, file: str, transparency: bool = True, transformation: Transformation = None, permanent: bool = False) -> None:
         """
         The ImageFile class is an Art loaded from an image.
         Accepted format are: jpg, jpeg, png, gif (only first frame), svg, webp, lmb, pcx, pnm, tga (uncompressed), xpm
@@ -29,25 +66,131 @@ class ImageFile(Art):
         - transparency: bool = True, whether the surface has some transparency. ImageFile with transparency are in the RGBA format, while ImageFiles
         without are in the RGB format (without alpha channel).
         - transformation: transform.Transformation = None. Any transformation (or Pipeline) that will be applied to the art when it is loaded.
+        - permanent: bool = False. If True, the art is never unloaded by the memory manager.
         """
-        super().__init__(transformation)
+        super().__init__(transformation, permanent)
         self.full_path = file
-        im = Image.open(self.full_path)
-        self._width, self._height = im.size
+        self._width, self._height = _image_size(self.full_path)
         self._transparency = transparency
-        im.close()
         self._find_initial_dimension()
 
     def _load(self, **ld_kwargs):
         if self._transparency: self._surfaces = (load(self.full_path).convert_alpha(),)
         else: self._surfaces = (load(self.full_path).convert(),)
         self._durations = (0,)
+        self._width, self._height = self._surfaces[0].get_size() # The on-loading transformation is applied on the loaded size.
+
+    def _source_fingerprint(self):
+        return (_file_fingerprint(self.full_path), self._transparency)
+
+class SpriteSheet(Art):
+    """
+    The SpriteSheet class is an Art loaded from one image containing all the frames of the animation, arranged in a grid.
+    The image is decoded once and the frames are subsurfaces of it: they share its pixels.
+    The frames are taken row by row, from left to right.
+
+    Example:
+    ---
+    - ``SpriteSheet("hero_run.png", 80, frame_size=(32, 48))`` is an Art displaying the frames of 32x48 pixels of the image, 80 ms each.
+    - ``SpriteSheet("explosion.png", [50, 50, 100], grid=(3, 1))`` is an Art displaying the three frames of the only row of the image.
+    - ``SpriteSheet("coin.png", 60, grid=(4, 2), count=7)`` is an Art displaying the 7 first frames of a grid of 4 columns and 2 rows.
+    """
+
+    def __init__(
+        self,
+        file: str,
+        durations: Iterable[int] | int,
+        frame_size: tuple[int, int] = None,
+        grid: tuple[int, int] = None,
+        introduction: int = 0,
+        count: int = None,
+        transparency: bool = True,
+        transformation: Transformation = None,
+        permanent: bool = False,
+    ) -> None:
+        """
+        The SpriteSheet class is an Art loaded from one image containing all the frames of the animation, arranged in a grid.
+        Accepted format are: jpg, jpeg, png, gif (only first frame), svg, webp, lmb, pcx, pnm, tga (uncompressed), xpm
+
+        Params:
+        ----
+        - file: str, the path to the file.
+        - durations: Iterable[int] | int, the duration(s) of the frames. If an iterable is provided, it must have one element per frame.
+        - frame_size: tuple[int, int] = None, the width and height of the frames. Exactly one of frame_size and grid must be provided.
+        - grid: tuple[int, int] = None, the number of columns and rows of the sheet. Exactly one of frame_size and grid must be provided.
+        - introduction: the introduction of the art. If specified, the art will not display the first frame after the last but this one instead.
+        - count: int = None, the number of frames, if the last row is not full. If None, every cell of the grid is a frame.
+        - transparency: bool = True, whether the sheet has some transparency, see ImageFile.
+        - transformation: transform.Transformation = None. Any transformation (or Pipeline) that will be applied to the art when it is loaded.
+        - permanent: bool = False. If True, the art is never unloaded by the memory manager.
+
+        Raises:
+        ----
+        - ValueError if both or none of frame_size and grid are provided, or if the sheet cannot be divided in frames of this size.
+        - LoadingError if the specified introduction is larger than the number of frames.
+        - LoadingError if the iterable of durations does not have the same length as the number of frames.
+        """
+        super().__init__(transformation, permanent)
+        if (frame_size is None) == (grid is None):
+            raise ValueError("Exactly one of frame_size and grid must be provided.")
+        self.full_path = file
+        self.durs = durations
+        self._introduction = introduction
+        self._transparency = transparency
+        self._grid = (frame_size, grid, count)
+        self._rects = self._grid_rects(*_image_size(self.full_path))
+        self._width, self._height = self._rects[0][2:]
+        self._find_initial_dimension()
+
+    def _grid_rects(self, sheet_width: int, sheet_height: int) -> tuple[tuple[int, int, int, int]]:
+        """Return the rects of the frames in a sheet of this size."""
+        frame_size, grid, count = self._grid
+        if grid is not None:
+            columns, rows = grid
+            if columns <= 0 or rows <= 0 or sheet_width % columns or sheet_height % rows:
+                raise ValueError(f"A sheet of size {sheet_width}x{sheet_height} cannot be divided in a grid of {columns}x{rows}.")
+            width, height = sheet_width//columns, sheet_height//rows
+        else:
+            width, height = frame_size
+            if width <= 0 or height <= 0 or width > sheet_width or height > sheet_height:
+                raise ValueError(f"A sheet of size {sheet_width}x{sheet_height} cannot contain frames of size {width}x{height}.")
+            columns, rows = sheet_width//width, sheet_height//height
+        if count is not None and not 0 < count <= columns*rows:
+            raise ValueError(f"The sheet contains {columns*rows} cells, {count} frames cannot be taken from it.")
+        return tuple(
+            (column*width, row*height, width, height)
+            for row in range(rows) for column in range(columns)
+        )[:count]
+
+    def _load(self, **ld_kwargs):
+        sheet = load(self.full_path).convert_alpha() if self._transparency else load(self.full_path).convert()
+        self._rects = self._grid_rects(*sheet.get_size()) # The size given by the manifest might be outdated.
+        self._width, self._height = self._rects[0][2:]
+        self._surfaces = tuple(sheet.subsurface(rect) for rect in self._rects)
+        if self._introduction > len(self._surfaces):
+            raise LoadingError(
+                f"The introduction specified for this SpriteSheet is too high, got {self._introduction} while there is only {len(self._surfaces)} frames."
+            )
+        if isinstance(self.durs, int):
+            self._durations = tuple(self.durs for _ in self._rects)
+        else:
+            if len(self.durs) != len(self._rects):
+                raise LoadingError(
+                    f"The length of the durations list ({len(self.durs)}) does not match the number of frames ({len(self._rects)})"
+                )
+            self._durations = tuple(self.durs)
+
+    def _source_fingerprint(self):
+        durations = fingerprint_of(self.durs)
+        if durations is None:
+            return None
+        return (_file_fingerprint(self.full_path), self._grid, durations, self._introduction, self._transparency)
 
 class ImageFolder(Art):
     """
     The ImageFolder class is an Art loaded from multiple images in a folder.
     All image must have one of these formats: jpg, jpeg, png, gif (only first frame), svg, webp, lmb, pcx, pnm, tga (uncompressed), xpm
-    The animation is reconstructed by taking images in the alphabetical order from the file. All images must have the same sizes
+    The animation is reconstructed by taking images in the natural order of their names ('frame2' before 'frame10'). All images must have the same sizes
     
     Example:
     -----
@@ -61,6 +204,7 @@ class ImageFolder(Art):
     When all the images have been displayed, it does not loop on the very first but on the 6th.
     Frame will be displayed in the following order, if there are 9 frames:
     [0, 1, 2, 3, 4, 5, 6, 7, 8, 5, 6, 7, 8, 5, 6, 7, 8, 5, 6, ...].
+    - ``ImageFolder("characters/char1/running/", 70, parallel=True)`` decodes the images of the folder on several threads.
     """
 
     def __init__(
@@ -69,11 +213,15 @@ class ImageFolder(Art):
         durations: Iterable[int] | int,
         introduction: int = 0,
         transformation: Transformation = None,
+        permanent: bool = False,
+        streaming: bool = False,
+        window: tuple[int, int] = (2, 8),
+        parallel: bool = False,
     ) -> None:
         """
         The ImageFolder class is an Art loaded from multiple images in a folder.
         All image must have one of these formats: jpg, jpeg, png, gif (only first frame), svg, webp, lmb, pcx, pnm, tga (uncompressed), xpm
-        The animation is reconstructed by taking images in the alphabetical order from the file. All images must have the same sizes.
+        The animation is reconstructed by taking images in the natural order of their names ('frame2' before 'frame10'). All images must have the same sizes.
 
         Params:
         ---
@@ -82,29 +230,51 @@ class ImageFolder(Art):
         the number of images in the folder.
         - introduction: the introduction of the art. If specified, the art will not display the first frame after the last but this one instead. See examples.
         - transformation: transform.Transformation = None. Any transformation (or Pipeline) that will be applied to the art when it is loaded.
+        - permanent: bool = False. If True, the art is never unloaded by the memory manager.
+        - streaming: bool = False. If True, the images are decoded only when they are displayed, see window.
+        - window: tuple[int, int] = (2, 8). For streaming arts, the number of frames kept decoded before the current one,
+        and the number of frames decoded in advance after it.
+        - parallel: bool = False. If True, the images are decoded on the threads of the thread budget. Ignored for streaming arts.
         
         Raises:
         ---
         - LoadingError if the specified introduction is larger than the number of images in the folder.
         - LoadingError if the iterable of durations does not have the same length as the number of images in the folder.
         """
-        super().__init__(transformation)
+        super().__init__(transformation, permanent)
         self.full_path = folder
         self.durs = durations
         self._introduction = introduction
+        self._streaming = streaming
+        self._window = window
+        self._parallel = parallel
 
-        self._paths = [
-            os.path.join(self.full_path, f)
-            for f in os.listdir(self.full_path)
-            if os.path.isfile(os.path.join(self.full_path, f))
-        ]
-        im = Image.open(self._paths[0])
-        self._width, self._height = im.size
-        im.close()
+        self._manifest_entry = manifest.entry(self.full_path)
+        if self._manifest_entry is not None:
+            self._paths = [os.path.join(self.full_path, f) for f in self._manifest_entry['files']]
+            self._width, self._height = self._manifest_entry['size']
+        else:
+            self._paths = _list_images(self.full_path)
+            self._width, self._height = _image_size(self._paths[0])
         self._find_initial_dimension()
 
+    def _current_paths(self) -> list[str]:
+        """Return the paths of the images, the folder is listed again if it has been modified since the manifest was written."""
+        if self._manifest_entry is not None and not manifest.is_fresh(self._manifest_entry, self.full_path):
+            self._paths = _list_images(self.full_path)
+        self._manifest_entry = None
+        return self._paths
+
     def _load(self, **ld_kwargs):
-        self._surfaces = tuple(load(path) for path in self._paths)
+        self._current_paths()
+        if self._streaming:
+            paths = tuple(self._paths)
+            self._surfaces = LazyFrames(len(paths), lambda index: load(paths[index]), None, self._introduction, *self._window)
+        elif self._parallel:
+            futures = [_folder_loader.submit(load, path) for path in self._paths]
+            self._surfaces = tuple(future.result() for future in futures) # The order of the paths is kept.
+        else:
+            self._surfaces = tuple(load(path) for path in self._paths)
         if self._introduction > len(self._paths):
             raise LoadingError(
                 f"The introduction specified for this ImageFolder is too high, got {self._introduction} while there is only {len(self.surfaces)} images."
@@ -118,8 +288,73 @@ class ImageFolder(Art):
                 )
             self._durations = tuple(self.durs)
         self._verify_sizes()
+        self._width, self._height = self._surfaces[0].get_size() # The on-loading transformation is applied on the loaded size.
+
+    def _source_fingerprint(self):
+        durations = fingerprint_of(self.durs)
+        if durations is None or self._streaming: # Streaming arts are not cached.
+            return None
+        return (tuple(_file_fingerprint(path) for path in self._current_paths()), durations, self._introduction)
 
-class GIFFile(Art):
+class _AnimatedFile(Art):
+    """
+    The _AnimatedFile is the base class of the arts displaying an animated file decoded with Pillow.
+    The durations are read from the blocks of the file, without decoding the frames,
+    and the frames can be decoded all at once, progressively in the background, or streamed.
+    """
+
+    def __init__(
+        self,
+        file: str,
+        introduction: int = 0,
+        transformation: Transformation = None,
+        permanent: bool = False,
+        streaming: bool = False,
+        window: tuple[int, int] = (2, 8),
+        progressive: bool = False,
+    ) -> None:
+        super().__init__(transformation, permanent)
+        self.full_path = file
+        self._introduction = introduction
+        self._streaming = streaming
+        self._window = window
+        self._progressive = progressive and not streaming
+        self._width, self._height = _image_size(self.full_path)
+        self._find_initial_dimension()
+
+    @staticmethod
+    def _scan_durations(path: str) -> tuple[int]:
+        """Return the duration of each frame of the file, without decoding them."""
+        raise NotImplementedError()
+
+    def _load(self, **ld_kwargs):
+        entry = manifest.entry(self.full_path)
+        if entry is not None and 'durations' in entry and manifest.is_fresh(entry, self.full_path):
+            durations = tuple(entry['durations'])
+        else:
+            durations = self._scan_durations(self.full_path)
+        if self._introduction > len(durations):
+            raise LoadingError(
+                f"The introduction specified for this {type(self).__name__} is too high, got {self._introduction} while there is only {len(durations)} images."
+            )
+        if self._streaming:
+            decoder = _FrameDecoder(self.full_path)
+            self._surfaces = LazyFrames(len(durations), decoder, decoder.size, self._introduction, *self._window, decoder.close)
+            self._width, self._height = decoder.size
+        else:
+            if self._progressive:
+                self._surfaces = ProgressiveFrames(len(durations), _decode_frames(self.full_path, len(durations)))
+            else:
+                self._surfaces = tuple(_decode_frames(self.full_path, len(durations)))
+            self._width, self._height = self._surfaces[0].get_size() # The on-loading transformation is applied on the loaded size.
+        self._durations = durations
+
+    def _source_fingerprint(self):
+        if self._streaming or self._progressive: # Streaming and progressive arts are not cached.
+            return None
+        return (_file_fingerprint(self.full_path), self._introduction)
+
+class GIFFile(_AnimatedFile):
     """
     The GIFFile is an Art that displays a gif.
     
@@ -129,9 +364,19 @@ class GIFFile(Art):
     - GIFFile("my_animation.gif", 10) is an Art displaying the gif stored at "assets/images/my_animation.gif".
     it must have at least 10 images.
     When all the images have been displayed, do not loop on the very first but on the 10th.
+    - GIFFile("my_animation.gif", progressive=True) is an Art whose first frames can be displayed while the next ones are decoded.
     """
 
-    def __init__(self, file: str, introduction: int = 0, transformation: Transformation = None) -> None:
+    def __init__(
+        self,
+        file: str,
+        introduction: int = 0,
+        transformation: Transformation = None,
+        permanent: bool = False,
+        streaming: bool = False,
+        window: tuple[int, int] = (2, 8),
+        progressive: bool = False,
+    ) -> None:
         """
         The GIFFile is an Art that displays a gif.
 
@@ -140,36 +385,274 @@ class GIFFile(Art):
         - file: str, the path to the .gif file.
         - introduction: the introduction of the art. If specified, the art will not display the first frame after the last but this one instead. See examples.
         - transformation: transform.Transformation = None. Any transformation (or Pipeline) that will be applied to the art when it is loaded.
+        - permanent: bool = False. If True, the art is never unloaded by the memory manager.
+        - streaming: bool = False. If True, the frames are decoded only when they are displayed, see window.
+        - window: tuple[int, int] = (2, 8). For streaming arts, the number of frames kept decoded before the current one,
+        and the number of frames decoded in advance after it.
+        - progressive: bool = False. If True, the frames are decoded in the background after the loading, in order,
+        and the art can be displayed as soon as its first frame is decoded. Ignored for streaming arts.
         
         Raises:
         ---
-        - LoadingError if the specified introduction is larger than the number of images in the folder.
+        - LoadingError if the specified introduction is larger than the number of images in the file.
         """
-        super().__init__(transformation)
-        self.full_path = file
-        self._introduction = introduction
-        im = Image.open(self.full_path)
-        self._width, self._height = im.size
-        im.close()
-        self._find_initial_dimension()
+        super().__init__(file, introduction, transformation, permanent, streaming, window, progressive)
 
-    def _load(self, **ld_kwargs):
-        gif = Image.open(self.full_path)
-        gif.seek(0)
-        images = [fromstring(gif.convert('RGBA').tobytes(), gif.size, 'RGBA')]
-        image_durations = [gif.info['duration']]
-        while True:
+    @staticmethod
+    def _scan_durations(path: str) -> tuple[int]:
+        return _scan_gif(path)
+
+class WebPFile(_AnimatedFile):
+    """
+    The WebPFile is an Art that displays an animated webp, with a full alpha channel and millions of colors.
+    
+    Example:
+    -----
+    - WebPFile("my_animation.webp") is an Art displaying the webp stored at "assets/images/my_animation.webp".
+    - WebPFile("my_animation.webp", 10) is an Art displaying the webp stored at "assets/images/my_animation.webp".
+    it must have at least 10 images.
+    When all the images have been displayed, do not loop on the very first but on the 10th.
+    - WebPFile("my_animation.webp", progressive=True) is an Art whose first frames can be displayed while the next ones are decoded.
+    """
+
+    def __init__(
+        self,
+        file: str,
+        introduction: int = 0,
+        transformation: Transformation = None,
+        permanent: bool = False,
+        streaming: bool = False,
+        window: tuple[int, int] = (2, 8),
+        progressive: bool = False,
+    ) -> None:
+        """
+        The WebPFile is an Art that displays an animated webp, with a full alpha channel and millions of colors.
+
+        Params:
+        ----
+        - file: str, the path to the .webp file.
+        - introduction: the introduction of the art. If specified, the art will not display the first frame after the last but this one instead. See examples.
+        - transformation: transform.Transformation = None. Any transformation (or Pipeline) that will be applied to the art when it is loaded.
+        - permanent: bool = False. If True, the art is never unloaded by the memory manager.
+        - streaming: bool = False. If True, the frames are decoded only when they are displayed, see window.
+        - window: tuple[int, int] = (2, 8). For streaming arts, the number of frames kept decoded before the current one,
+        and the number of frames decoded in advance after it.
+        - progressive: bool = False. If True, the frames are decoded in the background after the loading, in order,
+        and the art can be displayed as soon as its first frame is decoded. Ignored for streaming arts.
+        
+        Raises:
+        ---
+        - LoadingError if the specified introduction is larger than the number of images in the file.
+        """
+        super().__init__(file, introduction, transformation, permanent, streaming, window, progressive)
+
+    @staticmethod
+    def _scan_durations(path: str) -> tuple[int]:
+        return _scan_webp(path)
+
+class APNGFile(_AnimatedFile):
+    """
+    The APNGFile is an Art that displays an animated png, with a full alpha channel and millions of colors.
+    
+    Example:
+    -----
+    - APNGFile("my_animation.png") is an Art displaying the png stored at "assets/images/my_animation.png".
+    - APNGFile("my_animation.png", 10) is an Art displaying the png stored at "assets/images/my_animation.png".
+    it must have at least 10 images.
+    When all the images have been displayed, do not loop on the very first but on the 10th.
+    - APNGFile("my_animation.png", progressive=True) is an Art whose first frames can be displayed while the next ones are decoded.
+    A png that is not animated is displayed as an animation of one frame.
+    """
+
+    def __init__(
+        self,
+        file: str,
+        introduction: int = 0,
+        transformation: Transformation = None,
+        permanent: bool = False,
+        streaming: bool = False,
+        window: tuple[int, int] = (2, 8),
+        progressive: bool = False,
+    ) -> None:
+        """
+        The APNGFile is an Art that displays an animated png, with a full alpha channel and millions of colors.
+
+        Params:
+        ----
+        - file: str, the path to the .png file.
+        - introduction: the introduction of the art. If specified, the art will not display the first frame after the last but this one instead. See examples.
+        - transformation: transform.Transformation = None. Any transformation (or Pipeline) that will be applied to the art when it is loaded.
+        - permanent: bool = False. If True, the art is never unloaded by the memory manager.
+        - streaming: bool = False. If True, the frames are decoded only when they are displayed, see window.
+        - window: tuple[int, int] = (2, 8). For streaming arts, the number of frames kept decoded before the current one,
+        and the number of frames decoded in advance after it.
+        - progressive: bool = False. If True, the frames are decoded in the background after the loading, in order,
+        and the art can be displayed as soon as its first frame is decoded. Ignored for streaming arts.
+        
+        Raises:
+        ---
+        - LoadingError if the specified introduction is larger than the number of images in the file.
+        """
+        super().__init__(file, introduction, transformation, permanent, streaming, window, progressive)
+
+    @staticmethod
+    def _scan_durations(path: str) -> tuple[int]:
+        return _scan_apng(path)
+
+def _rgba_frame(image: Image.Image) -> Surface:
+    """Return the current frame of an opened image as a surface."""
+    # The frames are not converted into a buffer reused for all the frames: each frame must own its pixels, as the frames are kept by the art,
+    # and Pillow can only convert a frame into a new image. The conversion is skipped for the frames that are already in RGBA.
+    rgba = image if image.mode == 'RGBA' else image.convert('RGBA')
+    # The surface shares the memory of the buffer instead of copying it again. The buffer must be writable, as the in-place effects modify the frames.
+    return frombuffer(bytearray(rgba.tobytes()), image.size, 'RGBA')
+
+def _decode_frames(path: str, length: int) -> Iterable[Surface]:
+    """Yield the frames of an animated file one by one. The file is closed when all the frames have been decoded, or on error."""
+    with Image.open(path) as image:
+        for index in range(length):
             try:
-                gif.seek(gif.tell()+1)
-                images.append(fromstring(gif.convert('RGBA').tobytes(), gif.size, 'RGBA'))
-                image_durations.append(gif.info['duration'])
-            except EOFError:
+                image.seek(index)
+            except EOFError as error:
+                raise LoadingError(f"The file {path} has only {index} readable images, while {length} were expected.") from error
+            yield _rgba_frame(image)
+
+def _skip_sub_blocks(data: bytes, position: int) -> int:
+    """Return the position following the data sub-blocks of a gif starting at position."""
+    while data[position]:
+        position += data[position] + 1
+    return position + 1
+
+def _scan_gif(path: str) -> tuple[int]:
+    """
+    Return the duration of each frame of a gif, by reading the blocks of the file without decoding the frames.
+    Frames without graphic control extension have a duration of 0.
+    """
+    with open(path, 'rb') as file:
+        data = file.read()
+    if data[:3] != b'GIF':
+        raise LoadingError(f"The file {path} is not a gif.")
+    position = 13
+    if data[10] & 0x80: # Global color table
+        position += 3 * 2 ** ((data[10] & 0x07) + 1)
+    durations = []
+    duration = 0
+    try:
+        while position < len(data):
+            block = data[position]
+            if block == 0x21: # Extension
+                if data[position + 1] == 0xF9: # Graphic control extension, the delay is in hundredths of second
+                    duration = int.from_bytes(data[position + 4: position + 6], 'little') * 10
+                position = _skip_sub_blocks(data, position + 2)
+            elif block == 0x2C: # Image descriptor
+                packed = data[position + 9]
+                position += 10
+                if packed & 0x80: # Local color table
+                    position += 3 * 2 ** ((packed & 0x07) + 1)
+                position = _skip_sub_blocks(data, position + 1) # The LZW minimum code size is followed by the image data.
+                durations.append(duration)
+                duration = 0
+            else: # Trailer, or unexpected data ending the file.
                 break
-        self._surfaces = tuple(images)
-        self._durations = tuple(image_durations)
+    except IndexError: # Truncated file, the readable frames are kept.
+        pass
+    if not durations:
+        raise LoadingError(f"The gif {path} has no image.")
+    return tuple(durations)
 
-        if self._introduction > len(self.surfaces):
-            raise LoadingError(
-                f"The introduction specified for this GIFFile is too high, got {self._introduction} while there is only {len(self.surfaces)} images."
-            )
-        gif.close()
+def _scan_webp(path: str) -> tuple[int]:
+    """
+    Return the duration of each frame of a webp, by reading the chunks of the file without decoding the frames.
+    A webp that is not animated has one frame of duration 0.
+    """
+    with open(path, 'rb') as file:
+        data = file.read()
+    if data[:4] != b'RIFF' or data[8:12] != b'WEBP':
+        raise LoadingError(f"The file {path} is not a webp.")
+    durations = []
+    position = 12
+    while position + 8 <= len(data):
+        chunk = data[position: position + 4]
+        length = int.from_bytes(data[position + 4: position + 8], 'little')
+        if chunk == b'ANMF': # Animation frame, the duration is stored on 3 bytes after the position and size of the frame.
+            durations.append(int.from_bytes(data[position + 20: position + 23], 'little'))
+        position += 8 + length + (length & 1) # Chunks are padded to an even size.
+    return tuple(durations) or (0,)
+
+def _scan_apng(path: str) -> tuple[int]:
+    """
+    Return the duration of each frame of a png, by reading the chunks of the file without decoding the frames.
+    A png that is not animated has one frame of duration 0, as does the default image of an apng when it is not part of the animation.
+    """
+    with open(path, 'rb') as file:
+        data = file.read()
+    if data[:8] != b'\x89PNG\r\n\x1a\n':
+        raise LoadingError(f"The file {path} is not a png.")
+    durations = []
+    animated = False
+    default_image = False
+    position = 8
+    while position + 8 <= len(data):
+        length = int.from_bytes(data[position: position + 4], 'big')
+        chunk = data[position + 4: position + 8]
+        if chunk == b'acTL':
+            animated = True
+        elif chunk == b'fcTL': # Frame control, the delay is a fraction of second, whose denominator is 100 if 0.
+            numerator = int.from_bytes(data[position + 28: position + 30], 'big')
+            denominator = int.from_bytes(data[position + 30: position + 32], 'big') or 100
+            durations.append(round(numerator*1000/denominator))
+        elif chunk == b'IDAT' and animated and not durations: # The default image is not the first frame of the animation.
+            default_image = True
+        elif chunk == b'IEND':
+            break
+        position += 12 + length # Length, type, data and crc.
+    if not animated:
+        return (0,)
+    return ((0,) if default_image else ()) + tuple(durations)
+
+class _FrameDecoder:
+    """The _FrameDecoder decodes the frames of an animated file one by one, for streaming arts."""
+
+    def __init__(self, path: str) -> None:
+        self._image = Image.open(path)
+        self.size = self._image.size
+        self._lock = Lock() # The frames might be decoded by several threads.
+
+    def __call__(self, index: int):
+        with self._lock:
+            self._image.seek(index)
+            return _rgba_frame(self._image)
+
+    def close(self):
+        """Close the file."""
+        with self._lock:
+            self._image.close()
+
+_SCANS = {'.gif': _scan_gif, '.webp': _scan_webp, '.png': _scan_apng, '.apng': _scan_apng}
+
+def _probe(path: str) -> dict:
+    """Return the manifest entry of a file or a folder."""
+    stat = os.stat(path)
+    if os.path.isdir(path):
+        paths = _list_images(path)
+        return {'size': list(_read_size(paths[0])), 'mtime_ns': stat.st_mtime_ns, 'files': [os.path.basename(p) for p in paths]}
+    entry = {'size': list(_read_size(path)), 'mtime_ns': stat.st_mtime_ns, 'bytes': stat.st_size}
+    scan = _SCANS.get(os.path.splitext(path)[1].lower())
+    if scan is not None:
+        entry['durations'] = list(scan(path))
+    return entry
+
+def write_manifest(path: str, files: Iterable[str]):
+    """
+    Write a manifest recording the size of the images, the list of files of the folders and the durations of the animated files.
+    See Manifest.
+
+    Params:
+    ----
+    - path: str, the path to the manifest file.
+    - files: Iterable[str], the paths to the files and folders, as they will be given to the arts.
+    """
+    entries = {}
+    for file in files:
+        entries[os.path.normpath(file)] = _probe(file)
+    write_manifest_entries(path, entries)
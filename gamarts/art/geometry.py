@@ -16,6 +16,7 @@ class Rectangle(Art):
         height: int,
         thickness: int = 0,
         transformation: Transformation = None,
+        permanent: bool = False,
     ):
         """
         A Rectangle is an Art representing a rectangle.
@@ -27,9 +28,10 @@ class Rectangle(Art):
         - height: int, the height of the art. 
         - thickness: int, the thickness of the line used to draw the art.
         - transformation: transform.Transformation = None. Any transformation (or Pipeline) that will be applied to the art when it is loaded.
+        - permanent: bool = False. If True, the art is never unloaded by the memory manager.
         """
 
-        super().__init__(transformation)
+        super().__init__(transformation, permanent)
         self.color = Color(color)
         self._initial_width, self.initial_height = width, height
         self._width = width
@@ -61,7 +63,8 @@ class RoundedRectangle(Art):
         thickness: int = 0,
         transformation: Transformation = None,
         allow_antialias: bool = True,
-        background_color: ColorValue = None
+        background_color: ColorValue = None,
+        permanent: bool = False,
     ):
         """
         A RoundedRectangle is an Art representing rounded rectangle.
@@ -77,8 +80,9 @@ class RoundedRectangle(Art):
         - transformation: transform.Transformation = None. Any transformation (or Pipeline) that will be applied to the art when it is loaded.
         - allow_antialias: bool = True, if False, even with 'antialias' : True as a loading kwarg, the drawing will be done without antialias.
         - background_color: ColorValue, the color of the background. This is used to make better renders when antialias is used.
+        - permanent: bool = False. If True, the art is never unloaded by the memory manager.
         """
-        super().__init__(transformation)
+        super().__init__(transformation, permanent)
         self.top_left = top_left
         self.top_right = top_right
         self.bottom_left = bottom_left
@@ -111,7 +115,8 @@ class Circle(Art):
         thickness: int = 0,
         transformation: Transformation = None,
         allow_antialias: bool = True,
-        background_color: Color = None
+        background_color: Color = None,
+        permanent: bool = False,
     ):
         """
         A Circle is an Art representing a circle.
@@ -124,8 +129,9 @@ class Circle(Art):
         - transformation: transform.Transformation = None. Any transformation (or Pipeline) that will be applied to the art when it is loaded.
         - allow_antialias: bool = True, if False, even with 'antialias' : True as a loading kwarg, the drawing will be done without antialias.
         - background_color: ColorValue, the color of the background. This is used to make better renders when antialias is used.
+        - permanent: bool = False. If True, the art is never unloaded by the memory manager.
         """
-        super().__init__(transformation)
+        super().__init__(transformation, permanent)
         self.radius = radius
         self.color = Color(color)
         self.thickness = thickness
@@ -161,7 +167,8 @@ class Ellipse(Art):
         thickness: int = 0,
         transformation: Transformation = None,
         allow_antialias: bool = True,
-        background_color: Color = None
+        background_color: Color = None,
+        permanent: bool = False,
     ) -> None:
         """
         An Ellipse is an Art representing a ellipse.
@@ -175,10 +182,11 @@ class Ellipse(Art):
         - transformation: transform.Transformation = None. Any transformation (or Pipeline) that will be applied to the art when it is loaded.
         - allow_antialias: bool = True, if False, even with 'antialias' : True as a loading kwarg, the drawing will be done without antialias.
         - background_color: ColorValue, the color of the background. This is used to make better renders when antialias is used.
+        - permanent: bool = False. If True, the art is never unloaded by the memory manager.
         """
         self.color = color
         self.thickness = thickness
-        super().__init__(transformation)
+        super().__init__(transformation, permanent)
         self.radius_x, self.radius_y = radius_x, radius_y
         self._height = radius_y*2
         self._width = radius_x*2
@@ -209,7 +217,8 @@ class Polygon(Art):
         thickness: int = 0,
         transformation: Transformation = None,
         allow_antialias: bool = True,
-        background_color: Color = None
+        background_color: Color = None,
+        permanent: bool = False,
     ):
         """
         A Circle is an Art representing a polygon.
@@ -224,12 +233,13 @@ class Polygon(Art):
         - transformation: transform.Transformation = None. Any transformation (or Pipeline) that will be applied to the art when it is loaded.
         - allow_antialias: bool = True, if False, even with 'antialias' : True as a loading kwarg, the drawing will be done without antialias.
         - background_color: ColorValue, the color of the background. This is used to make better renders when antialias is used.
+        - permanent: bool = False. If True, the art is never unloaded by the memory manager.
         """
 
         self.points = points
         self.thickness = thickness
         self.color = color
-        super().__init__(transformation)
+        super().__init__(transformation, permanent)
 
         min_x = min(p[0] for p in self.points)
         min_y = min(p[1] for p in self.points)
@@ -260,6 +270,7 @@ class TexturedPolygon(Art):
         texture: Art,
         points: Sequence[tuple[int, int]],
         transformation: Transformation = None,
+        permanent: bool = False,
     ):
         """
         A Textured polygon represents a polygon filled with an art.
@@ -270,10 +281,11 @@ class TexturedPolygon(Art):
         as its texture. The surfaces use to create the TexturedPolygon are the surfaces of the texture when the TexturedPolygon is loaded.
         - points: Sequence[tuple[int, int]] the list of points used to draw the polygon.
         - transformation: transform.Transformation = None. Any transformation (or Pipeline) that will be applied to the art when it is loaded.
+        - permanent: bool = False. If True, the art is never unloaded by the memory manager.
         """
 
         self.points = points
-        super().__init__(transformation)
+        super().__init__(transformation, permanent)
         self._height = max(p[1] for p in self.points)
         self._width = max(p[0] for p in self.points)
         self._find_initial_dimension()
@@ -318,6 +330,7 @@ class TexturedCircle(Art):
         draw_bottom_left: bool = True,
         draw_bottom_right: bool = True,
         transformation: Transformation = None,
+        permanent: bool = False,
     ):
         """
         A TexturedCircle represents a circle filled with an art.
@@ -330,9 +343,10 @@ class TexturedCircle(Art):
         - center: the center of the circle. By default, the center of the Art. The circle may not be fully drawn.
         - draw_top_right, draw_top_left, draw_bottom_left, draw_bottom_right: bool, specify whether the corresponding quart should be drawn.
         - transformation: transform.Transformation = None. Any transformation (or Pipeline) that will be applied to the art when it is loaded.
+        - permanent: bool = False. If True, the art is never unloaded by the memory manager.
         """
 
-        super().__init__(transformation)
+        super().__init__(transformation, permanent)
         self.radius = radius
         self.draw_top_right = draw_top_right
         self.draw_top_left = draw_top_left
@@ -380,6 +394,7 @@ class TexturedEllipse(Art):
         radius_y: int,
         center: tuple[int, int] = None,
         transformation: Transformation = None,
+        permanent: bool = False,
     ) -> None:
         """
         A TexturedEllipse represents an ellipse filled with an art.
@@ -391,8 +406,9 @@ class TexturedEllipse(Art):
         - radius_x, radius_y: int, the horizontal and vertical radii of the ellipse.
         - center: tuple[int, int], default is the center of the art. The center of the ellipse.
         - transformation: transform.Transformation = None. Any transformation (or Pipeline) that will be applied to the art when it is loaded.
+        - permanent: bool = False. If True, the art is never unloaded by the memory manager.
         """
-        super().__init__(transformation)
+        super().__init__(transformation, permanent)
         if center is None:
             center = texture.width//2, texture.height//2
         self.center = center
@@ -435,6 +451,7 @@ class TexturedRoundedRectangle(Art):
         bottom_left: int = None,
         bottom_right: int = None,
         transformation: Transformation = None,
+        permanent: bool = False,
     ):
         """
         A TexturedRoundedRectangle is an Art with rounded corners.
@@ -446,9 +463,10 @@ class TexturedRoundedRectangle(Art):
         - top_left, top_right, bottom_left, bottom_right: int. The radii of the corners. If any of the 3 last is None, it it repplaced by the
         value for top_left.
         - transformation: transform.Transformation = None. Any transformation (or Pipeline) that will be applied to the art when it is loaded.
+        - permanent: bool = False. If True, the art is never unloaded by the memory manager.
         """
 
-        super().__init__(transformation)
+        super().__init__(transformation, permanent)
         self.top_left = top_left
         self.top_right = top_right if not top_right is None else top_left
         self.bottom_left = bottom_left if not bottom_left is None else top_left
@@ -0,0 +1,188 @@
+"""The group module contains the ArtGroup class, used to update the animation of many arts at once."""
+from itertools import accumulate
+import numpy as np
+from .art import Art, _ArtAsReference
+from .memory import memory_manager
+
+class ArtGroup:
+    """
+    An ArtGroup updates the animations of many arts at once.
+    The index and the time since the last change of all the members are stored in arrays and updated in one vectorized step,
+    and the .get() of the members reads their index from the group. The .update() and .seek() of a member modify its animation in the group,
+    but updating the members one by one is slower than updating the group.
+    The group is the most efficient when its members share their durations, like the references of one art.
+
+    Example:
+    ----
+    - ``crowd = ArtGroup(*(walking.reference() for _ in range(5000)))`` creates a group of 5000 independant animations of the same art.
+    - ``changed = crowd.update(loop_duration)`` updates all of them and returns an array of booleans specifying which have changed.
+    """
+
+    def __init__(self, *arts: Art) -> None:
+        """
+        Create an ArtGroup.
+
+        Params:
+        ----
+        - *arts: Art, the initial members of the group.
+        """
+        self._arts: list[Art] = []
+        self._indices = np.zeros(0, np.int64)
+        self._times = np.zeros(0, np.float64)
+        self._sources: list[tuple[Art, tuple, int]] = [] # The arts owning the durations, with the durations and introduction used for the arrays.
+        self._needs_rebuild = True
+        self.add(*arts)
+
+    def __len__(self):
+        return len(self._arts)
+
+    def __iter__(self):
+        return iter(self._arts)
+
+    def __contains__(self, art: Art):
+        return art._group is self
+
+    @property
+    def indices(self) -> np.ndarray:
+        """Return the index of each member."""
+        return self._indices
+
+    def add(self, *arts: Art):
+        """Add new members to the group. Arts can be members of only one group. StreamArts and their references cannot be members."""
+        for art in arts:
+            if not self._source_of(art)._groupable:
+                raise ValueError(f"A {type(self._source_of(art)).__name__} cannot be a member of an ArtGroup, it must be updated by its .update().")
+        for art in arts:
+            if art._group is not None:
+                raise ValueError("This art is already a member of an ArtGroup.")
+            art._group = self
+            art._group_slot = len(self._arts)
+            self._arts.append(art)
+        self._indices = np.concatenate((self._indices, np.array([art._index for art in arts], np.int64)))
+        self._times = np.concatenate((self._times, np.array([art._time_since_last_change for art in arts], np.float64)))
+        self._needs_rebuild = True
+
+    def remove(self, art: Art):
+        """Remove a member from the group. It keeps its current index."""
+        if art._group is not self:
+            raise ValueError("This art is not a member of this ArtGroup.")
+        slot = art._group_slot
+        art._index = int(self._indices[slot])
+        art._time_since_last_change = float(self._times[slot])
+        art._group = None
+        del self._arts[slot]
+        for member in self._arts[slot:]:
+            member._group_slot -= 1
+        self._indices = np.delete(self._indices, slot)
+        self._times = np.delete(self._times, slot)
+        self._needs_rebuild = True
+
+    def reset(self):
+        """Reset the animation of all the members."""
+        self._indices[:] = 0
+        self._times[:] = 0
+
+    def _reset_member(self, art: Art):
+        self._set_member_state(art, 0, 0)
+
+    def _member_state(self, art: Art) -> tuple[int, float]:
+        return int(self._indices[art._group_slot]), float(self._times[art._group_slot])
+
+    def _set_member_state(self, art: Art, index: int, time_since_last_change: float):
+        self._indices[art._group_slot] = index
+        self._times[art._group_slot] = time_since_last_change
+
+    @staticmethod
+    def _source_of(art: Art) -> Art:
+        """Return the art owning the durations of a member."""
+        return art._original if isinstance(art, _ArtAsReference) else art
+
+    def _is_outdated(self) -> bool:
+        return self._needs_rebuild or any(
+            source.durations is not durations or source.introduction != introduction
+            for source, durations, introduction in self._sources
+        )
+
+    def _rebuild(self) -> np.ndarray:
+        """
+        Compute the arrays describing the durations of the members.
+        The start times of the frames of every source are concatenated in one increasing array,
+        each source being shifted by a base time so that its frames can be found with one search on the whole array.
+
+        Returns:
+        ----
+        - rebuilt: np.ndarray, a boolean array specifying which members have sources whose durations changed.
+        """
+        previous = {id(source): (durations, introduction) for source, durations, introduction in self._sources}
+        self._sources = []
+        blocks = {}
+        start_times = []
+        base = 0.
+        for art in self._arts:
+            source = self._source_of(art)
+            if id(source) in blocks:
+                continue
+            durations, introduction = source.durations, source.introduction
+            cumulated = tuple(accumulate(durations, initial=0))
+            # block start, base, number of frames, loop start, total duration, introduction
+            blocks[id(source)] = (
+                len(start_times), base, len(durations), cumulated[min(introduction, len(durations))], cumulated[-1],
+                min(introduction, max(len(durations) - 1, 0))
+            )
+            start_times.extend(base + time for time in cumulated[:-1] or (0,))
+            base += cumulated[-1] + 1 # The next source starts strictly after the end of this one.
+            self._sources.append((source, durations, introduction))
+
+        members = np.array([blocks[id(self._source_of(art))] for art in self._arts], np.float64).reshape(-1, 6)
+        self._blocks = members[:, 0].astype(np.int64)
+        self._bases = members[:, 1]
+        self._lengths = members[:, 2].astype(np.int64)
+        self._loop_starts = members[:, 3]
+        self._totals = members[:, 4]
+        self._introductions = members[:, 5].astype(np.int64)
+        self._start_times = np.array(start_times, np.float64)
+        self._needs_rebuild = False
+        return np.array([
+            previous.get(id(self._source_of(art))) != (self._source_of(art).durations, self._source_of(art).introduction) for art in self._arts
+        ], bool)
+
+    def update(self, loop_duration: float) -> np.ndarray:
+        """
+        Update the animation of all the members.
+
+        Params:
+        ---
+        - loop_duration: float, the duration of the game loop, (the value returned by clock.tick(FPS)).
+
+        Returns:
+        ---
+        - has_changed: np.ndarray, a boolean array specifying, for each member in order of addition, whether its index changed
+        or its durations changed since the last call.
+        """
+        memory_manager.enforce_deferred()
+        rebuilt = self._rebuild() if self._is_outdated() else np.zeros(len(self._arts), bool)
+        if not self._arts:
+            return rebuilt
+        active = self._lengths > 1
+        indices = np.minimum(self._indices, np.maximum(self._lengths - 1, 0))
+        time = self._start_times[self._blocks + indices] - self._bases + self._times + loop_duration
+
+        # Loop over the frames after the introduction.
+        loop_durations = self._totals - self._loop_starts
+        over = time >= self._totals
+        looped = self._loop_starts + np.mod(time - self._loop_starts, np.where(loop_durations > 0, loop_durations, 1))
+        time = np.where(over, np.where(loop_durations > 0, looped, self._loop_starts), time)
+
+        new_indices = np.searchsorted(self._start_times, time + self._bases, side='right') - 1 - self._blocks
+        new_indices = np.clip(new_indices, 0, np.maximum(self._lengths - 1, 0))
+        new_times = time - (self._start_times[self._blocks + new_indices] - self._bases)
+
+        # The frames of the loop lasting 0 ms cannot be found from the time: one frame is displayed per update.
+        stepping = over & (loop_durations == 0)
+        new_indices = np.where(stepping, np.where(indices + 1 < self._lengths, indices + 1, self._introductions), new_indices)
+        new_times = np.where(stepping, 0., new_times)
+
+        has_changed = active & (new_indices != self._indices)
+        self._indices = np.where(active, new_indices, self._indices)
+        self._times = np.where(active, new_times, self._times)
+        return has_changed | rebuilt
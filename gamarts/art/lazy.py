@@ -0,0 +1,391 @@
+"""
+The lazy module contains the frames decoded after the loading of the arts: LazyFrames, for streaming arts, and ProgressiveFrames,
+and the TransformedFrames, transformed when accessed.
+"""
+from collections.abc import Sequence
+from concurrent.futures import Future
+from threading import Lock, Condition
+from typing import Callable, Iterable, Iterator
+from pygame import Surface
+from .._common import LoadingError
+from .._workers import WorkerPool, thread_budget
+
+_decoders = WorkerPool(None, "gamarts-decoder")
+
+class DeferredFrames(Sequence):
+    """DeferredFrames are frames behaving like a tuple of surfaces, decoded after the loading of the art. This class is abstract."""
+
+    def __add__(self, other):
+        return tuple(self) + tuple(other)
+
+    def __radd__(self, other):
+        return tuple(other) + tuple(self)
+
+    def decoded(self) -> tuple[Surface]:
+        """Return the frames currently decoded."""
+        raise NotImplementedError()
+
+    def is_complete(self) -> bool:
+        """Return True if all the frames have been decoded, and can be replaced by a tuple."""
+        return False
+
+    @property
+    def bytesize(self) -> int:
+        """Return the number of bytes used by the decoded frames."""
+        return sum(surf.get_pitch()*surf.get_height() for surf in self.decoded())
+
+    def close(self):
+        """Release the decoded frames and the resources used to decode them."""
+        raise NotImplementedError()
+
+class LazyFrames(DeferredFrames):
+    """
+    LazyFrames are the frames of a streaming art. They behave like a tuple of surfaces, but the frames are decoded only when accessed.
+    When a frame is accessed, the frames following it, up to the lookahead, are decoded in the background,
+    and the frames out of the window defined by the lookbehind and the lookahead are released.
+    When the animation loops, the frames following the last one are the frames after the introduction.
+    """
+
+    def __init__(
+        self,
+        length: int,
+        decode: Callable[[int], Surface],
+        size: tuple[int, int],
+        introduction: int = 0,
+        lookbehind: int = 2,
+        lookahead: int = 8,
+        close: Callable[[], None] = None
+    ) -> None:
+        """
+        Create LazyFrames.
+
+        Params:
+        ----
+        - length: int, the number of frames.
+        - decode: Callable[[int], Surface], the function decoding a frame from its index. It may be called from several threads.
+        - size: tuple[int, int], the size of the frames. Decoded frames with another size raise a LoadingError.
+        If None, the size of the first decoded frame is used.
+        - introduction: int = 0, the index of the frame following the last one.
+        - lookbehind: int = 2, the number of frames kept before the accessed frame.
+        - lookahead: int = 8, the number of frames decoded in advance after the accessed frame.
+        - close: Callable[[], None] = None, the function releasing the resources used to decode the frames.
+        """
+        self._length = length
+        self._decode = decode
+        self.size = tuple(size) if size is not None else None
+        self.introduction = introduction
+        self.lookbehind = lookbehind
+        self.lookahead = lookahead
+        self._close = close
+        self._frames: dict[int, Surface] = {}
+        self._pending: dict[int, Future] = {}
+        self._center = None
+        self._lock = Lock()
+
+    def __len__(self):
+        return self._length
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            return tuple(self[index] for index in range(*key.indices(self._length)))
+        if key < 0:
+            key += self._length
+        if not 0 <= key < self._length:
+            raise IndexError("LazyFrames index out of range")
+        surf = self._get(key)
+        self._move_window(key)
+        return surf
+
+    def decoded(self):
+        with self._lock:
+            return tuple(self._frames.values())
+
+    def _checked_decode(self, index: int) -> Surface:
+        surf = self._decode(index)
+        if self.size is None:
+            self.size = surf.get_size()
+        elif surf.get_size() != self.size:
+            raise LoadingError(f"All images of the art does not have the same size, got {surf.get_size()} and {self.size}")
+        return surf
+
+    def _prefetch(self, index: int) -> Surface:
+        surf = self._checked_decode(index)
+        with self._lock:
+            if self._pending.pop(index, None) is not None: # The frame might have left the window in the meantime.
+                self._frames[index] = surf
+        return surf
+
+    def _get(self, index: int) -> Surface:
+        with self._lock:
+            surf = self._frames.get(index)
+            if surf is not None:
+                return surf
+            future = self._pending.get(index)
+        surf = future.result() if future is not None and not future.cancelled() else self._checked_decode(index)
+        with self._lock:
+            self._frames[index] = surf
+        return surf
+
+    def _window(self, index: int) -> list[int]:
+        """Return the indices of the frames of the window, by order of priority."""
+        indices = [index]
+        following = index
+        for _ in range(min(self.lookahead, self._length - 1)):
+            following = following + 1 if following + 1 < self._length else self.introduction
+            indices.append(following)
+        indices.extend(range(max(0, index - self.lookbehind), index))
+        return indices
+
+    def _move_window(self, index: int):
+        if index == self._center: # Most of the time, the same frame is accessed several times in a row.
+            return
+        window = self._window(index)
+        kept = set(window)
+        with self._lock:
+            self._center = index
+            for frame_index in [idx for idx in self._frames if idx not in kept]:
+                del self._frames[frame_index]
+            for frame_index in [idx for idx in self._pending if idx not in kept]:
+                self._pending.pop(frame_index).cancel()
+            for distance, frame_index in enumerate(window):
+                if frame_index not in self._frames and frame_index not in self._pending:
+                    self._pending[frame_index] = _decoders.submit(self._prefetch, frame_index, priority=-distance)
+
+    def map(self, function: Callable[[Surface], Surface], size: tuple[int, int] = None) -> 'LazyFrames':
+        """
+        Return new LazyFrames whose frames are the frames of these ones, modified by a function when they are decoded.
+        The frames decoded by these LazyFrames are released.
+
+        Params:
+        ----
+        - function: Callable[[Surface], Surface], the function applied on each decoded frame.
+        - size: tuple[int, int] = None, the size of the frames returned by the function. If None, the size of the first frame is used.
+        """
+        self._release()
+        return LazyFrames(
+            self._length,
+            lambda index: function(self._checked_decode(index)),
+            size,
+            self.introduction,
+            self.lookbehind,
+            self.lookahead,
+            self.close
+        )
+
+    def _release(self):
+        with self._lock:
+            for future in self._pending.values():
+                future.cancel()
+            self._pending.clear()
+            self._frames.clear()
+            self._center = None
+
+    def close(self):
+        self._release()
+        if self._close is not None:
+            self._close()
+
+class ProgressiveFrames(DeferredFrames):
+    """
+    ProgressiveFrames are frames decoded one by one in the background, in order. The first frames can be displayed while the next ones are decoded.
+    Accessing a frame not decoded yet waits for it to be decoded.
+    """
+
+    def __init__(self, length: int, frames: Iterator[Surface]) -> None:
+        """
+        Create ProgressiveFrames and start decoding them.
+
+        Params:
+        ----
+        - length: int, the number of frames.
+        - frames: Iterator[Surface], the iterator decoding the frames, in order. It is closed at the end of the decoding.
+        """
+        self._length = length
+        self._frames: list[Surface] = []
+        self._condition = Condition()
+        self._error: BaseException = None
+        self._done = False
+        self._closed = False
+        self.future = _decoders.submit(self._decode_all, frames, priority=1)
+
+    def __len__(self):
+        return self._length
+
+    def _decode_all(self, frames: Iterator[Surface]):
+        try:
+            for surf in frames:
+                with self._condition:
+                    if self._closed:
+                        break
+                    self._frames.append(surf)
+                    self._condition.notify_all()
+        except BaseException as error:
+            with self._condition:
+                self._error = error
+            raise
+        finally:
+            if hasattr(frames, 'close'):
+                frames.close()
+            with self._condition:
+                self._done = True
+                self._condition.notify_all()
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            return tuple(self[index] for index in range(*key.indices(self._length)))
+        if key < 0:
+            key += self._length
+        if not 0 <= key < self._length:
+            raise IndexError("ProgressiveFrames index out of range")
+        if thread_budget.is_worker(): # The decoding might wait for this thread to be available.
+            self.future.run_if_pending()
+        with self._condition:
+            self._condition.wait_for(lambda: len(self._frames) > key or self._done)
+            if len(self._frames) > key:
+                return self._frames[key]
+            if self._error is not None:
+                raise LoadingError(f"The decoding of the frames failed: {self._error}") from self._error
+            raise LoadingError(f"Only {len(self._frames)} frames could be decoded, while {self._length} were expected.")
+
+    def is_complete(self) -> bool:
+        """Return True if all the frames have been decoded."""
+        return self._done and self._error is None and len(self._frames) == self._length
+
+    def decoded(self):
+        with self._condition:
+            return tuple(self._frames)
+
+    def close(self):
+        with self._condition:
+            self._closed = True
+            self._frames.clear()
+
+class TransformedFrames(DeferredFrames):
+    """
+    TransformedFrames are the frames of an art transformed lazily. They behave like a tuple of surfaces, but each frame is transformed
+    only when it is accessed for the first time, and then kept. When a frame is accessed, the next frames, up to the prefetch,
+    are transformed in the background. When the animation loops, the frames following the last one are the frames after the introduction.
+    """
+
+    def __init__(
+        self,
+        length: int,
+        materialize: Callable[[int], Surface],
+        source: Sequence[Surface] = (),
+        introduction: int = 0,
+        prefetch: int = 4,
+        on_frame: Callable[[], None] = None
+    ) -> None:
+        """
+        Create TransformedFrames.
+
+        Params:
+        ----
+        - length: int, the number of frames.
+        - materialize: Callable[[int], Surface], the function returning a transformed frame from its index. It may be called from several threads.
+        - source: Sequence[Surface] = (), the frames transformed by materialize. They are kept, and closed, with these frames.
+        - introduction: int = 0, the index of the frame following the last one.
+        - prefetch: int = 4, the number of frames transformed in advance after the accessed frame.
+        - on_frame: Callable[[], None] = None, called when a frame has been transformed and kept, from the thread that transformed it.
+        """
+        self._length = length
+        self._materialize = materialize
+        self._source = source
+        self.introduction = introduction
+        self.prefetch = prefetch
+        self.on_frame = on_frame
+        self._frames: dict[int, Surface] = {}
+        self._pending: dict[int, Future] = {}
+        self._last = None
+        self._lock = Lock()
+
+    def __len__(self):
+        return self._length
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            return tuple(self[index] for index in range(*key.indices(self._length)))
+        if key < 0:
+            key += self._length
+        if not 0 <= key < self._length:
+            raise IndexError("TransformedFrames index out of range")
+        surf = self._get(key)
+        if key != self._last:
+            self._last = key
+            self._prefetch_after(key)
+        return surf
+
+    def _get(self, index: int) -> Surface:
+        with self._lock:
+            surf = self._frames.get(index)
+            if surf is not None:
+                return surf
+            future = self._pending.get(index)
+        surf = future.result() if future is not None and not future.cancelled() else self._materialize(index)
+        with self._lock:
+            kept = self._frames.setdefault(index, surf)
+        if kept is surf:
+            self._frame_kept()
+        return kept
+
+    def _prefetched(self, index: int):
+        surf = self._materialize(index)
+        with self._lock:
+            # The frames might have been released in the meantime, or the frame accessed and kept by another thread.
+            kept = self._pending.pop(index, None) is not None and self._frames.setdefault(index, surf) is surf
+        if kept:
+            self._frame_kept()
+        return surf
+
+    def _frame_kept(self):
+        if self.on_frame is not None:
+            self.on_frame()
+
+    def _prefetch_after(self, index: int):
+        following = index
+        with self._lock:
+            for distance in range(min(self.prefetch, self._length - 1)):
+                following = following + 1 if following + 1 < self._length else self.introduction
+                if following not in self._frames and following not in self._pending:
+                    self._pending[following] = _decoders.submit(self._prefetched, following, priority=-distance)
+
+    def map(self, function: Callable[[Surface], Surface]) -> 'TransformedFrames':
+        """
+        Return new TransformedFrames whose frames are the frames of these ones, modified by a function when they are accessed.
+        The frames already transformed by these TransformedFrames are given to the new ones, and these ones should not be used anymore.
+        """
+        with self._lock:
+            frames, self._frames = self._frames, {}
+            for future in self._pending.values():
+                future.cancel()
+            self._pending.clear()
+
+        def materialize(index: int) -> Surface:
+            surf = frames.pop(index, None)
+            return function(surf if surf is not None else self._materialize(index))
+
+        return TransformedFrames(self._length, materialize, self._source, self.introduction, self.prefetch, self.on_frame)
+
+    def is_complete(self):
+        with self._lock:
+            return len(self._frames) == self._length
+
+    def decoded(self):
+        # The source frames are still in memory.
+        with self._lock:
+            return tuple(self._frames.values()) + tuple(decoded_frames(self._source))
+
+    def close(self):
+        with self._lock:
+            for future in self._pending.values():
+                future.cancel()
+            self._pending.clear()
+            self._frames.clear()
+        if isinstance(self._source, DeferredFrames):
+            self._source.close()
+
+def decoded_frames(surfaces: Sequence[Surface]) -> Iterable[Surface]:
+    """Return the surfaces, or only the frames currently decoded for DeferredFrames."""
+    if isinstance(surfaces, DeferredFrames):
+        return surfaces.decoded()
+    return surfaces
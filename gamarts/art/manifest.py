@@ -0,0 +1,70 @@
+"""The manifest module contains the Manifest, used to create the arts loaded from files without opening their files."""
+import json
+import os
+
+_VERSION = 1
+
+class Manifest:
+    """
+    The Manifest records the size of the images, the list of files of the folders and the durations of the animated files.
+    The arts created from a path present in the manifest do not read their file before being loaded.
+    When the file has been modified since the manifest was written, the entry is ignored when the art is loaded.
+    Manifests are written by write_manifest.
+
+    Example:
+    ----
+    - ``write_manifest("assets/manifest.json", ["assets/hero.gif", "assets/coins/", "assets/background.png"])`` writes a manifest,
+    during the build of the game.
+    - ``manifest.open("assets/manifest.json")`` uses it, it must be opened before the creation of the arts.
+    """
+
+    def __init__(self, path: str = None) -> None:
+        """
+        Create a Manifest.
+
+        Params:
+        ----
+        - path: str = None, the path to a manifest file. If None, the manifest is empty.
+        """
+        self._entries: dict[str, dict] = {}
+        if path is not None:
+            self.open(path)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, path: str):
+        return os.path.normpath(path) in self._entries
+
+    def open(self, path: str):
+        """Add the entries of a manifest file. The paths of the entries are the paths given to write_manifest."""
+        with open(path, 'r', encoding='utf-8') as file:
+            description = json.load(file)
+        if description.get('version') != _VERSION:
+            return # Manifests written by other versions are ignored, the files are read instead.
+        self._entries.update(description['entries'])
+
+    def entry(self, path: str) -> dict | None:
+        """Return the entry of a path, or None if there is none."""
+        return self._entries.get(os.path.normpath(path))
+
+    @staticmethod
+    def is_fresh(entry: dict, path: str) -> bool:
+        """Return True if the file or folder has not been modified since the entry was written."""
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return False
+        return stat.st_mtime_ns == entry['mtime_ns'] and ('files' in entry or stat.st_size == entry['bytes'])
+
+    def clear(self):
+        """Remove all the entries."""
+        self._entries.clear()
+
+def write_manifest_entries(path: str, entries: dict[str, dict]):
+    """Write the entries of a manifest file. Use write_manifest to create the entries from the files."""
+    with open(path + '.tmp', 'w', encoding='utf-8') as file:
+        json.dump({'version': _VERSION, 'entries': entries}, file)
+    os.replace(path + '.tmp', path)
+
+manifest = Manifest()
@@ -0,0 +1,141 @@
+"""The memory module contains the memory manager, used to keep the memory used by the loaded arts under a budget."""
+from collections import OrderedDict
+from threading import RLock, current_thread, main_thread
+from weakref import ref
+from typing import Iterable
+from pygame import Surface
+
+def root_surface(surf: Surface) -> Surface:
+    """Return the surface owning the pixels of a surface: its parent if it is a subsurface, else the surface itself."""
+    while surf.get_parent() is not None:
+        surf = surf.get_parent()
+    return surf
+
+def surfaces_bytesize(surfaces: Iterable[Surface]) -> int:
+    """
+    Return the number of bytes used by the pixels of the surfaces.
+    Subsurfaces share the pixels of their parent, so the parent is counted instead, only once.
+    """
+    roots: dict[int, Surface] = {}
+    for surf in surfaces:
+        surf = root_surface(surf)
+        roots[id(surf)] = surf
+    return sum(surf.get_pitch()*surf.get_height() for surf in roots.values())
+
+class MemoryManager:
+    """
+    The MemoryManager keeps track of the memory used by the surfaces of every loaded art.
+    If a budget is set, the least recently used arts are unloaded when the budget is exceeded.
+    Permanent arts are never unloaded by the manager. Unloaded arts are loaded again at their next .get(),
+    and the transformations applied to them since their loading are applied again. These transformations are recorded only while a budget is set:
+    an art transformed while there is no budget is not unloaded by the manager until it is loaded again.
+    Arts are only unloaded by the main thread, while it is not using them: when the budget is exceeded by an art loaded or transformed
+    in the background, the arts are unloaded at the next .get() or .update() of an art on the main thread.
+
+    Example:
+    ----
+    - ``memory_manager.budget = 512*2**20`` limits the memory used by the surfaces of the arts to 512 MiB.
+    - ``memory_manager.budget = None`` disables the limit.
+    """
+
+    def __init__(self, budget: int = None) -> None:
+        """
+        Create a memory manager.
+
+        Params:
+        ----
+        - budget: int = None, the number of bytes the surfaces of the loaded arts can use. If None, there is no limit.
+        """
+        self.budget = budget
+        self._arts: OrderedDict[int, tuple[ref, int]] = OrderedDict()
+        self._usage = 0
+        self._lock = RLock()
+        self._deferred = False # True if the budget has been exceeded by another thread than the main thread.
+
+    @property
+    def usage(self) -> int:
+        """Return the number of bytes used by the surfaces of the loaded arts."""
+        return self._usage
+
+    def __len__(self):
+        return len(self._arts)
+
+    def register(self, art) -> None:
+        """Register a loaded art or update its size, and mark it as the most recently used art."""
+        size = art.bytesize
+        with self._lock:
+            key = id(art)
+            if key in self._arts:
+                self._usage -= self._arts[key][1]
+            self._arts[key] = (ref(art, lambda _, key=key: self._discard(key)), size)
+            self._arts.move_to_end(key)
+            self._usage += size
+
+    def resize(self, art) -> None:
+        """
+        Update the size of a registered art whose frames are decoded after its loading, without marking it as used.
+        If the budget is exceeded, the arts are unloaded at the next .get() or .update() of an art on the main thread.
+        """
+        size = art.bytesize
+        with self._lock:
+            key = id(art)
+            if key not in self._arts:
+                return
+            art_ref, previous = self._arts[key]
+            self._arts[key] = (art_ref, size) # The art keeps its place in the order of use.
+            self._usage += size - previous
+            if self.budget is not None and self._usage > self.budget:
+                self._deferred = True
+
+    def touch(self, art) -> None:
+        """Mark an art as the most recently used art."""
+        with self._lock:
+            if id(art) in self._arts:
+                self._arts.move_to_end(id(art))
+
+    def forget(self, art) -> None:
+        """Stop tracking an art, because it has been unloaded."""
+        self._discard(id(art))
+
+    def _discard(self, key: int) -> None:
+        with self._lock:
+            if key in self._arts:
+                self._usage -= self._arts.pop(key)[1]
+
+    def enforce(self, keep=None) -> None:
+        """
+        Unload the least recently used arts until the usage is under the budget.
+
+        Params:
+        ----
+        - keep: Art = None, an art that must not be unloaded, for example the art that is being loaded.
+        """
+        if self.budget is None or self._usage <= self.budget:
+            return
+        if current_thread() is not main_thread(): # The main thread might be using the arts that would be unloaded.
+            self._deferred = True
+            return
+        self._deferred = False
+        # The original of a copy or a reference has just been used to load it, it is kept too.
+        kept = (keep, getattr(keep, '_original', None))
+        victims = []
+        with self._lock:
+            usage = self._usage
+            for art_ref, size in self._arts.values():
+                if usage <= self.budget:
+                    break
+                art = art_ref()
+                if art is None or size == 0 or not art._is_evictable() or any(art is kept_art for kept_art in kept):
+                    continue
+                victims.append(art)
+                usage -= size
+        # The arts are unloaded outside of the lock as unloading may wait for a transformation thread.
+        for art in victims:
+            art._evict()
+
+    def enforce_deferred(self, keep=None) -> None:
+        """Unload the arts that could not be unloaded by another thread than the main thread. Called by the arts on the main thread."""
+        if self._deferred and current_thread() is main_thread():
+            self.enforce(keep)
+
+memory_manager = MemoryManager()
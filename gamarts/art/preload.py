@@ -0,0 +1,130 @@
+"""The preload module contains the Preloader, used to load arts in the background."""
+from concurrent.futures import Future, wait
+import asyncio
+from functools import partial
+from typing import Hashable
+from pygame import Surface
+from .._workers import WorkerPool
+
+class Preloader:
+    """
+    The Preloader loads arts in the background, on the threads of the thread budget, by order of priority.
+    While an art is being preloaded, its .get() returns the placeholder instead of loading it on the calling thread.
+    Arts can be gathered in groups, to wait for or follow the loading of a whole scene.
+
+    Example:
+    ----
+    - ``preloader.preload(*level_arts, group="level 2", **ld_kwargs)`` starts the loading of all the arts of the level 2.
+    - ``preloader.progress("level 2")`` returns the proportion of these arts already loaded.
+    - ``preloader.wait_group("level 2")`` waits for all of them to be loaded.
+    """
+
+    def __init__(self, workers: int = None, placeholder: Surface = None) -> None:
+        """
+        Create a Preloader.
+
+        Params:
+        ----
+        - workers: int = None, the maximum number of arts loaded at once, by the threads of the thread budget. If None, it is only limited by the budget.
+        - placeholder: pygame.Surface = None, the surface returned by the .get() of the arts being preloaded.
+        If None, .get() waits for the art to be loaded.
+        """
+        self.placeholder = placeholder
+        self._pool = WorkerPool(workers, "gamarts-preloader")
+        self._groups: dict[Hashable, list] = {}
+
+    def preload(self, *arts, priority: int = 0, group: Hashable = None, placeholder: Surface = None, **ld_kwargs) -> list[Future]:
+        """
+        Schedule the loading of arts.
+
+        Params:
+        ----
+        - *arts: Art, the arts to load.
+        - priority: int = 0, arts with higher priorities are loaded first.
+        - group: Hashable = None, if specified, the arts are added to this group.
+        - placeholder: pygame.Surface = None, the surface returned by the .get() of these arts while they are being loaded.
+        If None, the placeholder of the preloader is used.
+        - **ld_kwargs: the loading kwargs.
+
+        Returns:
+        ----
+        - futures: list[concurrent.futures.Future], the futures of the loading of each art.
+        """
+        futures = []
+        for art in arts:
+            if art.is_loaded():
+                future = Future()
+                future.set_result(None)
+            elif art._preloading is not None and not art._preloading.done():
+                future = art._preloading
+            else:
+                future = self._pool.submit(partial(art.load, **ld_kwargs), priority=priority)
+                art._preloading = future
+            art._placeholder = placeholder if placeholder is not None else self.placeholder
+            futures.append(future)
+        if group is not None:
+            self._groups.setdefault(group, []).extend(arts)
+        return futures
+
+    def is_done(self, art) -> bool:
+        """Return True if the art is not being preloaded anymore."""
+        return art._preloading is None or art._preloading.done()
+
+    def wait(self, *arts, timeout: float = None) -> bool:
+        """
+        Wait for the preloading of the arts to be done.
+
+        Params:
+        ----
+        - *arts: Art, the arts to wait for.
+        - timeout: float = None, the maximum time to wait, in seconds.
+
+        Returns:
+        ----
+        - done: bool, True if all the arts are preloaded.
+        """
+        futures = [art._preloading for art in arts if art._preloading is not None]
+        _, not_done = wait(futures, timeout)
+        return not not_done
+
+    def wait_group(self, group: Hashable, timeout: float = None) -> bool:
+        """Wait for the preloading of all the arts of a group to be done. Return True if they are all preloaded."""
+        return self.wait(*self._groups.get(group, ()), timeout=timeout)
+
+    def progress(self, group: Hashable) -> float:
+        """Return the proportion of the arts of the group whose preloading is done."""
+        arts = self._groups.get(group, ())
+        if not arts:
+            return 1.
+        return sum(self.is_done(art) for art in arts)/len(arts)
+
+    def forget_group(self, group: Hashable):
+        """Remove a group from the preloader. The preloading of its arts is not stopped."""
+        self._groups.pop(group, None)
+
+preloader = Preloader()
+
+async def gather_load(*arts, limit: int = None, **ld_kwargs):
+    """
+    Load arts without blocking the event loop. The arts are loaded in the background by the preloader.
+
+    Params:
+    ----
+    - *arts: Art, the arts to load.
+    - limit: int = None, the maximum number of arts loaded at once. If None, it is only limited by the number of workers of the preloader.
+    - **ld_kwargs: the loading kwargs.
+
+    Example:
+    ----
+    - ``await gather_load(*level_arts, limit=16, **ld_kwargs)`` loads all the arts of a level, 16 at a time.
+    """
+    if limit is None:
+        await asyncio.gather(*(art.aload(**ld_kwargs) for art in arts))
+        return
+    semaphore = asyncio.Semaphore(limit)
+
+    async def load(art):
+        async with semaphore:
+            await art.aload(**ld_kwargs)
+
+    await asyncio.gather(*(load(art) for art in arts))
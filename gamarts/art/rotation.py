@@ -0,0 +1,141 @@
+"""The rotation module contains the RotationCache, storing the rotated frames of an art displayed at any angle."""
+from collections import OrderedDict
+from concurrent.futures import Future
+from threading import Lock
+from typing import Hashable, Iterable
+import pygame.transform as tf
+from pygame import Surface
+from .art import Art
+from .memory import surfaces_bytesize
+from .._workers import WorkerPool
+
+_renderer = WorkerPool(None, "gamarts-rotation")
+
+class RotationCache:
+    """
+    The RotationCache stores the frames of an art rotated, and optionally zoomed, at a fixed number of angles.
+    Sprites rotated every frame, like a ship facing the mouse, are displayed with a dictionary lookup instead of a rotation of their frames.
+    The angles are rounded to the nearest of the angle steps, frames are rotated at their first use or rendered in advance in the background,
+    and the least recently used rotated frames are removed when the size of the stored frames exceeds the budget.
+    The rotated frames are as large as needed to contain the rotated art: they should be blitted from their center.
+
+    Example:
+    ----
+    - ``ship_rotations = RotationCache(ship, steps=72)`` stores the frames of ship rotated by multiples of 5°.
+    - ``ship_rotations.prerender()`` rotates them in the background.
+    - ``surf = ship_rotations.get(angle, **ld_kwargs)`` returns the current frame of ship, rotated by the nearest multiple of 5° to angle,
+    to be blitted at ``surf.get_rect(center=ship_center)``.
+    """
+
+    def __init__(self, art: Art, steps: int = 64, smooth: bool = False, budget: int = 64*2**20) -> None:
+        """
+        Create a RotationCache.
+
+        Params:
+        ----
+        - art: Art, the art to rotate. Its frames, and the frames of its transformations, are rotated when they are displayed.
+        - steps: int = 64, the number of angles in a full turn.
+        - smooth: bool = False, whether the frames are rotated like pygame.transform.rotozoom, with a smoothing, or like pygame.transform.rotate.
+        Zoomed frames are always smoothed.
+        - budget: int = 64 MiB, the number of bytes the rotated frames can use.
+        """
+        if steps <= 0:
+            raise ValueError(f"The number of steps must be positive, got {steps}.")
+        self.art = art
+        self.steps = steps
+        self.smooth = smooth
+        self.budget = budget
+        # The frames are stored with their source frame, which is kept alive as long as its id is a part of a key.
+        self._entries: OrderedDict[Hashable, tuple[Surface, Surface, int]] = OrderedDict()
+        self._usage = 0
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def usage(self) -> int:
+        """Return the number of bytes used by the rotated frames."""
+        return self._usage
+
+    def __len__(self):
+        return len(self._entries)
+
+    def step_of(self, angle: float) -> int:
+        """Return the index of the angle step nearest to an angle, in degrees."""
+        return round(angle*self.steps/360) % self.steps
+
+    def _render(self, frame: Surface, step: int, scale: float) -> Surface:
+        angle = step*360/self.steps
+        if scale != 1 or self.smooth:
+            return tf.rotozoom(frame, angle, scale)
+        return tf.rotate(frame, angle)
+
+    def _rotated(self, frame: Surface, step: int, scale: float) -> Surface:
+        """Return a frame rotated to an angle step, from the cache or rendered now."""
+        key = (id(frame), step, scale)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+        rotated = self._render(frame, step, scale)
+        self._put(key, frame, rotated)
+        return rotated
+
+    def _put(self, key: Hashable, frame: Surface, rotated: Surface):
+        size = surfaces_bytesize((rotated,))
+        with self._lock:
+            if key in self._entries or size > self.budget: # The frame might have been rendered by another thread in the meantime.
+                return
+            while self._entries and self._usage + size > self.budget:
+                _, (_, _, evicted_size) = self._entries.popitem(last=False)
+                self._usage -= evicted_size
+            self._entries[key] = (frame, rotated, size)
+            self._usage += size
+
+    def get(self, angle: float, scale: float = 1, match: Art = None, **ld_kwargs) -> Surface:
+        """
+        Return the current frame of the art, rotated by the angle step nearest to an angle.
+
+        Params:
+        ----
+        - angle: float, the angle to counterclockwise rotate the art, in degrees.
+        - scale: float = 1, the scale of the zoom applied with the rotation. Each scale is stored separately.
+        - match: Art = None, passed to the get of the art.
+        - **ld_kwargs: the loading kwargs.
+        """
+        return self._rotated(self.art.get(match, **ld_kwargs), self.step_of(angle), scale)
+
+    def prerender(self, angles: Iterable[float] = None, scale: float = 1, **ld_kwargs) -> Future:
+        """
+        Rotate all the frames of the art, at all the angle steps or at some angles, in the background.
+        The art is loaded now if needed. The rotated frames exceeding the budget are not kept.
+
+        Params:
+        ----
+        - angles: Iterable[float] = None, the angles to render, rounded to the nearest steps. If None, all the steps are rendered.
+        - scale: float = 1, the scale of the zoom applied with the rotation.
+        - **ld_kwargs: the loading kwargs.
+
+        Returns:
+        ----
+        - future: concurrent.futures.Future, done when all the frames have been rotated.
+        """
+        if not self.art.is_loaded():
+            self.art.load(**ld_kwargs)
+        frames = tuple(self.art.surfaces)
+        steps = range(self.steps) if angles is None else sorted({self.step_of(angle) for angle in angles})
+        return _renderer.submit(self._render_all, frames, steps, scale)
+
+    def _render_all(self, frames: tuple[Surface], steps: Iterable[int], scale: float):
+        for step in steps:
+            for frame in frames:
+                self._rotated(frame, step, scale)
+
+    def clear(self):
+        """Remove all the rotated frames."""
+        with self._lock:
+            self._entries.clear()
+            self._usage = 0
@@ -0,0 +1,102 @@
+"""The save module contains the functions used to save the frames of the arts as images and animations, encoded in the background."""
+from concurrent.futures import Future
+from threading import Lock
+from typing import Sequence
+import os
+from PIL import Image
+from pygame import Surface
+from pygame.image import tobytes
+from .._raw import surface_format
+from .._workers import WorkerPool
+
+_encoder = WorkerPool(None, "gamarts-encoder")
+
+_ANIMATED_FORMATS = ('GIF', 'WEBP', 'PNG')
+_OPAQUE_FORMATS = ('JPEG', 'BMP', 'PPM', 'PCX', 'EPS') # Formats that cannot store an alpha channel.
+
+def _snapshot(surf: Surface) -> tuple[bytes, tuple[int, int], str]:
+    """
+    Return the pixels of a surface in its own layout, to be converted in the background.
+    The pixels are copied once: the surfaces cannot be read by another thread, as they would be locked during the blits of the game.
+    """
+    fmt = surface_format(surf)
+    return tobytes(surf, fmt), surf.get_size(), fmt
+
+def _to_image(snapshot: tuple[bytes, tuple[int, int], str]) -> Image.Image:
+    """Return a PIL image reading the pixels of a snapshot."""
+    data, size, fmt = snapshot
+    if fmt == 'BGRA':
+        return Image.frombuffer('RGBA', size, data, 'raw', 'BGRA', 0, 1)
+    return Image.frombytes('RGB', size, data, 'raw', 'RGBX')
+
+def _encode_image(path: str, snapshot, options: dict):
+    image = _to_image(snapshot)
+    if Image.registered_extensions().get(os.path.splitext(path)[1].lower()) in _OPAQUE_FORMATS and image.mode == 'RGBA':
+        image = image.convert('RGB')
+    image.save(path, **options)
+
+def _encode_animation(path: str, fmt: str, snapshots: list, durations: list[int], options: dict):
+    images = [_to_image(snapshot) for snapshot in snapshots]
+    if fmt == 'GIF':
+        # Transparent pixels are kept as the transparent color of the palette, and the frames are replaced, not drawn over the previous ones.
+        # Pillow only stores the region of each frame that differs from the previous one, for gifs as for pngs.
+        options = {'optimize': True, 'disposal': 2, **options}
+    images[0].save(path, format=fmt, save_all=True, append_images=images[1:], duration=durations, loop=0, **options)
+
+def _gather(futures: list[Future]) -> Future:
+    """Return a future done when all the futures are done, failing with the first error."""
+    gathered = Future()
+    remaining = [len(futures)]
+    lock = Lock()
+
+    def on_done(future: Future):
+        with lock:
+            remaining[0] -= 1
+            if gathered.done():
+                return
+            if future.exception() is not None:
+                gathered.set_exception(future.exception())
+            elif remaining[0] == 0:
+                gathered.set_result(None)
+
+    if not futures:
+        gathered.set_result(None)
+    for future in futures:
+        future.add_done_callback(on_done)
+    return gathered
+
+def save_frames(path: str, surfaces: Sequence[Surface], durations: Sequence[int], **options) -> Future:
+    """
+    Save frames as an image, an animation or a sequence of images. The pixels are copied on the calling thread, and the frames are
+    converted and encoded in the background.
+
+    The format is given by the extension of the path:
+    - one frame is saved as an image, in any format supported by Pillow.
+    - .gif, .webp and .png paths with several frames are saved as animations. Animated webps and pngs keep the alpha channel.
+    Other paths with several frames are saved as gifs.
+    - paths containing a format field, like "frames/walk_{:03d}.png", save every frame as an image, with its index in the path.
+    The images are encoded in parallel.
+
+    Params:
+    ----
+    - path: str, the path to the file.
+    - surfaces: Sequence[Surface], the frames.
+    - durations: Sequence[int], the duration of each frame, for animations.
+    - **options: the options given to Pillow to encode the images, like quality or lossless for webps.
+
+    Returns:
+    ----
+    - future: concurrent.futures.Future, the future of the encoding. ``future.result()`` waits for the file to be written.
+    """
+    snapshots: dict[int, tuple] = {}
+    for surf in surfaces:
+        if id(surf) not in snapshots: # A frame present several times is copied once.
+            snapshots[id(surf)] = _snapshot(surf)
+    frames = [snapshots[id(surf)] for surf in surfaces]
+
+    if '{' in path:
+        return _gather([_encoder.submit(_encode_image, path.format(index), frame, options) for index, frame in enumerate(frames)])
+    if len(frames) == 1:
+        return _encoder.submit(_encode_image, path, frames[0], options)
+    fmt = Image.registered_extensions().get(os.path.splitext(path)[1].lower())
+    return _encoder.submit(_encode_animation, path, fmt if fmt in _ANIMATED_FORMATS else 'GIF', frames, list(durations), options)
@@ -0,0 +1,186 @@
+"""The stream module contains the StreamArt, an Art displaying frames produced on the fly."""
+from collections import deque
+from concurrent.futures import Future, wait
+from threading import Lock
+from typing import Callable, Iterable
+from pygame import Surface
+from .art import Art, _apply_framewise
+from .memory import memory_manager, surfaces_bytesize
+from .._common import LoadingError
+from .._workers import WorkerPool
+from ..transform import Transformation, optimizer
+
+_producer = WorkerPool(None, "gamarts-stream")
+
+def _check_framewise(transformation: Transformation):
+    if not all(step.framewise for step in transformation.steps()):
+        raise ValueError("Only the transformations applied frame by frame can be applied to a StreamArt.")
+
+class StreamArt(Art):
+    """
+    A StreamArt is an Art displaying frames produced on the fly by an iterator or a function, like the frames of a replay renderer
+    or of a video read from a pipe. Only the displayed frame and a bounded buffer of the next frames are kept in memory,
+    the next frames being produced in the background. The animation is updated like any other art.
+    If the next frame is not produced in time, the current frame stays displayed. At the end of the stream, the last frame stays displayed.
+    Only the transformations applied frame by frame can be applied to a StreamArt. Copies of a StreamArt display its frame at the time of their loading.
+    A StreamArt and its references cannot be members of an ArtGroup.
+
+    Example:
+    ----
+    - ``StreamArt(((render(state), 16) for state in replay), (640, 360))`` is an Art displaying the frames rendered from a replay, 16 ms each.
+    - ``StreamArt(camera.read_frame, (320, 240), buffer_size=2)`` is an Art displaying the frames returned by a function,
+    which returns pairs (surface, duration), or None at the end of the stream.
+    """
+
+    _groupable = False # The frames are not known in advance, the animation is updated by the .update() of the art.
+
+    def __init__(
+        self,
+        source: Iterable[tuple[Surface, int]] | Callable[[], tuple[Surface, int] | None],
+        size: tuple[int, int],
+        buffer_size: int = 8,
+        transformation: Transformation = None,
+        permanent: bool = False,
+    ) -> None:
+        """
+        A StreamArt is an Art displaying frames produced on the fly.
+
+        Params:
+        ----
+        - source: Iterable[tuple[Surface, int]] | Callable[[], tuple[Surface, int] | None], the iterable of the pairs (frame, duration),
+        or the function returning the next pair, or None at the end of the stream. It is used by one thread at a time.
+        When the art is unloaded and loaded again, the stream continues from where it stopped.
+        - size: tuple[int, int], the size of the frames.
+        - buffer_size: int = 8, the number of frames produced in advance.
+        - transformation: transform.Transformation = None. Any transformation (or Pipeline) that will be applied to the frames.
+        It must be applied frame by frame.
+        - permanent: bool = False. If True, the art is never unloaded by the memory manager.
+        """
+        if transformation is not None:
+            _check_framewise(transformation)
+        super().__init__(transformation, permanent)
+        self._source = source
+        self._iterator = None
+        self.buffer_size = buffer_size
+        self._width, self._height = size
+        self._buffer: deque[tuple[Surface, int, int]] = deque() # The produced frames, their durations and the number of steps applied to them.
+        self._buffer_lock = Lock()
+        self._production: Future = None
+        self._stopped = True
+        self._exhausted = False
+        self._error: Exception = None
+        self._frame_steps: list[Transformation] = [] # The transformations applied to every frame since the loading.
+        self._ld_kwargs = {}
+        self._find_initial_dimension()
+
+    def _next_frame(self) -> tuple[Surface, int] | None:
+        """Return the next pair of the source, or None at the end of the stream."""
+        if callable(self._source):
+            return self._source()
+        if self._iterator is None:
+            self._iterator = iter(self._source)
+        return next(self._iterator, None)
+
+    def _apply_steps(self, steps: list[Transformation], surf: Surface) -> Surface:
+        if any(step.in_place for step in steps): # The source might reuse its surfaces.
+            surf = surf.copy()
+        return _apply_framewise(tuple(steps), *surf.get_size(), self._ld_kwargs, surf)
+
+    def _produce(self):
+        with self._buffer_lock:
+            steps = list(self._frame_steps)
+        try:
+            frame = self._next_frame()
+            if frame is not None:
+                surf, duration = frame
+                frame = (self._apply_steps(steps, surf) if steps else surf, duration, len(steps))
+        except Exception as error: # The error is raised by the next update.
+            with self._buffer_lock:
+                self._production = None
+                self._error = error
+            return
+        with self._buffer_lock:
+            self._production = None
+            if self._stopped:
+                return
+            if frame is None:
+                self._exhausted = True
+                return
+            self._buffer.append(frame)
+        self._fill()
+
+    def _fill(self):
+        """Produce the next frame in the background, if the buffer is not full."""
+        with self._buffer_lock:
+            if (
+                self._production is None and self._error is None and not self._stopped and not self._exhausted
+                and len(self._buffer) < self.buffer_size
+            ):
+                self._production = _producer.submit(self._produce)
+
+    def _load(self, **ld_kwargs):
+        self._ld_kwargs = ld_kwargs
+        frame = self._next_frame()
+        if frame is None:
+            raise LoadingError("The stream of this StreamArt is empty.")
+        self._surfaces, self._durations = (frame[0],), (frame[1],)
+        self._width, self._height = frame[0].get_size()
+        with self._buffer_lock:
+            self._stopped = False
+            self._exhausted = False
+        self._fill()
+
+    def transform(self, transformation: Transformation):
+        _check_framewise(transformation)
+        super().transform(transformation)
+
+    def _transform(self, transformation: Transformation, **ld_kwargs):
+        steps = optimizer.optimize(transformation.steps(), self._width, self._height)
+        with self._buffer_lock:
+            self._frame_steps.extend(steps)
+            surf = self._apply_steps(steps, self._surfaces[0])
+            self._surfaces = (surf,)
+            self._width, self._height = surf.get_size()
+        self._has_changed = True
+        for reference in self._references:
+            reference._has_changed = True
+
+    def update(self, loop_duration: float) -> bool:
+        memory_manager.enforce_deferred()
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+        if self._loaded:
+            self._time_since_last_change += loop_duration
+            with self._buffer_lock:
+                while self._buffer and self._time_since_last_change >= self._durations[0]:
+                    self._time_since_last_change -= self._durations[0]
+                    surf, duration, applied = self._buffer.popleft()
+                    if applied < len(self._frame_steps): # The frame was produced before the last transformations.
+                        surf = self._apply_steps(self._frame_steps[applied:], surf)
+                    self._surfaces, self._durations = (surf,), (duration,)
+                    self._has_changed = True
+                # A late frame is displayed for its whole duration when it arrives, instead of being skipped.
+                self._time_since_last_change = min(self._time_since_last_change, self._durations[0])
+            self._fill()
+        has_changed = self._has_changed
+        self._has_changed = False
+        return has_changed
+
+    @property
+    def bytesize(self) -> int:
+        with self._buffer_lock:
+            buffered = tuple(surf for surf, _, _ in self._buffer)
+        return surfaces_bytesize(self._surfaces + buffered)
+
+    def unload(self):
+        with self._buffer_lock:
+            self._stopped = True
+            self._buffer.clear()
+            production = self._production
+        if production is not None and not production.cancel(): # The source must not be used by two threads at once.
+            wait((production,))
+        with self._buffer_lock:
+            self._production = None
+        self._frame_steps.clear()
+        super().unload()
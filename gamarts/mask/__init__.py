@@ -8,8 +8,22 @@ The fourth one is composed of masks extracted from arts or from images.
 The fifth one is combinations or transformation of other masks.
 The last one is moving masks.
 """
-from .mask import Mask, MatrixMask, SumOfMasks, ProductOfMasks, AverageOfMasks, DifferenceOfMasks, DivisionOfMasks, ModulusOfMasks, BlitMaskOnMask
-from .transformation import (
-    FromArtAlpha, FromArtColor, FromImageColor, BinaryMask, InvertedMask, TransformedMask
-)
-from .geometry import Circle, GradientCircle, Ellipse, Rectangle, RoundedRectangle, GradientRectangle, Polygon
+from typing import TYPE_CHECKING
+from .._lazy import lazy_exports
+
+# The submodules are imported at the first access to one of their masks.
+__getattr__, __dir__, __all__ = lazy_exports(__name__, {
+    '.mask': (
+        'Mask', 'MatrixMask', 'SumOfMasks', 'ProductOfMasks', 'AverageOfMasks', 'DifferenceOfMasks', 'DivisionOfMasks', 'ModulusOfMasks',
+        'BlitMaskOnMask'
+    ),
+    '.transformation': ('FromArtAlpha', 'FromArtColor', 'FromImageColor', 'BinaryMask', 'InvertedMask', 'TransformedMask'),
+    '.geometry': ('Circle', 'GradientCircle', 'Ellipse', 'Rectangle', 'RoundedRectangle', 'GradientRectangle', 'Polygon'),
+})
+
+if TYPE_CHECKING:
+    from .mask import Mask, MatrixMask, SumOfMasks, ProductOfMasks, AverageOfMasks, DifferenceOfMasks, DivisionOfMasks, ModulusOfMasks, BlitMaskOnMask
+    from .transformation import (
+        FromArtAlpha, FromArtColor, FromImageColor, BinaryMask, InvertedMask, TransformedMask
+    )
+    from .geometry import Circle, GradientCircle, Ellipse, Rectangle, RoundedRectangle, GradientRectangle, Polygon
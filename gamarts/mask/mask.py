@@ -2,7 +2,7 @@
 from abc import ABC, abstractmethod
 import numpy as np
 from typing import Sequence, Union
-from .._common import LoadingError
+from .._common import LoadingError, fingerprint_attributes
 
 class Mask(ABC):
     """Mask is an abstract class for all masks."""
@@ -38,6 +38,10 @@ class Mask(ABC):
         """Return True if the mask is loaded, False otherwise."""
         return self._loaded
 
+    def fingerprint(self):
+        """Return a hashable value identifying the mask, or None if the matrix of the mask cannot be predicted from its attributes."""
+        return fingerprint_attributes(self, exclude=('matrix', '_loaded'))
+
     def not_null_columns(self):
         """
         Return the list of indices of the columns that have at least one value different from 0.
@@ -1,11 +1,39 @@
 """The transform module contiains all the transformations that can be applied to an Art."""
-from .combination import Blit, Average, Concatenate
-from .transformation import (
-    Transformation, Pipeline,
-    SetIntroductionIndex, SetIntroductionTime, SlowDown, SpeedUp, SetDurations,
-    Resize, Rotate, Crop, VerticalChop, HorizontalChop, Last, ExtractSlice, ExtractOne, First, Flip, Transpose,
-    Zoom, Pad, ExtractTime, ExtractWindow
-)
-from .drawing import DrawArc, DrawCircle, DrawEllipse, DrawLine, DrawLines, DrawPie, DrawPolygon, DrawRectangle, DrawRoundedRectangle
-from .effect import Saturate, Darken, Lighten, Desaturate, SetAlpha, ShiftHue, Gamma, AdjustContrast, RBGMap, RGBAMap, Invert, AddBrightness
-from .convert import GrayScale, ConvertRGB, ConvertRGBA
+from typing import TYPE_CHECKING
+from .._lazy import lazy_exports
+
+# The submodules are imported at the first access to one of their transformations.
+__getattr__, __dir__, __all__ = lazy_exports(__name__, {
+    '.combination': ('Blit', 'Average', 'Concatenate'),
+    '.transformation': (
+        'Transformation', 'Pipeline',
+        'SetIntroductionIndex', 'SetIntroductionTime', 'SlowDown', 'SpeedUp', 'SetDurations',
+        'Resize', 'Rotate', 'RotoZoom', 'Crop', 'VerticalChop', 'HorizontalChop', 'Last', 'ExtractSlice', 'ExtractOne', 'First', 'Flip', 'Transpose',
+        'Zoom', 'Pad', 'ExtractTime', 'ExtractWindow'
+    ),
+    '.drawing': (
+        'DrawArc', 'DrawCircle', 'DrawEllipse', 'DrawLine', 'DrawLines', 'DrawPie', 'DrawPolygon', 'DrawRectangle', 'DrawRoundedRectangle'
+    ),
+    '.effect': (
+        'Saturate', 'Darken', 'Lighten', 'Desaturate', 'SetAlpha', 'ShiftHue', 'Gamma', 'AdjustContrast', 'RBGMap', 'RGBAMap', 'Invert', 'AddBrightness'
+    ),
+    '.convert': ('GrayScale', 'ConvertRGB', 'ConvertRGBA'),
+    '.calibration': ('CostModel', 'cost_model'),
+    '.optimization': ('Optimizer', 'optimizer'),
+    '.mipmap': ('MipMaps', 'mipmaps'),
+})
+
+if TYPE_CHECKING:
+    from .combination import Blit, Average, Concatenate
+    from .transformation import (
+        Transformation, Pipeline,
+        SetIntroductionIndex, SetIntroductionTime, SlowDown, SpeedUp, SetDurations,
+        Resize, Rotate, RotoZoom, Crop, VerticalChop, HorizontalChop, Last, ExtractSlice, ExtractOne, First, Flip, Transpose,
+        Zoom, Pad, ExtractTime, ExtractWindow
+    )
+    from .drawing import DrawArc, DrawCircle, DrawEllipse, DrawLine, DrawLines, DrawPie, DrawPolygon, DrawRectangle, DrawRoundedRectangle
+    from .effect import Saturate, Darken, Lighten, Desaturate, SetAlpha, ShiftHue, Gamma, AdjustContrast, RBGMap, RGBAMap, Invert, AddBrightness
+    from .convert import GrayScale, ConvertRGB, ConvertRGBA
+    from .calibration import CostModel, cost_model
+    from .optimization import Optimizer, optimizer
+    from .mipmap import MipMaps, mipmaps
@@ -0,0 +1,102 @@
+"""The calibration module contains the CostModel, used to predict the duration of the transformations from measures."""
+from threading import Lock
+import json
+
+DEFAULT_COST_MODEL_PATH = "gamarts_costs.json"
+
+def _class_key(transformation) -> str:
+    cls = type(transformation)
+    return f"{cls.__module__}.{cls.__qualname__}"
+
+class CostModel:
+    """
+    The CostModel predicts the duration of the transformations, in milliseconds.
+
+    When calibrating, every transformation applied to an art is timed, and the duration is recorded alongside the number of pixels
+    transformed (width * height * number of frames). Calling .fit() computes, for each class of transformation, the coefficients of
+    the linear regression duration = intercept + slope * pixels. The coefficients can be saved in a file and loaded in the next runs.
+
+    Example:
+    ----
+    - ``cost_model.calibrating = True`` starts the calibration. Play the game, then
+    - ``cost_model.fit()`` and ``cost_model.save()`` to save the coefficients in 'gamarts_costs.json'.
+    - ``cost_model.load()`` loads them in the next runs. The 'time_threshold' entry of the ld_kwargs, in milliseconds,
+    is then used instead of the 'cost_threshold' to decide whether a transformation is computed in the background.
+    """
+
+    def __init__(self) -> None:
+        self.calibrating = False
+        self._samples: dict[str, list[tuple[int, float]]] = {}
+        self._coefficients: dict[str, tuple[float, float]] = {}
+        self._lock = Lock()
+
+    def record(self, transformation, width: int, height: int, length: int, duration: float):
+        """
+        Record the duration of a transformation.
+
+        Params:
+        ----
+        - transformation: Transformation, the transformation that has been applied.
+        - width, height, length: int, the dimensions and the number of frames of the art before the transformation.
+        - duration: float, the duration of the transformation, in milliseconds.
+        """
+        with self._lock:
+            self._samples.setdefault(_class_key(transformation), []).append((width*height*length, duration))
+
+    def fit(self) -> dict[str, tuple[float, float]]:
+        """
+        Compute the coefficients of each class of transformation from the recorded samples.
+
+        Returns:
+        ----
+        - coefficients: dict[str, tuple[float, float]], the intercept (in ms) and the slope (in ms per pixel) of each class.
+        """
+        with self._lock:
+            for key, samples in self._samples.items():
+                n = len(samples)
+                mean_x = sum(x for x, _ in samples)/n
+                mean_y = sum(y for _, y in samples)/n
+                var_x = sum((x - mean_x)**2 for x, _ in samples)
+                if var_x == 0: # All samples have the same number of pixels.
+                    slope = mean_y/mean_x if mean_x else 0.
+                    intercept = 0. if mean_x else mean_y
+                else:
+                    slope = sum((x - mean_x)*(y - mean_y) for x, y in samples)/var_x
+                    intercept = mean_y - slope*mean_x
+                    if intercept < 0: # Durations cannot be negative, fit without intercept instead.
+                        slope = sum(x*y for x, y in samples)/sum(x*x for x, _ in samples)
+                        intercept = 0.
+                self._coefficients[key] = (intercept, max(slope, 0.))
+            return dict(self._coefficients)
+
+    def is_calibrated(self, transformation) -> bool:
+        """Return True if the class of the transformation has coefficients."""
+        return _class_key(transformation) in self._coefficients
+
+    def predict(self, transformation, width: int, height: int, length: int) -> float | None:
+        """Return the predicted duration of the transformation in milliseconds, or None if its class has not been calibrated."""
+        coefficients = self._coefficients.get(_class_key(transformation))
+        if coefficients is None:
+            return None
+        intercept, slope = coefficients
+        return intercept + slope*width*height*length
+
+    def clear(self):
+        """Remove all the samples and coefficients."""
+        with self._lock:
+            self._samples.clear()
+            self._coefficients.clear()
+
+    def save(self, path: str = DEFAULT_COST_MODEL_PATH):
+        """Save the coefficients in a json file."""
+        with open(path, 'w', encoding='utf-8') as file:
+            json.dump({key: list(value) for key, value in self._coefficients.items()}, file, indent=1)
+
+    def load(self, path: str = DEFAULT_COST_MODEL_PATH):
+        """Load the coefficients from a json file. The coefficients already known are replaced."""
+        with open(path, 'r', encoding='utf-8') as file:
+            coefficients = json.load(file)
+        with self._lock:
+            self._coefficients.update({key: tuple(value) for key, value in coefficients.items()})
+
+cost_model = CostModel()
@@ -40,6 +40,10 @@ class Concatenate(Transformation):
 
         return surfaces, durations, introduction, None, width, height
 
+    def get_new_length(self, length):
+        # The other arts might not be loaded yet, their frames are not counted then.
+        return length + sum(len(other) for other in self.others)
+
 def _combine_arts(*durations: tuple[int], introduction: int) -> tuple[list[tuple[int, tuple[int]]], int]:
     """Combine a list of durations to create a new art."""
     indexes = [0 for _ in durations]
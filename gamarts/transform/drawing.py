@@ -8,6 +8,9 @@ from .._common import ColorValue
 class DrawCircle(Transformation):
     """Draw a circle on the art."""
 
+    in_place = True
+    framewise = True
+
     def __init__(
         self,
         color: ColorValue,
@@ -49,6 +52,10 @@ class DrawCircle(Transformation):
 
 class DrawRectangle(Transformation):
     """Draw a rectangle on the art."""
+
+    in_place = True
+    framewise = True
+
     def __init__(
         self,
         color: ColorValue,
@@ -86,6 +93,10 @@ class DrawRectangle(Transformation):
 
 class DrawRoundedRectangle(Transformation):
     """Draw a rectangle on the art, with rounded corners."""
+
+    in_place = True
+    framewise = True
+
     def __init__(
         self,
         color: ColorValue,
@@ -140,6 +151,9 @@ class DrawRoundedRectangle(Transformation):
 class DrawEllipse(Transformation):
     """Draw an ellipse on the art."""
 
+    in_place = True
+    framewise = True
+
     def __init__(
         self,
         color: ColorValue,
@@ -186,6 +200,9 @@ class DrawEllipse(Transformation):
 class DrawPolygon(Transformation):
     """Draw a polygon on the art."""
 
+    in_place = True
+    framewise = True
+
     def __init__(
         self,
         color: ColorValue,
@@ -228,6 +245,9 @@ class DrawPolygon(Transformation):
 class DrawLine(Transformation):
     """Draw one line on the art."""
 
+    in_place = True
+    framewise = True
+
     def __init__(self, color: ColorValue, p1: tuple[int, int], p2: tuple[int, int], thickness: int = 1, allow_antialias: bool = True) -> None:
         """
         Draw one line on the art.
@@ -266,6 +286,9 @@ class DrawLine(Transformation):
 class DrawLines(Transformation):
     """Draw lines on the art."""
 
+    in_place = True
+    framewise = True
+
     def __init__(self, color: ColorValue, points: Sequence[tuple[int, int]], thickness: int = 1, closed: bool = False, allow_antialias: bool = True) -> None:
         """
         Draw lines on the art. This is faster than drawing the lines one by one.
@@ -303,6 +326,9 @@ class DrawLines(Transformation):
 class DrawArc(Transformation):
     """Draw an arc on the art."""
 
+    in_place = True
+    framewise = True
+
     def __init__(
         self,
         color: ColorValue,
@@ -354,6 +380,9 @@ class DrawArc(Transformation):
 class DrawPie(Transformation):
     """Draw a pie on the art."""
 
+    in_place = True
+    framewise = True
+
     def __init__(
         self,
         color: ColorValue,
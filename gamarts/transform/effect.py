@@ -11,6 +11,9 @@ class SetAlpha(Transformation):
     The set alpha transformation is used to change the value of the alpha channel.
     """
 
+    in_place = True
+    framewise = True
+
     def __init__(self, alpha: int = None, mask: Mask = None) -> None:
         """
         If alpha is specified, the SetAlpha transformation replace the alpha value of all the pixel by a new value.
@@ -51,6 +54,9 @@ class SetAlpha(Transformation):
 class _MatrixTransformation(Transformation):
     """Matrix transformations are bases for all transformation transforming the matrix with an effect."""
 
+    in_place = True
+    framewise = True
+
     def __init__(self, mask: Mask | None = None):
         self.mask = mask
 
@@ -61,8 +67,8 @@ class _MatrixTransformation(Transformation):
         # If the mask is already loaded, we get the smallest submask.
         not_null_columns = self.mask.not_null_columns()
         not_null_rows = self.mask.not_null_rows()
-        if not_null_columns and not_null_rows:
-            return (not_null_columns[-1] - not_null_columns[0])*(not_null_rows[-1]*not_null_rows[0])*length
+        if len(not_null_columns) and len(not_null_rows):
+            return (not_null_columns[-1] - not_null_columns[0] + 1)*(not_null_rows[-1] - not_null_rows[0] + 1)*length
         return 0
 
 class RBGMap(_MatrixTransformation):
@@ -0,0 +1,101 @@
+"""The mipmap module contains the MipMaps, storing smaller versions of the frames to zoom them out faster and better."""
+from concurrent.futures import Future
+from threading import Lock
+from typing import Iterable
+from weakref import WeakKeyDictionary
+import pygame.transform as tf
+from pygame import Surface
+from .._workers import WorkerPool
+from ..art.memory import root_surface
+
+_builder = WorkerPool(None, "gamarts-mipmap")
+
+class MipMaps:
+    """
+    The MipMaps store a pyramid of levels for some frames: each level has half the width and half the height of the previous one.
+    A smooth Zoom or Resize of a frame having a pyramid scales the smallest level larger than the target size instead of the frame,
+    which is faster for large zoom outs and avoids the aliasing of downscales by large factors.
+    The pyramids are released with their frames. The pyramid of a frame must be built again if its pixels are modified,
+    which the arts do when they apply a transformation modifying the pixels of their frames.
+
+    Example:
+    ----
+    - ``background.build_mipmaps()`` builds the pyramids of the frames of an art in the background.
+    - ``mipmaps.build(surfaces)`` does the same for any surfaces.
+    """
+
+    def __init__(self, min_size: int = 8) -> None:
+        """
+        Create MipMaps.
+
+        Params:
+        ----
+        - min_size: int = 8, the levels are built until their width or height is smaller than this size.
+        """
+        self.min_size = min_size
+        self._levels: WeakKeyDictionary[Surface, tuple[Surface]] = WeakKeyDictionary()
+        self._lock = Lock()
+
+    def __len__(self):
+        return len(self._levels)
+
+    def __contains__(self, surf: Surface):
+        with self._lock:
+            return surf in self._levels
+
+    def levels(self, surf: Surface) -> tuple[Surface]:
+        """Return the levels of the pyramid of a frame, the largest first, without the frame itself. The tuple is empty if there is no pyramid."""
+        with self._lock:
+            return self._levels.get(surf, ())
+
+    def _build_one(self, surf: Surface):
+        if surf.get_bitsize() < 24: # Smooth scaling is only available for 24 and 32 bits surfaces.
+            return
+        levels = []
+        level = surf
+        while level.get_width() >= 2*self.min_size and level.get_height() >= 2*self.min_size:
+            level = tf.smoothscale(level, (level.get_width()//2, level.get_height()//2))
+            levels.append(level)
+        with self._lock:
+            self._levels[surf] = tuple(levels)
+
+    def _build_all(self, surfaces: tuple[Surface]):
+        for surf in surfaces:
+            self._build_one(surf)
+
+    def build(self, surfaces: Iterable[Surface]) -> Future:
+        """
+        Build the pyramids of frames in the background.
+
+        Returns:
+        ----
+        - future: concurrent.futures.Future, done when all the pyramids have been built.
+        """
+        return _builder.submit(self._build_all, tuple({id(surf): surf for surf in surfaces}.values()))
+
+    def source(self, surf: Surface, size: tuple[int, int]) -> Surface:
+        """Return the smallest level of the pyramid of a frame that is at least as large as a size, or the frame itself."""
+        width, height = size
+        best = surf
+        for level in self.levels(surf):
+            if level.get_width() < width or level.get_height() < height:
+                break
+            best = level
+        return best
+
+    def discard(self, surfaces: Iterable[Surface]):
+        """
+        Remove the pyramids of frames, because their pixels have been modified.
+        The pyramids of the surfaces sharing their pixels, their parents and the other subsurfaces of their parents, are removed too.
+        """
+        roots = {id(root_surface(surf)) for surf in surfaces}
+        with self._lock:
+            for surf in [surf for surf in self._levels.keys() if id(root_surface(surf)) in roots]:
+                self._levels.pop(surf, None)
+
+    def clear(self):
+        """Remove all the pyramids."""
+        with self._lock:
+            self._levels.clear()
+
+mipmaps = MipMaps()
@@ -0,0 +1,164 @@
+"""The optimization module contains the Optimizer, rewriting the steps of the transformations before they are applied."""
+from typing import Sequence
+from .transformation import (
+    Transformation, Rotate, RotoZoom, Zoom, Resize, Crop, Pad, Flip, Transpose,
+    SpeedUp, SlowDown, SetDurations, SetIntroductionIndex, SetIntroductionTime
+)
+
+_RESAMPLINGS = (Zoom, Resize)
+_RESCALINGS = (SpeedUp, SlowDown)
+_INTRODUCTIONS = (SetIntroductionIndex, SetIntroductionTime)
+
+def _is_scale2x(step: Transformation) -> bool:
+    """Return True if the step is a Zoom using pygame.transform.scale2x, whose result differs from a scaling."""
+    return type(step) is Zoom and not step.smooth and step.scale in (2, (2, 2))
+
+def _is_uniform_smooth_zoom(step: Transformation) -> bool:
+    return type(step) is Zoom and step.smooth and not isinstance(step.scale, tuple)
+
+def _duration_factor(step: SpeedUp | SlowDown) -> float:
+    return step.scale if type(step) is SlowDown else 1/step.scale
+
+def _is_identity(step: Transformation, width: int, height: int) -> bool:
+    """Return True if the step does not modify an art of this size."""
+    # The exact classes are checked, as subclasses might override apply.
+    kind = type(step)
+    if kind is Rotate:
+        return step.angle % 360 == 0
+    if kind is Zoom:
+        return step.scale in (1, (1, 1))
+    if kind is Resize:
+        return tuple(step.size) == (width, height)
+    if kind is Crop:
+        return step.rect.clip((0, 0, width, height)) == (0, 0, width, height)
+    if kind is Pad:
+        return not (step.left or step.right or step.top or step.bottom)
+    if kind is Flip:
+        return not (step.horizontal or step.vertical)
+    if kind in _RESCALINGS:
+        return step.scale == 1
+    return False
+
+def _fuse(first: Transformation, second: Transformation, width: int, height: int, rotozoom: bool) -> tuple[Transformation] | None:
+    """
+    Return the steps replacing two successive steps applied to an art of this size, or None if they cannot be fused.
+    Rotations and smooth zooms are fused into a RotoZoom only if rotozoom is True.
+    """
+    first_kind, second_kind = type(first), type(second)
+    if first_kind is Flip and second_kind is Flip:
+        return (Flip(first.horizontal != second.horizontal, first.vertical != second.vertical),)
+    if first_kind is Transpose and second_kind is Transpose:
+        return ()
+    if first_kind is Rotate and second_kind is Rotate and first.angle % 90 == 0 and second.angle % 90 == 0:
+        # Other angles are not fused, as each rotation enlarges the surfaces.
+        return (Rotate((first.angle + second.angle) % 360),)
+    if first_kind is Crop and second_kind is Crop:
+        rect = first.rect.clip((0, 0, width, height))
+        inner = second.rect.clip((0, 0, rect.width, rect.height))
+        return (Crop(rect.left + inner.left, rect.top + inner.top, inner.width, inner.height),)
+    if (
+        first_kind in _RESAMPLINGS and second_kind in _RESAMPLINGS and first.smooth == second.smooth
+        and not _is_scale2x(first) and not _is_scale2x(second)
+    ):
+        # The final size is computed as if both steps were applied, to be the same.
+        return (Resize(second.get_new_dimension(*first.get_new_dimension(width, height)), first.smooth),)
+    if rotozoom and (first_kind is Rotate and _is_uniform_smooth_zoom(second) or _is_uniform_smooth_zoom(first) and second_kind is Rotate):
+        rotation, zoom = (first, second) if first_kind is Rotate else (second, first)
+        return (RotoZoom(rotation.angle, zoom.scale),)
+    if rotozoom and first_kind is RotoZoom and _is_uniform_smooth_zoom(second):
+        return (RotoZoom(first.angle, first.scale*second.scale),)
+    if first_kind in _RESCALINGS and second_kind in _RESCALINGS:
+        return (SlowDown(_duration_factor(first)*_duration_factor(second)),)
+    if first_kind in _RESCALINGS + (SetDurations,) and second_kind is SetDurations:
+        return (second,)
+    if first_kind in _INTRODUCTIONS and second_kind in _INTRODUCTIONS:
+        return (second,)
+    return None
+
+class Optimizer:
+    """
+    The Optimizer rewrites the steps of the transformations applied to the arts, to compute the same result with less work.
+
+    - Steps not modifying the art, like ``Rotate(0)``, ``Zoom(1)`` or ``Flip(False, False)``, are removed.
+    - Successive flips, transpositions, rotations by right angles and crops are fused into one step.
+    - Successive zooms and resizes are fused into one resizing to the final size, if they are all smooth or all not smooth.
+    A ``Zoom(2)`` that is not smooth is kept, as it uses ``pygame.transform.scale2x``.
+    - If ``rotozoom`` is True, a rotation next to a smooth zoom, with the same scale on both axes, is replaced by a ``RotoZoom``.
+    It is disabled by default, as the rotation is then smoothed and the frames get an alpha channel.
+    - Successive speed ups and slow downs are fused into one, and the changes of durations or introduction overwritten by the next step are removed.
+
+    Only the steps of the classes listed above are rewritten, not their subclasses. Fused resamplings might give slightly different pixels,
+    as the frames are resampled once instead of several times.
+
+    Example:
+    ----
+    - ``print(optimizer.explain(Pipeline(Zoom(2, True), Zoom(0.5, True), Flip(True, False), Flip(True, False)), 100, 100))`` shows the rewrites.
+    - ``optimizer.enabled = False`` applies the steps as they are given.
+    """
+
+    def __init__(self, rotozoom: bool = False) -> None:
+        """
+        Create an Optimizer.
+
+        Params:
+        ----
+        - rotozoom: bool = False, whether rotations and smooth zooms are fused into RotoZooms, whose results differ.
+        """
+        self.enabled = True
+        self.rotozoom = rotozoom
+
+    def rewrite(
+        self,
+        steps: Sequence[Transformation],
+        width: int,
+        height: int
+    ) -> tuple[tuple[Transformation], list[tuple[tuple[Transformation], tuple[Transformation]]]]:
+        """
+        Rewrite the steps applied to an art.
+
+        Params:
+        ----
+        - steps: Sequence[Transformation], the elementary steps, as returned by transformation.steps().
+        - width, height: int, the size of the art before the steps.
+
+        Returns:
+        ----
+        - steps: tuple[Transformation], the rewritten steps.
+        - rewrites: list of pairs (replaced steps, new steps), in the order they have been made.
+        """
+        optimized: list[Transformation] = []
+        sizes: list[tuple[int, int]] = [(width, height)] # The size of the art before each optimized step, and after the last one.
+        rewrites = []
+        pending = list(steps)
+        while pending:
+            step = pending.pop(0)
+            if _is_identity(step, *sizes[-1]):
+                rewrites.append(((step,), ()))
+                continue
+            fused = _fuse(optimized[-1], step, *sizes[-2], self.rotozoom) if optimized else None
+            if fused is not None:
+                rewrites.append(((optimized.pop(), step), fused))
+                sizes.pop()
+                pending[:0] = fused # The new steps might be fused again.
+                continue
+            optimized.append(step)
+            sizes.append(step.get_new_dimension(*sizes[-1]))
+        return tuple(optimized), rewrites
+
+    def optimize(self, steps: Sequence[Transformation], width: int, height: int) -> tuple[Transformation]:
+        """Return the rewritten steps applied to an art of this size, or the steps as they are if the optimizer is disabled."""
+        if not self.enabled or not steps:
+            return tuple(steps)
+        return self.rewrite(steps, width, height)[0]
+
+    def explain(self, transformation: Transformation, width: int, height: int) -> str:
+        """Return a description of the rewrites of a transformation applied to an art of this size."""
+        steps = transformation.steps()
+        optimized, rewrites = self.rewrite(steps, width, height)
+        lines = [f"{len(steps)} steps rewritten into {len(optimized)} steps."]
+        for replaced, new in rewrites:
+            lines.append(f"- {', '.join(map(repr, replaced))} -> {', '.join(map(repr, new)) or 'removed'}")
+        lines.append(f"Applied steps: {', '.join(map(repr, optimized)) or 'none'}")
+        return '\n'.join(lines)
+
+optimizer = Optimizer()
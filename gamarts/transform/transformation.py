@@ -6,13 +6,22 @@ from math import cos, sin, radians
 from random import randint, shuffle
 import pygame.transform as tf
 from pygame import Surface, SRCALPHA, Rect
-from .._common import ColorValue
+from .._common import ColorValue, fingerprint_attributes
+from .calibration import cost_model
+from .mipmap import mipmaps
+
+def _smoothscale(surf: Surface, size: tuple[int, int]) -> Surface:
+    """Scale a surface smoothly, from the smallest level of its mip map pyramid larger than the size, if it has one."""
+    return tf.smoothscale(mipmaps.source(surf, size), size)
 
 class Transformation(ABC):
     """
     A transformation is an operation on an art. This class is an abstract class and shouldn't be instanciated.
     """
 
+    in_place = False # True if the transformation modifies the pixels of the surfaces it receives instead of returning new surfaces.
+    framewise = False # True if the transformation can be applied on each frame separately, without changing the number of frames and the durations.
+
     @abstractmethod
     def apply(
         self,
@@ -31,6 +40,13 @@ class Transformation(ABC):
         """Calculate the new dimensions of the art after transformation."""
         return width, height
 
+    def get_new_length(self, length) -> int:
+        """
+        Calculate the new number of frames of the art after transformation.
+        If it depends on the durations, the introduction or other arts, an upper bound or the current number of frames is returned.
+        """
+        return length
+
     # pylint: disable=unused-argument
     def cost(self, width, height, length, **ld_kwargs):
         """
@@ -41,9 +57,31 @@ class Transformation(ABC):
         """
         return 0
 
+    def estimate_duration(self, width, height, length, **ld_kwargs) -> float | None:
+        """
+        Return the duration of the transformation in milliseconds, predicted by the calibrated cost model,
+        or None if the transformation has not been calibrated.
+        """
+        return cost_model.predict(self, width, height, length)
+
+    def steps(self) -> tuple['Transformation']:
+        """Return the successive elementary transformations composing this transformation."""
+        return (self,)
+
+    def fingerprint(self):
+        """
+        Return a hashable value identifying the transformation, or None if the result of the transformation cannot be predicted from its attributes.
+        Two transformations with the same fingerprint give the same result when applied to the same frames.
+        """
+        return fingerprint_attributes(self)
+
     def __len__(self):
         return 1
 
+    def __repr__(self):
+        attributes = ', '.join(f"{name}={value!r}" for name, value in vars(self).items() if not name.startswith('_'))
+        return f"{type(self).__name__}({attributes})"
+
 class Pipeline(Transformation):
     """A Transformation pipeline is a sequence of successive transformations."""
 
@@ -81,6 +119,7 @@ class Pipeline(Transformation):
                 index = idx
             successive_indices.append(idx)
         # Find the last not None index. If there is no, we return None
+        idx = None
         for idx in successive_indices[::-1]:
             if idx is not None:
                 break
@@ -91,8 +130,41 @@ class Pipeline(Transformation):
             width, height = transfo.get_new_dimension(width, height)
         return width, height
 
+    def get_new_length(self, length):
+        for transfo in self._transformations:
+            length = transfo.get_new_length(length)
+        return length
+
     def cost(self, width, height, length, **ld_kwargs):
-        return sum(transfo.cost(width, height, length, **ld_kwargs) for transfo in self._transformations)
+        # Each transformation is applied on the dimensions and the number of frames given by the previous ones.
+        total = 0
+        for transfo in self._transformations:
+            total += transfo.cost(width, height, length, **ld_kwargs)
+            width, height = transfo.get_new_dimension(width, height)
+            length = transfo.get_new_length(length)
+        return total
+
+    def estimate_duration(self, width, height, length, **ld_kwargs):
+        total = 0
+        for transfo in self._transformations:
+            duration = transfo.estimate_duration(width, height, length, **ld_kwargs)
+            if duration is None:
+                return None
+            total += duration
+            width, height = transfo.get_new_dimension(width, height)
+            length = transfo.get_new_length(length)
+        return total
+
+    def steps(self):
+        return tuple(step for transfo in self._transformations for step in transfo.steps())
+
+    @property
+    def framewise(self):
+        return all(step.framewise for step in self.steps())
+
+    def fingerprint(self):
+        fingerprints = tuple(step.fingerprint() for step in self.steps())
+        return None if None in fingerprints else ('Pipeline', fingerprints)
 
     def copy(self):
         """
@@ -100,9 +172,14 @@ class Pipeline(Transformation):
         """
         return Pipeline(*self._transformations)
 
+    def __repr__(self):
+        return f"Pipeline({', '.join(repr(transfo) for transfo in self._transformations)})"
+
 class Rotate(Transformation):
     """The Rotate transformation rotates the art by a given angle."""
 
+    framewise = True
+
     def __init__(self, angle: float) -> None:
         """
         The Rotate transformation rotates the art by a given angle.
@@ -124,6 +201,34 @@ class Rotate(Transformation):
         new_height = abs(width * sin(radians_angle)) + abs(height * cos(radians_angle))
         return int(new_width), int(new_height)
 
+class RotoZoom(Transformation):
+    """
+    The RotoZoom transformation rotates and zooms the art at once, like ``pygame.transform.rotozoom``. The result is always smoothed.
+    It is used by the optimizer to replace a Rotate next to a smooth Zoom, if its rotozoom attribute is True.
+    """
+
+    framewise = True
+
+    def __init__(self, angle: float, scale: float) -> None:
+        """
+        The RotoZoom transformation rotates and zooms the art at once.
+
+        Params:
+        ----
+        - angle: float, the angle to counterclockwise rotate the art, in degrees.
+        - scale: float, the scale of the zoom, the same on both axes.
+        """
+        super().__init__()
+        self.angle = angle
+        self.scale = scale
+
+    def apply(self, surfaces: tuple[Surface], durations: tuple[int], introduction: int, index: int, width: int, height: int, **ld_kwargs):
+        rotozoomed_surfaces = tuple(tf.rotozoom(surf, self.angle, self.scale) for surf in surfaces)
+        return rotozoomed_surfaces, durations, introduction, None, *rotozoomed_surfaces[0].get_size()
+
+    def get_new_dimension(self, width, height):
+        return Rotate(self.angle).get_new_dimension(int(width*self.scale), int(height*self.scale))
+
 
 class Zoom(Transformation):
     """
@@ -137,6 +242,8 @@ class Zoom(Transformation):
     a tuple as scale. If smooth is True, use a smooth zooming instead.
     """
 
+    framewise = True
+
     def __init__(self, scale: float | tuple[float, float], smooth: bool = False) -> None:
         """
         The Zoom transformation zoomes the art by a give scale.
@@ -157,11 +264,12 @@ class Zoom(Transformation):
         elif not self.smooth:
             rescaled_surfaces = tuple(tf.scale_by(surf, self.scale) for surf in surfaces)
         else:
-            rescaled_surfaces = tuple(tf.smoothscale_by(surf, self.scale) for surf in surfaces)
-        return rescaled_surfaces, durations, introduction, None, int(width*self.scale), int(height*self.scale)
+            rescaled_surfaces = tuple(_smoothscale(surf, self.get_new_dimension(*surf.get_size())) for surf in surfaces)
+        return rescaled_surfaces, durations, introduction, None, *self.get_new_dimension(width, height)
 
     def get_new_dimension(self, width, height):
-        return int(width*self.scale), int(height*self.scale)
+        scale_x, scale_y = self.scale if isinstance(self.scale, tuple) else (self.scale, self.scale)
+        return int(width*scale_x), int(height*scale_y)
 
 class Resize(Transformation):
     """
@@ -173,6 +281,8 @@ class Resize(Transformation):
     to a size (120, 60). If smooth is True, use a smooth resizing instead.
     """
 
+    framewise = True
+
     def __init__(self, size: tuple[int, int], smooth: bool = False) -> None:
         """
         The Resize transformation resizes the art to a new size. The image might end distorded.
@@ -188,7 +298,7 @@ class Resize(Transformation):
 
     def apply(self, surfaces: tuple[Surface], durations: tuple[int], introduction: int, index: int, width: int, height: int, **ld_kwargs):
         if self.smooth:
-            rescaled_surfaces = tuple(tf.smoothscale(surf, self.size) for surf in surfaces)
+            rescaled_surfaces = tuple(_smoothscale(surf, self.size) for surf in surfaces)
         else:
             rescaled_surfaces = tuple(tf.scale(surf, self.size) for surf in surfaces)
         return rescaled_surfaces, durations, introduction, None, *self.size
@@ -198,7 +308,7 @@ class Resize(Transformation):
 
 class Crop(Transformation):
     """
-    The Crop transformation crops the art to a smaller art.
+    The Crop transformation crops the art to a smaller art. The cropped frames are views of the frames of the art, no pixel is copied.
 
     Example:
     ----
@@ -206,6 +316,8 @@ class Crop(Transformation):
     in a surface with only the pixels from (50, 50) to (70, 80)
     """
 
+    framewise = True
+
     def __init__(self, left: int, top: int, width: int, height: int) -> None:
         """
         The Crop transformation crops the art to a smaller art.
@@ -225,13 +337,10 @@ class Crop(Transformation):
         self.rect = Rect(left, top, width, height)
 
     def apply(self, surfaces: tuple[Surface], durations: tuple[int], introduction: int, index: int, width: int, height: int, **ld_kwargs):
-        background = Surface(self.rect.size)
-        cropped_surfaces = []
+        # The subsurfaces are copied by the arts before a transformation modifies their pixels.
         rect = self.rect.clip(surfaces[0].get_rect())
-        for surf in surfaces:
-            background.blit(surf, (0,0), rect)
-            cropped_surfaces.append(background)
-        return tuple(cropped_surfaces), durations, introduction, None, *rect.size
+        cropped_surfaces = tuple(surf.subsurface(rect) for surf in surfaces)
+        return cropped_surfaces, durations, introduction, None, *rect.size
 
     def get_new_dimension(self, width, height):
         rect = self.rect.clip((0, 0, width, height))
@@ -242,6 +351,8 @@ class Pad(Transformation):
     The Pad transformation adds a solid color extension on every side of the art
     """
 
+    framewise = True
+
     def __init__(self, color: ColorValue, left: int = 0, right = 0, top = 0, bottom = 0) -> None:
         """
         The Pad transformation adds a solid color extension on every side of the art.
@@ -275,6 +386,8 @@ class Flip(Transformation):
     The flip transformation flips the art, horizontally and/or vertically.
     """
 
+    framewise = True
+
     def __init__(self, horizontal: bool, vertical: bool) -> None:
         """
         The flip transformation flips the art, horizontally and/or vertically.
@@ -290,7 +403,7 @@ class Flip(Transformation):
 
     def apply(self, surfaces: tuple[Surface], durations: tuple[int], introduction: int, index: int, width: int, height: int, **ld_kwargs):
         flipped_surfaces = tuple(tf.flip(surf, self.horizontal, self.vertical) for surf in surfaces)
-        return flipped_surfaces, durations, introduction, None, height, width
+        return flipped_surfaces, durations, introduction, None, width, height
 
     def get_new_dimension(self, width, height):
         return width, height
@@ -298,9 +411,11 @@ class Flip(Transformation):
 class Transpose(Transformation):
     """The transpose transformation transposes the art like a matrix."""
 
+    framewise = True
+
     def apply(self, surfaces: tuple[Surface], durations: tuple[int], introduction: int, index: int, width: int, height: int, **ld_kwargs):
         tp_surfaces = tuple(tf.flip(tf.rotate(surf, 270), True, False) for surf in surfaces)
-        return tp_surfaces, durations, introduction, None, width, height
+        return tp_surfaces, durations, introduction, None, height, width
 
     def get_new_dimension(self, width, height):
         return height, width
@@ -310,6 +425,8 @@ class VerticalChop(Transformation):
     The vertical chop transformation removes a band of pixel and puts the right side next to the left side.
     """
 
+    framewise = True
+
     def __init__(self, from_: int, to: int) -> None:
         """
         The vertical chop transformation removes a band of pixel and puts the right side next to the left side.
@@ -323,8 +440,16 @@ class VerticalChop(Transformation):
         self.rect = (from_, 0, to - from_ + 1, 0)
 
     def apply(self, surfaces: tuple[Surface], durations: tuple[int], introduction: int, index: int, width: int, height: int, **ld_kwargs):
-        chopped_surfaces = tuple(tf.chop(surf, self.rect) for surf in surfaces)
-        return chopped_surfaces, durations, introduction, None, width - self.rect[2], height
+        left, _, band, _ = self.rect
+        surf_width, surf_height = surfaces[0].get_size()
+        if left <= 0: # The band touches a side, the remaining pixels are a view of the frames.
+            kept = Rect(left + band, 0, surf_width - left - band, surf_height).clip(0, 0, surf_width, surf_height)
+            chopped_surfaces = tuple(surf.subsurface(kept) for surf in surfaces)
+        elif left + band >= surf_width:
+            chopped_surfaces = tuple(surf.subsurface((0, 0, min(left, surf_width), surf_height)) for surf in surfaces)
+        else:
+            chopped_surfaces = tuple(tf.chop(surf, self.rect) for surf in surfaces)
+        return chopped_surfaces, durations, introduction, None, *chopped_surfaces[0].get_size()
 
     def get_new_dimension(self, width, height):
         return width - self.rect[2], height
@@ -334,6 +459,8 @@ class HorizontalChop(Transformation):
     The horizontal chop transformation removes a band of pixel and puts the bottom side just below to the top side.
     """
 
+    framewise = True
+
     def __init__(self, from_: int, to: int) -> None:
         """
         The horizontal chop transformation removes a band of pixel and puts the bottom side just below to the top side.
@@ -347,8 +474,16 @@ class HorizontalChop(Transformation):
         self.rect = (0, from_, 0, to - from_)
 
     def apply(self, surfaces: tuple[Surface], durations: tuple[int], introduction: int, index: int, width: int, height: int, **ld_kwargs):
-        chopped_surfaces = tuple(tf.chop(surf, self.rect) for surf in surfaces)
-        return chopped_surfaces, durations, introduction, None, width, height - self.rect[3]
+        _, top, _, band = self.rect
+        surf_width, surf_height = surfaces[0].get_size()
+        if top <= 0: # The band touches a side, the remaining pixels are a view of the frames.
+            kept = Rect(0, top + band, surf_width, surf_height - top - band).clip(0, 0, surf_width, surf_height)
+            chopped_surfaces = tuple(surf.subsurface(kept) for surf in surfaces)
+        elif top + band >= surf_height:
+            chopped_surfaces = tuple(surf.subsurface((0, 0, surf_width, min(top, surf_height))) for surf in surfaces)
+        else:
+            chopped_surfaces = tuple(tf.chop(surf, self.rect) for surf in surfaces)
+        return chopped_surfaces, durations, introduction, None, *chopped_surfaces[0].get_size()
 
     def get_new_dimension(self, width, height):
         return width, height - self.rect[3]
@@ -512,6 +647,10 @@ class ExtractSlice(Transformation):
         durations = tuple(durations[_index_here(index, len(durations), introduction)] for index in indices)
         return surfaces, durations, 0, 0, width, height
 
+    def get_new_length(self, length):
+        # The introduction is not known, the slice is bounded as if it was 0.
+        return len(range(*self.slice.indices(length*2)))
+
 class ExtractOne(Transformation):
     """Extract one frame of the animation."""
 
@@ -530,24 +669,36 @@ class ExtractOne(Transformation):
     def apply(self, surfaces: tuple[Surface], durations: tuple[int], introduction: int, index: int, width: int, height: int, **ld_kwargs):
         return (surfaces[_index_here(self.index, len(surfaces), introduction)],), (0,), 0, 0, width, height
 
+    def get_new_length(self, length):
+        return 1
+
 class First(Transformation):
     """Extract the very first frame of the animation."""
 
     def apply(self, surfaces: tuple[Surface], durations: tuple[int], introduction: int, index: int, width: int, height: int, **ld_kwargs):
         return (surfaces[0],), (0,), 0, 0, width, height
 
+    def get_new_length(self, length):
+        return 1
+
 class Last(Transformation):
     """Extract the very last frame of the animation."""
 
     def apply(self, surfaces: tuple[Surface], durations: tuple[int], introduction: int, index: int, width: int, height: int, **ld_kwargs):
         return (surfaces[-1],), (0,), 0, 0, width, height
 
+    def get_new_length(self, length):
+        return 1
+
 class ExtractAtIntroduction(Transformation):
     """Extract the frame of the introduction."""
 
     def apply(self, surfaces: tuple[Surface], durations: tuple[int], introduction: int, index: int, width: int, height: int, **ld_kwargs):
         return (surfaces[introduction],), (0,), 0, 0, width, height
 
+    def get_new_length(self, length):
+        return 1
+
 class ExtractFromIntroduction(Transformation):
     """Extract the frames after the introduction."""
 
@@ -584,6 +735,9 @@ class ExtractTime(Transformation):
                 next_idx = introduction
         return (surfaces[idx],), (0,), 0, 0, width, height
 
+    def get_new_length(self, length):
+        return 1
+
 class ExtractWindow(Transformation):
     """Extract the frames displayed in a given window of time."""
 
@@ -646,12 +800,20 @@ class ExtractWindow(Transformation):
 
         return surfs, durs, introduction, index, width, height
 
+    def fingerprint(self):
+        # The new index depends on the current index.
+        return None
+
 class RandomizeIndex(Transformation):
     """Randomize the current index of the animation."""
 
     def apply(self, surfaces: tuple[Surface], durations: tuple[int], introduction: int, index: int, width: int, height: int, **ld_kwargs):
         return surfaces, durations, introduction, randint(0, len(surfaces)), width, height
 
+    def fingerprint(self):
+        # The result is random.
+        return None
+
 class Shuffle(Transformation):
     """
     Shuffle the order of the frames in the animation.
@@ -668,3 +830,7 @@ class Shuffle(Transformation):
         index = indices.index(index)
         introduction = indices.index(introduction)
         return surfaces, durations, introduction, index, width, height
+
+    def fingerprint(self):
+        # The result is random.
+        return None
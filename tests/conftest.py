@@ -0,0 +1,27 @@
+"""Configuration of the tests: pygame is initialized without a window, and the tests are run from the root of the repository."""
+import os
+import pytest
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
+
+import pygame # pylint: disable=wrong-import-position
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+@pytest.fixture(scope='session', autouse=True)
+def display():
+    """Initialize pygame with a dummy display, needed to convert the surfaces."""
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+    yield
+    pygame.quit()
+
+@pytest.fixture(autouse=True)
+def repository_root(monkeypatch):
+    """Run the tests from the root of the repository, where the images are."""
+    monkeypatch.chdir(ROOT)
+
+def surface_bytes(surf: pygame.Surface) -> bytes:
+    """Return the pixels of a surface, to compare surfaces."""
+    return pygame.image.tobytes(surf, 'RGBA')
@@ -0,0 +1,52 @@
+"""Tests of the webps and apngs, whose durations are read without decoding the frames."""
+import pytest
+from PIL import Image
+from gamarts import APNGFile, WebPFile
+from gamarts.art.file import _scan_apng, _scan_webp
+from conftest import surface_bytes
+
+DURATIONS = tuple(40 + 10*index for index in range(6))
+
+def save_animation(path, default_image=False):
+    """Save an animation with frames of different colors and durations, and return the path."""
+    frames = [Image.new('RGBA', (8, 6), (40*index, 255 - 40*index, 0, 255 - 20*index)) for index in range(len(DURATIONS))]
+    kwargs = {'default_image': True} if default_image else {}
+    frames[0].save(path, save_all=True, append_images=frames[1:], duration=list(DURATIONS), loop=0, lossless=True, **kwargs)
+    return str(path)
+
+def pillow_frames(path):
+    with Image.open(path) as image:
+        for index in range(getattr(image, 'n_frames', 1)):
+            image.seek(index)
+            yield image.convert('RGBA').tobytes()
+
+def test_scan_webp(tmp_path):
+    assert _scan_webp(save_animation(tmp_path / 'animation.webp')) == DURATIONS
+
+def test_scan_apng(tmp_path):
+    assert _scan_apng(save_animation(tmp_path / 'animation.png')) == DURATIONS
+
+def test_scan_apng_with_a_default_image(tmp_path):
+    # The default image is not a part of the animation, it is displayed as a first frame of duration 0, like Pillow.
+    path = save_animation(tmp_path / 'animation.png', default_image=True)
+    with Image.open(path) as image:
+        durations = []
+        for index in range(image.n_frames):
+            image.seek(index)
+            durations.append(int(image.info.get('duration') or 0))
+    assert _scan_apng(path) == tuple(durations) == (0,) + DURATIONS[:-1]
+
+def test_still_images_have_one_frame(tmp_path):
+    Image.new('RGBA', (4, 4)).save(tmp_path / 'still.png')
+    Image.new('RGBA', (4, 4)).save(tmp_path / 'still.webp')
+    assert _scan_apng(str(tmp_path / 'still.png')) == (0,)
+    assert _scan_webp(str(tmp_path / 'still.webp')) == (0,)
+
+@pytest.mark.parametrize('cls, name', [(WebPFile, 'animation.webp'), (APNGFile, 'animation.png')])
+@pytest.mark.parametrize('streaming', [False, True])
+def test_frames_are_decoded_like_pillow(tmp_path, cls, name, streaming):
+    path = save_animation(tmp_path / name)
+    art = cls(path, streaming=streaming)
+    art.load()
+    assert art.durations == DURATIONS
+    assert [surface_bytes(art.surfaces[index]) for index in range(len(DURATIONS))] == list(pillow_frames(path))
@@ -0,0 +1,81 @@
+"""Tests of the animation of the arts: the index displayed after updates and seeks."""
+import pytest
+from gamarts import ArtGroup, GIFFile, ImageFolder
+from gamarts.transform import SetDurations, SetIntroductionIndex
+
+@pytest.fixture
+def squares():
+    """An animation of 5 frames of 100, 200, 300, 400 and 500 ms, looping from the third frame."""
+    art = ImageFolder('images/squares', [100, 200, 300, 400, 500], introduction=2)
+    art.load()
+    return art
+
+@pytest.mark.parametrize('time, index', [(0, 0), (99, 0), (100, 1), (299, 1), (300, 2), (1499, 4)])
+def test_seek_in_the_introduction_and_the_first_loop(squares, time, index):
+    squares.seek(time)
+    assert squares.index == index
+
+@pytest.mark.parametrize('time, index', [(1500, 2), (1799, 2), (1800, 3), (2700, 2), (1500 + 3*1200 + 750, 4)])
+def test_seek_in_the_next_loops_avoids_the_introduction(squares, time, index):
+    squares.seek(time)
+    assert squares.index == index
+
+def test_seek_keeps_the_time_in_the_frame(squares):
+    squares.seek(1500 + 1200 + 650) # 350 ms after the start of the fourth frame.
+    assert squares.index == 3
+    squares.update(49)
+    assert squares.index == 3
+    squares.update(1)
+    assert squares.index == 4
+
+def test_updates_catch_up_over_several_loops(squares):
+    squares.update(1500 + 5*1200 + 350) # Five loops and 350 ms in the sixth one.
+    assert squares.index == 3
+    reference = ImageFolder('images/squares', [100, 200, 300, 400, 500], introduction=2)
+    reference.load()
+    for _ in range(1500 + 5*1200 + 350):
+        reference.update(1)
+    assert reference.index == 3
+
+def test_has_changed(squares):
+    squares.update(0) # The loading does not count as a change of index.
+    assert not squares.update(50)
+    assert squares.update(50)
+    assert not squares.update(10)
+    squares.transform(SetIntroductionIndex(0))
+    squares.get()
+    assert squares.update(0) # A transformation has been applied.
+    assert not squares.update(0)
+
+def test_frames_of_zero_duration_advance_one_per_update():
+    art = ImageFolder('images/squares', 0)
+    art.load()
+    indices = []
+    for _ in range(7):
+        art.update(16)
+        indices.append(art.index)
+    assert indices == [1, 2, 3, 4, 0, 1, 2]
+    art.seek(1000)
+    assert art.index == 0
+
+def test_loops_of_zero_duration_advance_one_per_update():
+    art = ImageFolder('images/squares', [100, 100, 0, 0, 0], introduction=2)
+    art.load()
+    indices = []
+    for _ in range(6):
+        assert art.update(150)
+        indices.append(art.index)
+    assert indices == [1, 2, 3, 4, 2, 3]
+
+def test_groups_advance_zero_durations_one_per_update():
+    art = GIFFile('images/wikipedia_earth.gif')
+    art.load()
+    art.transform(SetDurations(0))
+    art.get()
+    member = art.reference()
+    group = ArtGroup(member)
+    indices = []
+    for _ in range(46):
+        group.update(16)
+        indices.append(member.index)
+    assert indices == list(range(1, 44)) + [0, 1, 2]
@@ -0,0 +1,85 @@
+"""Tests of the loading and the transformation of the arts from asyncio, without blocking the event loop."""
+import asyncio
+import time
+from threading import Lock
+import pytest
+from gamarts import ImageFile, gather_load
+from gamarts._common import LoadingError
+from gamarts.transform import Flip, Invert, Pipeline, Zoom
+from conftest import surface_bytes
+
+class CountedImage(ImageFile):
+    """An ImageFile recording the number of arts of its class loaded at once."""
+
+    lock = Lock()
+    loading = 0
+    max_loading = 0
+
+    def __init__(self):
+        super().__init__('images/Lenna.png')
+
+    def _load(self, **ld_kwargs):
+        with CountedImage.lock:
+            CountedImage.loading += 1
+            CountedImage.max_loading = max(CountedImage.max_loading, CountedImage.loading)
+        time.sleep(0.02)
+        try:
+            super()._load(**ld_kwargs)
+        finally:
+            with CountedImage.lock:
+                CountedImage.loading -= 1
+
+class FailingImage(ImageFile):
+    def __init__(self):
+        super().__init__('images/Lenna.png')
+
+    def _load(self, **ld_kwargs):
+        raise LoadingError("The file is corrupted.")
+
+@pytest.fixture(autouse=True)
+def reset_counters():
+    CountedImage.loading = CountedImage.max_loading = 0
+
+def test_gather_load_limits_the_number_of_arts_loaded_at_once():
+    arts = [CountedImage() for _ in range(8)]
+    asyncio.run(gather_load(*arts, limit=2))
+    assert all(art.is_loaded() for art in arts)
+    assert 1 <= CountedImage.max_loading <= 2
+
+def test_the_event_loop_is_not_blocked_while_loading():
+    ticks = []
+
+    async def tick():
+        for _ in range(5):
+            ticks.append(time.perf_counter())
+            await asyncio.sleep(0.005)
+
+    async def load(arts):
+        await gather_load(*arts, limit=1)
+        return time.perf_counter()
+
+    async def main():
+        arts = [CountedImage() for _ in range(4)]
+        loaded_at, _ = await asyncio.gather(load(arts), tick())
+        return arts, loaded_at
+
+    arts, loaded_at = asyncio.run(main())
+    assert all(art.is_loaded() for art in arts) and len(ticks) == 5
+    assert ticks[1] < loaded_at # The loop ran while the arts were loaded one by one, for at least 80 ms.
+
+@pytest.mark.parametrize('limit', [None, 2])
+def test_the_loading_errors_are_raised(limit):
+    arts = [CountedImage(), FailingImage(), CountedImage()]
+    with pytest.raises(LoadingError):
+        asyncio.run(gather_load(*arts, limit=limit))
+    with pytest.raises(LoadingError):
+        asyncio.run(FailingImage().aload())
+
+def test_atransform_gives_the_frames_of_get():
+    awaited, reference = ImageFile('images/Lenna.png'), ImageFile('images/Lenna.png')
+    awaited.transform(Flip(True, False)) # The transformations waiting to be applied are applied first.
+    asyncio.run(awaited.atransform(Pipeline(Zoom(0.5), Invert())))
+    reference.transform(Flip(True, False))
+    reference.transform(Pipeline(Zoom(0.5), Invert()))
+    assert awaited.is_loaded() and awaited.surfaces[0].get_size() == reference.get().get_size() == (255, 256)
+    assert surface_bytes(awaited.surfaces[0]) == surface_bytes(reference.get()) # Applied before the next get.
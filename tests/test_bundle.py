@@ -0,0 +1,47 @@
+"""Tests of the bundles, storing the frames of many arts in one file mapped in memory."""
+import pytest
+from pygame.image import tobytes
+from gamarts import GIFFile, ImageFile, Bundle, BundleArt, write_bundle
+from gamarts.transform import Invert, Zoom
+from gamarts._common import LoadingError
+
+def frames(art):
+    return [tobytes(surf, 'RGB') for surf in art.surfaces]
+
+@pytest.fixture
+def arts():
+    return {
+        'earth': GIFFile('images/wikipedia_earth.gif', introduction=3),
+        'lenna': ImageFile('images/Lenna.png', transformation=Zoom(0.5)),
+    }
+
+@pytest.fixture
+def bundle_path(tmp_path, arts):
+    path = str(tmp_path / 'level.gamarts')
+    write_bundle(path, arts)
+    return path
+
+def test_the_arts_are_loaded_from_the_bundle(bundle_path, arts):
+    bundle = Bundle.open(bundle_path)
+    assert bundle is Bundle.open(bundle_path) and set(bundle.names) == {'earth', 'lenna'}
+    for name, original in arts.items():
+        art = BundleArt(bundle_path, name)
+        assert (art.width, art.height) == (original.width, original.height) # Known before the loading.
+        art.load()
+        assert art.durations == original.durations and art.introduction == original.introduction
+        assert frames(art) == frames(original)
+
+def test_the_bundled_frames_are_not_modified_by_the_transformations(bundle_path, arts):
+    transformed, other = BundleArt(bundle_path, 'lenna'), BundleArt(bundle_path, 'lenna')
+    transformed.transform(Invert())
+    transformed.get()
+    other.load()
+    assert frames(transformed) != frames(other) == frames(arts['lenna'])
+
+def test_invalid_bundles_and_names(bundle_path, tmp_path):
+    with pytest.raises(KeyError):
+        BundleArt(bundle_path, 'missing')
+    not_a_bundle = tmp_path / 'image.gamarts'
+    not_a_bundle.write_bytes(b'not a bundle')
+    with pytest.raises(LoadingError):
+        Bundle(str(not_a_bundle))
@@ -0,0 +1,124 @@
+"""Tests of the fingerprints and of the ResultCache sharing the frames of identical arts."""
+import numpy as np
+import pytest
+from pygame import Color, Rect, Surface
+from gamarts import GIFFile, ImageFile
+from gamarts.art import ResultCache, result_cache
+from gamarts.art.cache import ld_kwargs_fingerprint
+from gamarts.transform import Invert, Pipeline, SetDurations, Zoom
+from gamarts._common import fingerprint_attributes, fingerprint_of
+from conftest import surface_bytes
+
+@pytest.fixture
+def enabled_cache():
+    """Enable the result cache during a test."""
+    result_cache.clear()
+    result_cache.budget = 64*2**20
+    yield result_cache
+    result_cache.budget = 0
+    result_cache.clear()
+
+def test_fingerprint_of_values():
+    assert fingerprint_of(1) != fingerprint_of(1.0) != fingerprint_of(True)
+    assert fingerprint_of(np.int64(3)) == fingerprint_of(3)
+    assert fingerprint_of(Color(1, 2, 3)) == fingerprint_of(Color(1, 2, 3))
+    assert fingerprint_of(Rect(0, 0, 2, 2)) != fingerprint_of(Color(0, 0, 2, 2))
+    assert fingerprint_of(np.zeros((2, 2))) == fingerprint_of(np.zeros((2, 2)))
+    assert fingerprint_of(np.zeros((2, 2))) != fingerprint_of(np.ones((2, 2)))
+    assert fingerprint_of({'a': 1, 'b': 2}) == fingerprint_of({'b': 2, 'a': 1})
+
+def test_unidentifiable_values_have_no_fingerprint():
+    assert fingerprint_of(lambda: 0) is None
+    assert fingerprint_of(iter(())) is None
+    assert fingerprint_of((1, lambda: 0)) is None
+    assert fingerprint_of({'key': object()}) is None
+    assert ld_kwargs_fingerprint({'antialias': True, 'cost_threshold': 5}) == ld_kwargs_fingerprint({'antialias': True})
+
+def test_transformation_fingerprints():
+    assert Zoom(2).fingerprint() == Zoom(2).fingerprint()
+    assert Zoom(2).fingerprint() != Zoom(3).fingerprint()
+    assert Zoom(2).fingerprint() != Zoom(2, True).fingerprint()
+    assert Pipeline(Zoom(2), Invert()).fingerprint() == Pipeline(Zoom(2), Invert()).fingerprint()
+    assert Pipeline(Zoom(2), Invert()).fingerprint() != Pipeline(Invert(), Zoom(2)).fingerprint()
+
+def test_stateful_transformations_have_no_fingerprint():
+    # The durations are taken from an iterator, whose state cannot be identified.
+    assert SetDurations(100).fingerprint() is None
+    assert fingerprint_attributes(SetDurations(100)) is None
+    assert Pipeline(Zoom(2), SetDurations(100)).fingerprint() is None
+
+def test_result_cache_hits_and_misses():
+    cache = ResultCache(2**20)
+    surf = Surface((10, 10))
+    assert cache.get('key') is None
+    assert cache.put('key', ('result',), (surf,))
+    assert cache.get('key') == ('result',)
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert cache.usage == 400 and len(cache) == 1
+    assert cache.put('key', ('other',), (surf,))
+    assert cache.get('key') == ('other',) and cache.usage == 400
+    cache.clear()
+    assert cache.get('key') is None and cache.usage == 0
+
+def test_result_cache_evicts_the_least_recently_used_results():
+    cache = ResultCache(1000)
+    surf = Surface((10, 10)) # 400 bytes
+    cache.put('first', (1,), (surf,))
+    cache.put('second', (2,), (surf,))
+    cache.get('first')
+    cache.put('third', (3,), (surf,))
+    assert cache.get('second') is None
+    assert cache.get('first') == (1,) and cache.get('third') == (3,)
+    assert cache.usage == 800 <= cache.budget
+
+def test_result_cache_rejects_results_larger_than_the_budget():
+    cache = ResultCache(1000)
+    cache.put('small', (1,), (Surface((10, 10)),))
+    assert not cache.put('large', (2,), (Surface((20, 20)),))
+    assert cache.get('large') is None and cache.get('small') == (1,)
+    assert not ResultCache().enabled and not ResultCache().put('key', (1,), (Surface((1, 1)),))
+
+def test_disabled_cache_does_not_share_frames():
+    first, second = ImageFile('images/Lenna.png'), ImageFile('images/Lenna.png')
+    assert first.get() is not second.get()
+    assert first.fingerprint() is None
+
+def test_identical_arts_share_their_frames(enabled_cache):
+    first, second = ImageFile('images/Lenna.png'), ImageFile('images/Lenna.png')
+    assert first.get() is second.get()
+    assert first.fingerprint() == second.fingerprint() is not None
+    first.transform(Zoom(0.5))
+    second.transform(Zoom(0.5))
+    assert first.get() is second.get()
+    assert enabled_cache.hits == 2
+
+def test_modified_shared_frames_are_copied(enabled_cache):
+    first, second = ImageFile('images/Lenna.png'), ImageFile('images/Lenna.png')
+    before = surface_bytes(first.get())
+    second.transform(Invert())
+    assert surface_bytes(first.get()) == before
+    assert surface_bytes(second.get(cost_threshold=float('inf'))) != before
+
+def test_unidentifiable_transformations_are_not_shared(enabled_cache):
+    first, second = GIFFile('images/wikipedia_earth.gif'), GIFFile('images/wikipedia_earth.gif')
+    first.load()
+    second.load()
+    first.transform(SetDurations(50))
+    second.transform(SetDurations(200))
+    first.get()
+    second.get()
+    assert first.fingerprint() is None and second.fingerprint() is None
+    assert set(first.durations) == {50} and set(second.durations) == {200}
+    # The following transformations are not shared either, as the frames they are applied on cannot be identified.
+    first.transform(Zoom(0.5))
+    second.transform(Zoom(0.5))
+    assert first.get() is not second.get()
+
+def test_the_budget_is_respected_by_the_arts(enabled_cache):
+    enabled_cache.budget = 1_200_000 # The frame of Lenna and its zoom do not fit together.
+    art = ImageFile('images/Lenna.png')
+    art.get()
+    assert len(enabled_cache) == 1
+    art.transform(Zoom(0.5))
+    art.get()
+    assert len(enabled_cache) == 1 and enabled_cache.usage == 255*256*4
@@ -0,0 +1,87 @@
+"""Tests of the frames shared by the arts, which must be copied before being modified."""
+from pygame import Color
+from gamarts import GIFFile, ImageFile
+from gamarts.transform import Crop, Darken, DrawCircle, Invert, SetAlpha, VerticalChop, Zoom, mipmaps
+from conftest import surface_bytes
+
+def frames_bytes(art):
+    return [surface_bytes(surf) for surf in art.surfaces]
+
+def test_copies_share_their_frames_until_modified():
+    original = GIFFile('images/wikipedia_earth.gif')
+    original.load()
+    copy = original.copy()
+    copy.load()
+    assert all(a is b for a, b in zip(original.surfaces, copy.surfaces))
+    before = frames_bytes(original)
+    copy.transform(Invert())
+    copy.get(cost_threshold=float('inf'))
+    assert frames_bytes(original) == before
+    assert frames_bytes(copy) != before
+
+def test_originals_modified_after_a_copy_do_not_modify_the_copy():
+    original = ImageFile('images/Lenna.png')
+    original.load()
+    copy = original.copy()
+    copy.load()
+    before = surface_bytes(copy.get())
+    original.transform(DrawCircle(Color(255, 0, 0), 50, (100, 100)))
+    original.transform(SetAlpha(128))
+    original.get(cost_threshold=float('inf'))
+    assert surface_bytes(copy.get()) == before
+    assert surface_bytes(original.get()) != before
+
+def test_copies_are_modified_like_their_original():
+    original = ImageFile('images/Lenna.png')
+    expected = ImageFile('images/Lenna.png', transformation=Darken(0.5))
+    copy = original.copy(Darken(0.5))
+    copy.load()
+    assert copy.get() is not original.get()
+    assert surface_bytes(copy.get()) == surface_bytes(expected.get())
+
+def test_copies_of_cropped_frames_are_modified_separately():
+    original = GIFFile('images/wikipedia_earth.gif', transformation=Crop(10, 20, 100, 50))
+    original.load()
+    copy = original.copy(Invert())
+    copy.load()
+    assert original.surfaces[0].get_size() == copy.surfaces[0].get_size() == (100, 50)
+    assert frames_bytes(original) != frames_bytes(copy)
+
+def test_crops_are_views():
+    art = ImageFile('images/Lenna.png')
+    full = art.get()
+    art.transform(Crop(10, 20, 100, 50))
+    cropped = art.get()
+    assert cropped.get_parent() is full
+    assert surface_bytes(cropped) == surface_bytes(full.subsurface((10, 20, 100, 50)))
+
+def test_in_place_steps_do_not_write_through_views():
+    art = ImageFile('images/Lenna.png')
+    full = art.get()
+    before = surface_bytes(full)
+    art.transform(Crop(10, 20, 100, 50))
+    art.transform(Invert())
+    art.get(cost_threshold=float('inf'))
+    assert surface_bytes(full) == before
+
+def test_chops_touching_a_side_are_views():
+    art = ImageFile('images/Lenna.png')
+    full = art.get()
+    art.transform(VerticalChop(0, 9))
+    assert art.get().get_parent() is full and art.get().get_size() == (501, 512)
+
+def test_mipmaps_are_discarded_with_their_root():
+    art = ImageFile('images/Lenna.png')
+    art.build_mipmaps().result()
+    full = art.get()
+    view = full.subsurface((0, 0, 100, 100))
+    mipmaps.build((view,)).result()
+    assert full in mipmaps and view in mipmaps
+    mipmaps.discard((view,))
+    assert full not in mipmaps and view not in mipmaps
+
+def test_mipmaps_give_the_size_of_the_zoom():
+    art = ImageFile('images/Lenna.png')
+    art.build_mipmaps().result()
+    art.transform(Zoom(0.1, True))
+    assert art.get(cost_threshold=float('inf')).get_size() == (51, 51)
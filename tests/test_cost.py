@@ -0,0 +1,50 @@
+"""Tests of the predicted costs and durations of the transformations, used to route them to the executor."""
+import pytest
+from gamarts import GIFFile, transformation_executor
+from gamarts.transform import Concatenate, ExtractOne, ExtractSlice, ExtractTime, First, Invert, Last, Pipeline, Zoom, cost_model
+from gamarts.transform.transformation import ExtractAtIntroduction
+
+@pytest.fixture
+def calibrated_invert():
+    """Calibrate Invert to last 1 ms per 1000 pixels."""
+    cost_model.clear()
+    cost_model.record(Invert(), 10, 10, 10, 1.)
+    cost_model.fit()
+    yield
+    cost_model.clear()
+
+@pytest.mark.parametrize('transformation', [ExtractOne(3), First(), Last(), ExtractAtIntroduction(), ExtractTime(500)])
+def test_extractions_of_one_frame(transformation):
+    assert transformation.get_new_length(44) == 1
+
+def test_slices():
+    assert ExtractSlice(slice(10, 20)).get_new_length(44) == 10
+    assert ExtractSlice(slice(None, None, 2)).get_new_length(44) == 44
+    assert ExtractSlice(slice(40, 50)).get_new_length(44) == 10 # The frames are looped.
+    assert Zoom(2).get_new_length(44) == 44
+
+def test_concatenations_count_the_frames_of_the_other_arts():
+    other = GIFFile('images/wikipedia_earth.gif')
+    other.load()
+    assert Concatenate(other).get_new_length(10) == 54
+
+def test_pipelines_propagate_the_number_of_frames():
+    pipeline = Pipeline(ExtractSlice(slice(0, 10)), Invert(), ExtractOne(0), Invert())
+    assert pipeline.get_new_length(44) == 1
+    assert pipeline.cost(100, 100, 44) == 100*100*10 + 100*100*1
+
+def test_pipelines_propagate_the_dimensions():
+    assert Pipeline(Zoom(0.5), Invert()).cost(100, 100, 4) == Zoom(0.5).cost(100, 100, 4) + 50*50*4
+
+def test_estimated_durations_use_the_number_of_frames(calibrated_invert):
+    assert Invert().estimate_duration(100, 100, 44) == pytest.approx(440)
+    assert Pipeline(ExtractOne(0), Invert()).estimate_duration(100, 100, 44) is None # ExtractOne is not calibrated.
+    cost_model.record(ExtractOne(0), 100, 100, 44, 0.)
+    cost_model.fit()
+    assert Pipeline(ExtractOne(0), Invert()).estimate_duration(100, 100, 44) == pytest.approx(10)
+
+def test_extractions_before_costly_effects_are_not_routed_to_the_background():
+    ld_kwargs = {'cost_threshold': 100_000}
+    assert transformation_executor.routes_to_background(Invert(), 100, 100, 44, **ld_kwargs)
+    assert not transformation_executor.routes_to_background(Pipeline(First(), Invert()), 100, 100, 44, **ld_kwargs)
+    assert transformation_executor.routes_to_background(Pipeline(Invert(), First()), 100, 100, 44, **ld_kwargs)
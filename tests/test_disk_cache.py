@@ -0,0 +1,69 @@
+"""Tests of the DiskCache, storing the loaded frames on the disk."""
+import os
+import pytest
+from pygame import SRCALPHA, Surface
+from pygame.image import tobytes
+from gamarts import GIFFile, ImageFile
+from gamarts.art import DiskCache, disk_cache
+from gamarts.transform import Zoom
+from conftest import surface_bytes
+
+@pytest.fixture
+def enabled_disk_cache(tmp_path):
+    """Enable the disk cache in a temporary directory during a test."""
+    disk_cache.directory = str(tmp_path / 'cache')
+    yield disk_cache
+    disk_cache.wait()
+    disk_cache.directory = None
+
+def test_frames_round_trip(tmp_path):
+    cache = DiskCache(str(tmp_path))
+    opaque, transparent = Surface((3, 2)), Surface((5, 4), SRCALPHA)
+    opaque.fill((255, 0, 0))
+    transparent.fill((0, 0, 255, 128))
+    cache.save('key', (opaque, transparent, opaque), (10, 20, 30), 1, 5, 4).result()
+    loaded, durations, introduction, width, height = cache.load('key')
+    assert (durations, introduction, width, height) == ((10, 20, 30), 1, 5, 4)
+    assert [surf.get_size() for surf in loaded] == [(3, 2), (5, 4), (3, 2)]
+    assert loaded[0] is loaded[2] # Frames present several times are stored once.
+    assert tobytes(loaded[0], 'RGB') == tobytes(opaque, 'RGB')
+    assert loaded[1].get_flags() & SRCALPHA and surface_bytes(loaded[1]) == surface_bytes(transparent)
+
+def test_missing_and_other_keys_are_not_loaded(tmp_path):
+    cache = DiskCache(str(tmp_path))
+    assert cache.load('key') is None
+    cache.save('key', (Surface((2, 2)),), (0,), 0, 2, 2)
+    cache.wait()
+    assert cache.load('other') is None
+    assert cache.load('key') is not None
+    cache.clear()
+    assert cache.load('key') is None
+
+def test_disabled_cache():
+    assert not DiskCache().enabled
+
+def test_arts_are_mapped_back(enabled_disk_cache):
+    first = ImageFile('images/Lenna.png', transformation=Zoom(0.5))
+    expected = surface_bytes(first.get())
+    enabled_disk_cache.wait()
+    assert [name for name in os.listdir(enabled_disk_cache.directory) if name.endswith('.frames')]
+    second = ImageFile('images/Lenna.png', transformation=Zoom(0.5))
+    second.load()
+    assert second.get() is not first.get()
+    assert second.get().get_size() == (255, 256)
+    assert surface_bytes(second.get()) == expected
+
+def test_animated_arts_are_mapped_back(enabled_disk_cache):
+    first = GIFFile('images/wikipedia_earth.gif')
+    first.load()
+    enabled_disk_cache.wait()
+    second = GIFFile('images/wikipedia_earth.gif')
+    second.load()
+    assert second.durations == first.durations
+    assert [surface_bytes(surf) for surf in second.surfaces] == [surface_bytes(surf) for surf in first.surfaces]
+
+def test_different_on_loading_transformations_are_stored_separately(enabled_disk_cache):
+    ImageFile('images/Lenna.png', transformation=Zoom(0.5)).load()
+    enabled_disk_cache.wait()
+    art = ImageFile('images/Lenna.png', transformation=Zoom(0.25))
+    assert art.get().get_size() == (127, 128)
@@ -0,0 +1,30 @@
+"""Tests of the ImageFolder, whose images are loaded in the natural order of their names."""
+import os
+import pytest
+from pygame import Surface
+from pygame.image import save
+from gamarts import ImageFolder
+from gamarts.art.file import _natural_key
+
+NAMES = ('frame1.png', 'frame2.png', 'frame3.png', 'frame10.png', 'frame11.png', 'frame20.png', 'Frame21.png', 'frame100.png')
+
+@pytest.fixture
+def folder(tmp_path):
+    """A folder of images whose color is the index of the image in the natural order, saved in another order."""
+    for index, name in sorted(enumerate(NAMES), key=lambda item: item[1]):
+        surf = Surface((4, 3))
+        surf.fill((index, 0, 0))
+        save(surf, str(tmp_path / name))
+    return str(tmp_path)
+
+def test_the_numbers_are_compared_by_value():
+    assert sorted(reversed(NAMES), key=_natural_key) == list(NAMES)
+    assert sorted(['b', 'a10', 'a9', 'a09'], key=_natural_key) == ['a09', 'a9', 'a10', 'b']
+
+@pytest.mark.parametrize('parallel', [False, True])
+def test_the_images_are_loaded_in_natural_order(folder, parallel):
+    os.mkdir(os.path.join(folder, 'frame4')) # The subfolders are ignored.
+    art = ImageFolder(folder, 50, parallel=parallel)
+    art.load()
+    assert [surf.get_at((0, 0))[0] for surf in art.surfaces] == list(range(len(NAMES)))
+    assert art.durations == (50,)*len(NAMES)
@@ -0,0 +1,43 @@
+"""Tests of the decoding of the gifs."""
+from PIL import Image
+from gamarts import GIFFile
+from gamarts.transform import Invert
+from gamarts.art.file import _scan_gif
+from conftest import surface_bytes
+
+PATH = 'images/wikipedia_earth.gif'
+INVERTED = bytes(range(255, -1, -1))
+
+def pillow_frames(path):
+    with Image.open(path) as image:
+        for index in range(image.n_frames):
+            image.seek(index)
+            yield image.info.get('duration', 0), image.convert('RGBA').tobytes()
+
+def test_scan_gif_gives_the_durations_of_pillow():
+    assert _scan_gif(PATH) == tuple(duration for duration, _ in pillow_frames(PATH))
+
+def test_scan_gif_keeps_the_readable_frames_of_truncated_files(tmp_path):
+    with open(PATH, 'rb') as file:
+        data = file.read()
+    truncated = tmp_path / 'truncated.gif'
+    truncated.write_bytes(data[:len(data)//2])
+    durations = _scan_gif(str(truncated))
+    assert 0 < len(durations) < len(_scan_gif(PATH))
+
+def test_frames_are_decoded_like_pillow():
+    art = GIFFile(PATH)
+    art.load()
+    expected = list(pillow_frames(PATH))
+    assert art.durations == tuple(duration for duration, _ in expected)
+    assert [surface_bytes(surf) for surf in art.surfaces] == [pixels for _, pixels in expected]
+
+def test_in_place_effects_modify_the_decoded_frames():
+    art, reference = GIFFile(PATH), GIFFile(PATH)
+    art.transform(Invert())
+    art.get()
+    reference.get()
+    for surf, original in zip(art.surfaces, reference.surfaces):
+        pixels, original_pixels = surface_bytes(surf), surface_bytes(original)
+        assert pixels[3::4] == original_pixels[3::4]
+        assert all(pixels[channel::4] == original_pixels[channel::4].translate(INVERTED) for channel in range(3))
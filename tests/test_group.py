@@ -0,0 +1,38 @@
+"""Tests of the ArtGroup, whose members must be animated like arts updated one by one."""
+import random
+from gamarts import GIFFile, ArtGroup
+
+def test_group_updates_like_the_members():
+    gif = GIFFile('images/wikipedia_earth.gif')
+    gif.load()
+    grouped = [gif.reference() for _ in range(5)]
+    alone = [gif.reference() for _ in range(5)]
+    group = ArtGroup(*grouped)
+    for art in grouped + alone:
+        art.get()
+    group.update(0) # The first update of the group reports the new durations of the members.
+    rng = random.Random(0)
+    for _ in range(200):
+        loop_duration = rng.uniform(0, 60)
+        changed = group.update(loop_duration)
+        expected = [art.update(loop_duration) for art in alone]
+        assert [art.index for art in grouped] == [art.index for art in alone]
+        assert list(changed) == expected
+
+def test_seek_and_update_of_a_member():
+    gif = GIFFile('images/wikipedia_earth.gif')
+    member, alone = gif.reference(), gif.reference()
+    group = ArtGroup(member)
+    member.get()
+    alone.get()
+    group.update(1800)
+    member.seek(3550)
+    alone.seek(3550)
+    assert member.index == alone.index == 39
+    member.update(200)
+    alone.update(200)
+    assert member.index == alone.index
+    assert member.get() is alone.get()
+    group.update(95)
+    alone.update(95)
+    assert member.index == alone.index
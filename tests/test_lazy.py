@@ -0,0 +1,45 @@
+"""Tests of the lazy exports of the packages, importing their submodules at the first access to their names."""
+import json
+import os
+import subprocess
+import sys
+import pytest
+import gamarts
+import gamarts.art
+import gamarts.mask
+import gamarts.transform
+from conftest import ROOT
+
+HEAVY_MODULES = ('numpy', 'PIL', 'pygame', 'pygamecv', 'cv2', 'gamarts.art.art', 'gamarts.art.file', 'gamarts.transform.transformation')
+
+def imported_modules(statement):
+    """Return the heavy modules imported by a statement run in a new interpreter."""
+    probe = f"import sys, json\n{statement}\nprint(json.dumps([name for name in {HEAVY_MODULES!r} if name in sys.modules]))"
+    env = dict(os.environ, PYTHONPATH=ROOT + os.pathsep + os.environ.get('PYTHONPATH', ''))
+    output = subprocess.run([sys.executable, '-c', probe], capture_output=True, text=True, check=True, env=env, cwd=ROOT).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+def test_importing_gamarts_does_not_import_the_submodules():
+    assert imported_modules("import gamarts, gamarts.art, gamarts.transform, gamarts.mask") == []
+
+def test_the_submodules_are_imported_at_the_first_access():
+    assert set(imported_modules("import gamarts; gamarts.ImageFile")) >= {'pygame', 'PIL', 'gamarts.art.art', 'gamarts.art.file'}
+
+@pytest.mark.parametrize('package', [gamarts, gamarts.art, gamarts.transform, gamarts.mask])
+def test_all_and_dir_list_the_exported_names(package):
+    assert package.__all__ and set(package.__all__) <= set(dir(package))
+    for name in package.__all__:
+        assert getattr(package, name) is not None
+
+def test_the_exported_names_are_the_original_objects():
+    from gamarts.art.file import ImageFile # pylint: disable=import-outside-toplevel
+    from gamarts.transform.transformation import Zoom # pylint: disable=import-outside-toplevel
+    assert gamarts.ImageFile is gamarts.art.ImageFile is ImageFile
+    assert gamarts.transform.Zoom is Zoom
+    assert gamarts.manifest is gamarts.art.manifest and isinstance(gamarts.manifest, gamarts.Manifest)
+
+@pytest.mark.parametrize('package', [gamarts, gamarts.art, gamarts.transform, gamarts.mask])
+def test_unknown_names_raise_attribute_errors(package):
+    with pytest.raises(AttributeError, match='Missing'):
+        package.Missing # pylint: disable=pointless-statement
+    assert not hasattr(package, 'Missing')
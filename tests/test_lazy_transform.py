@@ -0,0 +1,81 @@
+"""Tests of the lazy transformations, applied to each frame when it is accessed."""
+import gc
+import pytest
+from gamarts import ImageFolder, ImageFile, memory_manager
+from gamarts.art.lazy import TransformedFrames
+from gamarts.transform import Invert, SlowDown, Zoom
+from conftest import surface_bytes
+
+LAZY = {'lazy_transform': True, 'lazy_prefetch': 0, 'cost_threshold': float('inf')}
+
+@pytest.fixture
+def squares():
+    art = ImageFolder('images/squares', 100)
+    art.load()
+    return art
+
+@pytest.fixture
+def budget():
+    """A budget large enough to keep every art, the arts of the previous tests being collected."""
+    gc.collect()
+    memory_manager.budget = 2**40
+    yield
+    memory_manager.budget = None
+
+def registered_size(art):
+    return memory_manager._arts[id(art)][1] # pylint: disable=protected-access
+
+def test_only_the_accessed_frames_are_transformed(squares):
+    squares.transform(Invert())
+    squares.get(**LAZY)
+    assert isinstance(squares.surfaces, TransformedFrames)
+    assert list(squares.surfaces._frames) == [0] # pylint: disable=protected-access
+    squares.surfaces[3]
+    assert sorted(squares.surfaces._frames) == [0, 3] # pylint: disable=protected-access
+
+def test_the_lazy_frames_are_the_transformed_frames(squares):
+    eager = ImageFolder('images/squares', 100)
+    for art, ld_kwargs in ((squares, LAZY), (eager, {'cost_threshold': float('inf')})):
+        art.transform(Zoom(0.5))
+        art.get(**ld_kwargs)
+        art.transform(Invert())
+        art.get(**ld_kwargs)
+    assert isinstance(squares.surfaces, TransformedFrames) and squares.size == eager.size == (255, 256)
+    assert [surface_bytes(surf) for surf in squares.surfaces] == [surface_bytes(surf) for surf in eager.surfaces]
+    squares.get(**LAZY)
+    assert isinstance(squares.surfaces, tuple) # Complete frames are replaced by a tuple.
+
+def test_the_next_frames_are_prefetched(squares):
+    squares.transform(Invert())
+    squares.get(**{**LAZY, 'lazy_prefetch': 2})
+    for future in list(squares.surfaces._pending.values()): # pylint: disable=protected-access
+        future.result()
+    assert sorted(squares.surfaces._frames) == [0, 1, 2] # pylint: disable=protected-access
+
+def test_transformations_changing_the_durations_are_not_lazy(squares):
+    squares.transform(SlowDown(2))
+    squares.get(**LAZY)
+    assert isinstance(squares.surfaces, tuple) and squares.durations == (200,)*5
+
+def test_the_registered_size_grows_with_the_transformed_frames(budget, squares):
+    squares.get()
+    squares.transform(Zoom(2))
+    squares.get(**LAZY)
+    sizes = [registered_size(squares)]
+    for index in range(1, 5):
+        squares.surfaces[index]
+        sizes.append(registered_size(squares))
+        assert sizes[-1] == squares.bytesize
+    assert all(previous < size for previous, size in zip(sizes, sizes[1:]))
+
+def test_the_budget_is_enforced_when_the_frames_are_transformed(budget, squares):
+    other = ImageFile('images/Lenna.png')
+    other.get()
+    squares.get()
+    squares.transform(Zoom(2))
+    squares.get(**LAZY)
+    memory_manager.budget = memory_manager.usage + 1
+    squares.surfaces[1]
+    assert other.is_loaded() # The arts are only unloaded by the next .get() or .update() on the main thread.
+    squares.get(**LAZY)
+    assert not other.is_loaded() and squares.is_loaded()
@@ -0,0 +1,72 @@
+"""Tests of the manifest, letting the arts be created and loaded without reading their files again."""
+import os
+import shutil
+import pytest
+from pygame import Surface
+from pygame.image import save
+from gamarts import GIFFile, ImageFolder, manifest, write_manifest
+from gamarts.art import file as file_module
+from gamarts.art.file import _scan_gif
+
+GIF = 'images/wikipedia_earth.gif'
+
+def fail(*_):
+    raise AssertionError("The file should not have been read.")
+
+@pytest.fixture
+def assets(tmp_path):
+    """A gif and a folder of three images, whose manifest is opened."""
+    shutil.copy(GIF, tmp_path / 'earth.gif')
+    os.mkdir(tmp_path / 'squares')
+    for index in range(3):
+        surf = Surface((4, 3))
+        surf.fill((index, 0, 0))
+        save(surf, str(tmp_path / 'squares' / f'square{index}.png'))
+    gif, folder = str(tmp_path / 'earth.gif'), str(tmp_path / 'squares')
+    write_manifest(str(tmp_path / 'manifest.json'), [gif, folder])
+    manifest.open(str(tmp_path / 'manifest.json'))
+    yield gif, folder
+    manifest.clear()
+
+def modify(path):
+    """Change the modification time of a file or a folder, as if it had been modified."""
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+def test_a_fresh_manifest_skips_the_reading_of_the_files(assets, monkeypatch):
+    gif, folder = assets
+    monkeypatch.setattr(file_module, '_read_size', fail)
+    monkeypatch.setattr(file_module, '_scan_gif', fail)
+    monkeypatch.setattr(file_module, '_list_images', fail)
+    art, squares = GIFFile(gif), ImageFolder(folder, 50)
+    assert (art.width, art.height) == (300, 300) and (squares.width, squares.height) == (4, 3)
+    art.load()
+    squares.load()
+    assert art.durations == _scan_gif(GIF)
+    assert [surf.get_at((0, 0))[0] for surf in squares.surfaces] == [0, 1, 2]
+
+def test_a_modified_file_is_scanned_again(assets, monkeypatch):
+    gif, _ = assets
+    scanned = []
+    monkeypatch.setattr(file_module, '_scan_gif', lambda path: scanned.append(path) or _scan_gif(path))
+    art = GIFFile(gif)
+    modify(gif)
+    art.load()
+    assert scanned == [gif] and art.durations == _scan_gif(GIF)
+
+def test_a_modified_folder_is_listed_again(assets):
+    _, folder = assets
+    art = ImageFolder(folder, 50)
+    surf = Surface((4, 3))
+    surf.fill((3, 0, 0))
+    save(surf, os.path.join(folder, 'square3.png'))
+    modify(folder)
+    art.load()
+    assert [surf.get_at((0, 0))[0] for surf in art.surfaces] == [0, 1, 2, 3]
+
+def test_the_entries_of_missing_files_are_stale(assets):
+    gif, _ = assets
+    entry = manifest.entry(gif)
+    assert manifest.is_fresh(entry, gif)
+    os.remove(gif)
+    assert not manifest.is_fresh(entry, gif)
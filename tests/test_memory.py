@@ -0,0 +1,77 @@
+"""Tests of the memory manager."""
+from concurrent.futures import ThreadPoolExecutor
+import gc
+import pytest
+from gamarts import ImageFile, memory_manager
+from gamarts.transform import Flip, Pipeline, Zoom
+
+@pytest.fixture(autouse=True)
+def evict_previous_arts():
+    """The arts left by the previous tests must not be evicted instead of the arts of the test."""
+    gc.collect()
+    memory_manager.budget = 0
+    memory_manager.enforce()
+    memory_manager.budget = None
+
+def test_arts_are_evicted_over_the_budget():
+    first, second = ImageFile('images/Lenna.png'), ImageFile('images/Lenna.png')
+    first.get()
+    memory_manager.budget = memory_manager.usage # The arts left by other tests that cannot be evicted count in the usage.
+    try:
+        second.get()
+        assert not first.is_loaded() and second.is_loaded()
+        assert first.get().get_size() == (511, 512) # Evicted arts are loaded again.
+    finally:
+        memory_manager.budget = None
+
+def test_arts_are_not_evicted_by_other_threads():
+    first, second = ImageFile('images/Lenna.png'), ImageFile('images/Lenna.png')
+    first.get()
+    memory_manager.budget = memory_manager.usage # The arts left by other tests that cannot be evicted count in the usage.
+    try:
+        with ThreadPoolExecutor(1) as executor:
+            executor.submit(second.load).result()
+        assert first.is_loaded() and second.is_loaded()
+        second.update(10) # The main thread unloads the least recently used art.
+        assert not first.is_loaded() and second.is_loaded()
+    finally:
+        memory_manager.budget = None
+
+def test_transformations_are_recorded_flat_only_when_the_art_can_be_evicted():
+    art, permanent = ImageFile('images/Lenna.png'), ImageFile('images/Lenna.png', permanent=True)
+    for _ in range(5):
+        art.transform(Flip(True, False))
+        art.get()
+    assert art._applied_transfo_pipeline is None and not art._is_evictable() # pylint: disable=protected-access
+    memory_manager.budget = 2**40
+    try:
+        art.unload()
+        for _ in range(50):
+            art.transform(Pipeline(Flip(True, False), Pipeline(Flip(True, False))))
+            art.get()
+            permanent.transform(Flip(True, False))
+            permanent.get()
+        assert len(art._applied_transfo_pipeline.steps()) == 100 # pylint: disable=protected-access
+        assert all(isinstance(step, Flip) for step in art._applied_transfo_pipeline._transformations) # pylint: disable=protected-access
+        assert permanent._applied_transfo_pipeline is None # pylint: disable=protected-access
+        for _ in range(30): # The transformations are not nested at each eviction.
+            art._evict() # pylint: disable=protected-access
+            art.get()
+        assert len(art._applied_transfo_pipeline._transformations) == 100 # pylint: disable=protected-access
+    finally:
+        memory_manager.budget = None
+
+def test_transformations_of_references_are_applied_again_to_their_original():
+    memory_manager.budget = 2**40
+    try:
+        original = ImageFile('images/Lenna.png')
+        reference = original.reference()
+        reference.transform(Zoom(0.5))
+        reference.get()
+        assert original.get().get_size() == (255, 256)
+        original._evict() # pylint: disable=protected-access
+        assert original.get().get_size() == (255, 256)
+        original._evict() # pylint: disable=protected-access
+        assert reference.get().get_size() == (255, 256)
+    finally:
+        memory_manager.budget = None
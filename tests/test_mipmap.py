@@ -0,0 +1,66 @@
+"""Tests of the mip maps, the pyramids of smaller frames scaled instead of the frames by the smooth zooms."""
+import pytest
+import pygame.transform as tf
+from pygame import Surface
+from gamarts import ImageFile
+from gamarts.transform import MipMaps, Resize, Zoom, mipmaps
+from conftest import surface_bytes
+
+@pytest.fixture
+def frame():
+    """A frame of 512x256 pixels, with its pyramid."""
+    surf = ImageFile('images/Lenna.png').get()
+    surf = tf.smoothscale(surf, (512, 256))
+    mipmaps.build((surf,)).result()
+    yield surf
+    mipmaps.discard((surf,))
+
+@pytest.fixture
+def scaled_sources(monkeypatch):
+    """Record the size of the surfaces scaled smoothly."""
+    sources = []
+    smoothscale = tf.smoothscale
+
+    def spy(surf, size, *args):
+        sources.append(surf.get_size())
+        return smoothscale(surf, size, *args)
+
+    monkeypatch.setattr(tf, 'smoothscale', spy)
+    return sources
+
+def test_the_levels_halve_the_size_until_the_minimum():
+    surf = Surface((100, 40), depth=32)
+    pyramids = MipMaps(min_size=8)
+    pyramids.build((surf,)).result()
+    assert [level.get_size() for level in pyramids.levels(surf)] == [(50, 20), (25, 10)]
+    assert pyramids.levels(Surface((100, 40), depth=32)) == ()
+
+@pytest.mark.parametrize('size, source', [
+    ((512, 256), (512, 256)),
+    ((300, 100), (512, 256)),
+    ((256, 128), (256, 128)),
+    ((200, 100), (256, 128)),
+    ((100, 64), (128, 64)),
+    ((100, 65), (256, 128)),
+    ((20, 10), (32, 16)),
+    ((4, 2), (16, 8)), # The smallest level.
+    ((1024, 512), (512, 256)), # Zooms in scale the frame.
+])
+def test_the_smallest_level_larger_than_the_size_is_chosen(frame, size, source):
+    assert mipmaps.source(frame, size).get_size() == source
+
+@pytest.mark.parametrize('transformation, source, size', [
+    (Zoom(0.3, smooth=True), (256, 128), (153, 76)),
+    (Zoom((0.1, 0.5), smooth=True), (256, 128), (51, 128)),
+    (Zoom(0.05, smooth=True), (32, 16), (25, 12)),
+    (Resize((64, 30), smooth=True), (64, 32), (64, 30)),
+    (Resize((65, 30), smooth=True), (128, 64), (65, 30)),
+])
+def test_smooth_zooms_and_resizes_scale_the_chosen_level(frame, scaled_sources, transformation, source, size):
+    surfaces, *_, width, height = transformation.apply((frame,), (0,), 0, 0, *frame.get_size())
+    assert scaled_sources == [source] and surfaces[0].get_size() == (width, height) == size
+    assert surface_bytes(surfaces[0]) == surface_bytes(tf.smoothscale(mipmaps.source(frame, size), size))
+
+def test_sharp_zooms_do_not_use_the_levels(frame, scaled_sources):
+    surfaces, *_ = Zoom(0.25).apply((frame,), (0,), 0, 0, *frame.get_size())
+    assert scaled_sources == [] and surfaces[0].get_size() == (128, 64)
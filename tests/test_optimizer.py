@@ -0,0 +1,86 @@
+"""Tests of the rewrites of the optimizer, and of their application by the arts."""
+import pytest
+from gamarts import ImageFile, Rectangle
+from gamarts.transform import Pipeline, Resize, Zoom, Rotate, Flip, Crop, SpeedUp, SlowDown, SetIntroductionIndex, optimizer
+from conftest import surface_bytes
+
+def rewritten(*steps, size=(100, 80)):
+    return optimizer.rewrite(steps, *size)[0]
+
+def test_identities_are_removed():
+    assert rewritten(Rotate(0), Rotate(360), Zoom(1), Flip(False, False), SpeedUp(1), Resize((100, 80)), Crop(0, 0, 200, 200)) == ()
+
+def test_real_steps_are_kept():
+    steps = rewritten(Resize((50, 50)))
+    assert len(steps) == 1 and steps[0].size == (50, 50)
+
+def test_flips_are_fused():
+    assert rewritten(Flip(True, False), Flip(True, False)) == ()
+    (flip,) = rewritten(Flip(True, False), Flip(True, True))
+    assert (flip.horizontal, flip.vertical) == (False, True)
+
+def test_resamplings_are_fused_to_the_final_size():
+    (resize,) = rewritten(Zoom(0.5, True), Zoom(0.3, True))
+    assert isinstance(resize, Resize) and resize.smooth
+    assert resize.size == Zoom(0.3).get_new_dimension(*Zoom(0.5).get_new_dimension(100, 80))
+
+def test_scale2x_is_not_fused():
+    assert len(rewritten(Zoom(2), Zoom(3))) == 2
+
+def test_crops_are_fused():
+    (crop,) = rewritten(Crop(10, 10, 50, 50), Crop(5, 5, 20, 20))
+    assert tuple(crop.rect) == (15, 15, 20, 20)
+
+def test_right_angle_rotations_are_fused():
+    (rotation,) = rewritten(Rotate(90), Rotate(180))
+    assert rotation.angle == 270
+    assert len(rewritten(Rotate(30), Rotate(30))) == 2
+
+def test_durations_and_introductions_are_folded():
+    assert rewritten(SpeedUp(2), SlowDown(2)) == ()
+    (introduction,) = rewritten(SetIntroductionIndex(1), SetIntroductionIndex(3))
+    assert introduction.introduction == 3
+
+def test_rotations_and_zooms_are_fused_on_demand():
+    assert [type(step) for step in rewritten(Rotate(30), Zoom(0.5, True))] == [Rotate, Zoom]
+    optimizer.rotozoom = True
+    try:
+        (rotozoom,) = rewritten(Rotate(30), Zoom(0.5, True), Zoom(0.5, True))
+    finally:
+        optimizer.rotozoom = False
+    assert (rotozoom.angle, rotozoom.scale) == (30, 0.25)
+
+def test_explain_lists_the_rewrites():
+    explanation = optimizer.explain(Pipeline(Flip(True, False), Flip(True, False)), 100, 80)
+    assert "2 steps rewritten into 0 steps" in explanation and "removed" in explanation
+
+def test_singleton_is_not_hidden_by_its_module():
+    import gamarts.transform # pylint: disable=import-outside-toplevel
+    from gamarts.transform import optimization # pylint: disable=import-outside-toplevel,unused-import
+    assert hasattr(gamarts.transform.optimizer, 'optimize')
+    ImageFile('images/Lenna.png').get()
+
+def test_geometry_art_with_loading_transformation():
+    rectangle = Rectangle((255, 0, 0), 20, 20, transformation=Resize((50, 50)))
+    assert rectangle.get().get_size() == rectangle.size == (50, 50)
+    rectangle._evict()
+    assert rectangle.get().get_size() == (50, 50)
+
+@pytest.mark.parametrize('pipeline', [
+    Pipeline(Crop(10, 20, 300, 400), Crop(5, 5, 100, 100)),
+    Pipeline(Rotate(90), Rotate(180)),
+    Pipeline(Flip(True, False), Flip(True, True)),
+    Pipeline(Rotate(30), Zoom(0.5, True)),
+])
+def test_optimized_pipelines_give_the_same_frames(pipeline):
+    optimized, plain = ImageFile('images/Lenna.png'), ImageFile('images/Lenna.png')
+    optimized.transform(pipeline)
+    surf = optimized.get(cost_threshold=float('inf'))
+    optimizer.enabled = False
+    try:
+        plain.transform(pipeline)
+        expected = plain.get(cost_threshold=float('inf'))
+    finally:
+        optimizer.enabled = True
+    assert surf.get_size() == expected.get_size()
+    assert surface_bytes(surf) == surface_bytes(expected)
@@ -0,0 +1,91 @@
+"""Tests of the Preloader, loading the arts in the background."""
+from threading import Event
+import pytest
+from pygame import Surface
+from gamarts import ImageFile, Preloader
+
+class BlockedImage(ImageFile):
+    """An ImageFile whose loading waits for an event."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__('images/Lenna.png', *args, **kwargs)
+        self.allowed = Event()
+
+    def _load(self, **ld_kwargs):
+        assert self.allowed.wait(10)
+        super()._load(**ld_kwargs)
+
+@pytest.fixture
+def placeholder():
+    surf = Surface((1, 1))
+    surf.fill((255, 0, 255))
+    return surf
+
+def test_the_placeholder_is_returned_until_the_art_is_loaded(placeholder):
+    preloader = Preloader(2, placeholder)
+    art = BlockedImage()
+    future, = preloader.preload(art)
+    assert art.get() is placeholder
+    assert not preloader.is_done(art) and not art.is_loaded()
+    art.allowed.set()
+    future.result(10)
+    frame = art.get()
+    assert frame is not placeholder and frame.get_size() == (511, 512)
+
+def test_the_art_is_loaded_on_the_calling_thread_without_placeholder():
+    preloader = Preloader(2)
+    art, other = BlockedImage(), BlockedImage()
+    preloader.preload(other) # Keep the workers busy.
+    art.allowed.set()
+    assert art.get().get_size() == (511, 512)
+    other.allowed.set()
+    assert preloader.wait(other, timeout=10)
+
+def test_specific_placeholders(placeholder):
+    preloader = Preloader(2, Surface((2, 2)))
+    art = BlockedImage()
+    preloader.preload(art, placeholder=placeholder)
+    assert art.get() is placeholder
+    art.allowed.set()
+    assert preloader.wait(art, timeout=10)
+
+def test_loaded_and_preloading_arts_are_not_loaded_again():
+    preloader = Preloader(2)
+    art = BlockedImage()
+    first, = preloader.preload(art)
+    second, = preloader.preload(art)
+    assert first is second
+    art.allowed.set()
+    first.result(10)
+    third, = preloader.preload(art)
+    assert third.done() and third is not first
+
+def test_group_progress_and_waiting():
+    preloader = Preloader(4)
+    arts = [BlockedImage() for _ in range(4)]
+    preloader.preload(*arts, group='level')
+    assert preloader.progress('level') == 0
+    assert not preloader.wait_group('level', timeout=0.05)
+    arts[0].allowed.set()
+    arts[1].allowed.set()
+    assert preloader.wait(arts[0], arts[1], timeout=10)
+    assert preloader.progress('level') == 0.5
+    for art in arts[2:]:
+        art.allowed.set()
+    assert preloader.wait_group('level', timeout=10)
+    assert preloader.progress('level') == 1 and all(art.is_loaded() for art in arts)
+    preloader.forget_group('level')
+    assert preloader.progress('level') == 1 and preloader.wait_group('level')
+
+def test_priorities():
+    preloader = Preloader(1)
+    blocker = BlockedImage()
+    preloader.preload(blocker)
+    order = []
+    arts = [BlockedImage() for _ in range(3)]
+    for priority, art in enumerate(arts):
+        art.allowed.set()
+        preloader.preload(art, priority=priority)[0].add_done_callback(lambda _, art=art: order.append(art))
+    blocker.allowed.set()
+    assert preloader.wait(*arts, timeout=10)
+    assert order == arts[::-1]
@@ -0,0 +1,70 @@
+"""Tests of the RotationCache, storing the frames of an art rotated at a fixed number of angles."""
+import pytest
+import pygame.transform as tf
+from gamarts import ImageFolder, RotationCache
+from gamarts.art.memory import surfaces_bytesize
+from conftest import surface_bytes
+
+@pytest.fixture
+def art():
+    art = ImageFolder('images/squares', 100)
+    art.load()
+    return art
+
+def rotated_size(art, step, steps):
+    return surfaces_bytesize((tf.rotate(art.surfaces[0], step*360/steps),))
+
+@pytest.mark.parametrize('angle, step', [(0, 0), (2.4, 0), (2.6, 1), (5, 1), (357.6, 0), (-2.6, 71), (-5, 71), (360 + 10, 2), (720, 0)])
+def test_the_angles_are_rounded_to_the_nearest_step(angle, step):
+    assert RotationCache(None, steps=72).step_of(angle) == step
+
+def test_the_frames_are_rotated_once_per_step(art):
+    cache = RotationCache(art, steps=8)
+    first = cache.get(40)
+    assert surface_bytes(first) == surface_bytes(tf.rotate(art.surfaces[0], 45))
+    assert cache.get(50) is first and cache.get(45 - 360) is first
+    assert cache.get(0) is not first
+    assert (cache.hits, cache.misses, len(cache)) == (2, 2, 2)
+    assert cache.get(45, scale=0.5) is not first and len(cache) == 3 # Each scale is stored separately.
+
+def cached_steps(cache):
+    return [step for _, step, _ in cache._entries] # pylint: disable=protected-access
+
+def test_the_least_recently_used_frames_are_removed_over_the_budget(art):
+    sizes = [rotated_size(art, step, 8) for step in range(8)]
+    cache = RotationCache(art, steps=8, budget=sizes[0] + sizes[1] + sizes[2])
+    first = cache.get(0)
+    cache.get(45)
+    cache.get(90)
+    assert cached_steps(cache) == [0, 1, 2] and cache.usage == sum(sizes[:3])
+    assert cache.get(0) is first # The first frame is now the most recently used.
+    cache.get(180) # The frame rotated by 45°, the least recently used, is removed.
+    assert cached_steps(cache) == [2, 0, 4] and cache.usage == sizes[2] + sizes[0] + sizes[4] <= cache.budget
+    cache.get(135) # The frame rotated by 90° is removed, the frames rotated by 135° and 45° have the same size.
+    assert cached_steps(cache) == [0, 4, 3] and cache.usage == cache.budget
+    assert cache.get(0) is first
+
+def test_the_usage_stays_under_the_budget(art):
+    cache = RotationCache(art, steps=36, budget=3*rotated_size(art, 5, 36))
+    for angle in range(0, 360, 10):
+        cache.get(angle)
+        assert cache.usage <= cache.budget
+    assert 1 <= len(cache) <= 3
+    small = RotationCache(art, steps=8, budget=10)
+    assert small.get(45).get_size() > (0, 0) and len(small) == 0 and small.usage == 0 # Too large frames are not kept.
+
+def test_prerender_rotates_all_the_frames_in_the_background(art):
+    cache = RotationCache(art, steps=4)
+    cache.prerender().result()
+    assert len(cache) == 4*len(art.surfaces)
+    misses = cache.misses
+    for index in range(len(art.surfaces)):
+        art._index = index # pylint: disable=protected-access
+        cache.get(90)
+    assert cache.misses == misses and cache.hits == len(art.surfaces)
+    cache.clear()
+    assert len(cache) == 0 and cache.usage == 0
+
+def test_the_steps_must_be_positive(art):
+    with pytest.raises(ValueError):
+        RotationCache(art, steps=0)
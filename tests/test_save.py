@@ -0,0 +1,68 @@
+"""Tests of the saving of the arts, encoded in the background."""
+import os
+import pytest
+from PIL import Image
+from pygame.image import tobytes
+from gamarts import APNGFile, GIFFile, ImageFile, WebPFile
+from gamarts._common import LoadingError
+
+DURATIONS = (40, 50, 60, 70)
+
+@pytest.fixture
+def art(tmp_path):
+    """An opaque animation of frames of different colors and durations."""
+    frames = [Image.new('RGBA', (8, 6), (60*index, 255 - 60*index, 30, 255)) for index in range(len(DURATIONS))]
+    path = str(tmp_path / 'source.png')
+    frames[0].save(path, save_all=True, append_images=frames[1:], duration=list(DURATIONS), loop=0)
+    art = APNGFile(path)
+    art.load()
+    return art
+
+def frames(art):
+    return [tobytes(surf, 'RGB') for surf in art.surfaces]
+
+@pytest.mark.parametrize('cls, name, options', [
+    (GIFFile, 'saved.gif', {}),
+    (WebPFile, 'saved.webp', {'lossless': True}),
+    (APNGFile, 'saved.png', {}),
+])
+def test_animations_are_saved_and_loaded_back(art, tmp_path, cls, name, options):
+    path = str(tmp_path / name)
+    assert art.save(path, **options).result() is None
+    saved = cls(path)
+    saved.load()
+    assert saved.durations == DURATIONS
+    assert frames(saved) == frames(art)
+
+def test_a_slice_of_the_frames_is_saved(art, tmp_path):
+    path = str(tmp_path / 'slice.webp')
+    art.save(path, slice(1, 3), lossless=True).result()
+    saved = WebPFile(path)
+    saved.load()
+    assert saved.durations == DURATIONS[1:3] and frames(saved) == frames(art)[1:3]
+
+def test_one_frame_is_saved_as_an_image(art, tmp_path):
+    path = str(tmp_path / 'frame.png')
+    art.save(path, 2).result()
+    saved = ImageFile(path)
+    saved.load()
+    assert frames(saved) == frames(art)[2:3]
+
+def test_every_frame_is_saved_in_a_sequence_of_images(art, tmp_path):
+    art.save(str(tmp_path / 'frame_{:02d}.png')).result()
+    assert sorted(os.listdir(tmp_path)) == ['frame_00.png', 'frame_01.png', 'frame_02.png', 'frame_03.png', 'source.png']
+    for index, pixels in enumerate(frames(art)):
+        saved = ImageFile(str(tmp_path / f'frame_{index:02d}.png'))
+        saved.load()
+        assert frames(saved) == [pixels]
+
+def test_the_errors_are_raised_by_the_future(art, tmp_path):
+    future = art.save(str(tmp_path / 'missing' / 'saved.gif'))
+    with pytest.raises(FileNotFoundError):
+        future.result()
+    with pytest.raises(FileNotFoundError):
+        art.save(str(tmp_path / 'missing' / 'frame_{}.png')).result()
+
+def test_unloaded_arts_cannot_be_saved(tmp_path):
+    with pytest.raises(LoadingError):
+        ImageFile('images/Lenna.png').save(str(tmp_path / 'lenna.png'))
@@ -0,0 +1,50 @@
+"""Tests of the SpriteSheet, whose frames are subsurfaces of one decoded sheet."""
+import pytest
+from PIL import Image
+from gamarts import ImageFile, SpriteSheet
+from gamarts.transform import Invert
+from conftest import surface_bytes
+
+@pytest.fixture
+def sheet(tmp_path):
+    """Save a sheet of 3 columns and 2 rows of frames of 4x5 pixels, each of its own color."""
+    image = Image.new('RGBA', (12, 10))
+    for index in range(6):
+        column, row = index % 3, index // 3
+        image.paste((40*index, 0, 255 - 40*index, 255), (4*column, 5*row, 4*column + 4, 5*row + 5))
+    path = tmp_path / 'sheet.png'
+    image.save(path)
+    return str(path)
+
+def test_frames_are_taken_row_by_row(sheet):
+    art = SpriteSheet(sheet, 50, grid=(3, 2))
+    art.load()
+    assert art.size == (4, 5) and art.durations == (50,)*6
+    assert [surf.get_at((0, 0))[:3] for surf in art.surfaces] == [(40*index, 0, 255 - 40*index) for index in range(6)]
+    assert all(surf.get_parent() is art.surfaces[0].get_parent() for surf in art.surfaces)
+
+def test_frame_size_and_count(sheet):
+    art = SpriteSheet(sheet, [10, 20, 30, 40], frame_size=(4, 5), count=4)
+    art.load()
+    assert len(art.surfaces) == 4 and art.durations == (10, 20, 30, 40)
+    assert surface_bytes(art.surfaces[3]) == surface_bytes(ImageFile(sheet).get().subsurface((0, 5, 4, 5)))
+
+def test_invalid_grids(sheet):
+    with pytest.raises(ValueError):
+        SpriteSheet(sheet, 50)
+    with pytest.raises(ValueError):
+        SpriteSheet(sheet, 50, frame_size=(4, 5), grid=(3, 2))
+    with pytest.raises(ValueError):
+        SpriteSheet(sheet, 50, grid=(5, 2))
+    with pytest.raises(ValueError):
+        SpriteSheet(sheet, 50, grid=(3, 2), count=7)
+
+def test_modified_frames_do_not_modify_the_sheet(sheet):
+    art = SpriteSheet(sheet, 50, grid=(3, 2))
+    art.load()
+    parent = art.surfaces[0].get_parent()
+    before = surface_bytes(parent)
+    art.transform(Invert())
+    art.get(cost_threshold=float('inf'))
+    assert surface_bytes(parent) == before
+    assert art.surfaces[1].get_at((0, 0))[:3] == (255 - 40, 255, 40)
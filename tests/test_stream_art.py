@@ -0,0 +1,139 @@
+"""Tests of the StreamArt, displaying frames produced on the fly with a bounded buffer."""
+import gc
+import time
+from threading import Event
+from weakref import ref
+import pytest
+from pygame import Surface
+from gamarts import ArtGroup, StreamArt
+from gamarts.transform import Invert
+
+class Source:
+    """An iterable of frames whose red channel is their index, keeping weak references to the produced frames."""
+
+    def __init__(self, length):
+        self.length = length
+        self.produced = []
+
+    def __iter__(self):
+        for index in range(self.length):
+            surf = Surface((4, 3))
+            surf.fill((index, 0, 0))
+            self.produced.append(ref(surf))
+            yield surf, 10
+
+def wait_until(predicate, timeout=5):
+    end = time.perf_counter() + timeout
+    while not predicate():
+        assert time.perf_counter() < end
+        time.sleep(0.005)
+
+def displayed(art):
+    return art.get().get_at((0, 0))[0]
+
+def buffered(art):
+    return len(art._buffer) # pylint: disable=protected-access
+
+def test_only_the_buffer_is_produced_in_advance():
+    source = Source(100)
+    art = StreamArt(source, (4, 3), buffer_size=3)
+    art.load()
+    wait_until(lambda: buffered(art) == 3)
+    time.sleep(0.05)
+    assert len(source.produced) == 4 and buffered(art) == 3 # The displayed frame and the buffer.
+    art.update(10)
+    wait_until(lambda: buffered(art) == 3)
+    assert len(source.produced) == 5
+
+def test_the_frames_are_displayed_in_order_while_the_buffer_is_refilled():
+    art = StreamArt(Source(30), (4, 3), buffer_size=3)
+    art.load()
+    shown = [displayed(art)]
+    for _ in range(29):
+        wait_until(lambda: buffered(art) > 0)
+        assert art.update(10)
+        shown.append(displayed(art))
+        assert buffered(art) <= 3
+    assert shown == list(range(30))
+    wait_until(lambda: art._exhausted) # pylint: disable=protected-access
+    assert not art.update(10) and displayed(art) == 29 # The last frame stays displayed.
+
+def test_the_time_is_shared_between_the_buffered_frames():
+    art = StreamArt(Source(5), (4, 3), buffer_size=4)
+    art.load()
+    wait_until(lambda: buffered(art) == 4)
+    assert art.update(35) and displayed(art) == 3
+    assert not art.update(4) and displayed(art) == 3
+    assert art.update(1) and displayed(art) == 4
+
+def test_a_late_frame_is_displayed_for_its_whole_duration():
+    allowed, calls = Event(), []
+    def source():
+        calls.append(None)
+        if len(calls) > 2: # The first two frames are produced at once, the next ones when allowed.
+            assert allowed.wait(5)
+        surf = Surface((4, 3))
+        surf.fill((len(calls), 0, 0))
+        return surf, 10
+    art = StreamArt(source, (4, 3), buffer_size=1)
+    art.load()
+    wait_until(lambda: buffered(art) == 1)
+    assert art.update(10) and displayed(art) == 2
+    assert not art.update(50) # The next frame is late, the current one stays displayed.
+    allowed.set()
+    wait_until(lambda: buffered(art) == 1)
+    assert art.update(0) and displayed(art) == 3
+    assert not art.update(9)
+
+def test_the_consumed_frames_are_released():
+    source = Source(20)
+    art = StreamArt(source, (4, 3), buffer_size=2)
+    art.load()
+    for _ in range(10):
+        wait_until(lambda: buffered(art) > 0)
+        art.update(10)
+    gc.collect()
+    alive = [index for index, surf in enumerate(source.produced) if surf() is not None]
+    assert alive and alive[0] >= 10 and len(alive) <= 3
+
+def test_the_transformations_are_applied_to_the_next_frames():
+    art = StreamArt(Source(10), (4, 3), buffer_size=2)
+    art.load()
+    wait_until(lambda: buffered(art) == 2)
+    art.transform(Invert())
+    assert displayed(art) == 255
+    for index in range(1, 5):
+        wait_until(lambda: buffered(art) > 0)
+        art.update(10)
+        assert displayed(art) == 255 - index
+
+def test_the_errors_of_the_source_are_raised_by_update():
+    def source():
+        raise OSError("The pipe is broken.")
+    art = StreamArt(source, (4, 3))
+    art._surfaces, art._durations, art._loaded = (Surface((4, 3)),), (10,), True # pylint: disable=protected-access
+    art._stopped = False # pylint: disable=protected-access
+    art._fill() # pylint: disable=protected-access
+    wait_until(lambda: art._error is not None) # pylint: disable=protected-access
+    with pytest.raises(OSError):
+        art.update(10)
+
+def test_the_production_stops_when_unloaded():
+    source = Source(100)
+    art = StreamArt(source, (4, 3), buffer_size=3)
+    art.load()
+    wait_until(lambda: buffered(art) == 3)
+    art.unload()
+    produced = len(source.produced)
+    time.sleep(0.05)
+    assert len(source.produced) == produced and buffered(art) == 0
+    art.load() # The stream continues from where it stopped.
+    assert displayed(art) == produced
+
+def test_stream_arts_cannot_be_members_of_groups():
+    art = StreamArt(Source(10), (4, 3))
+    with pytest.raises(ValueError):
+        ArtGroup(art)
+    with pytest.raises(ValueError):
+        ArtGroup().add(art.reference())
+    assert art._group is None # pylint: disable=protected-access
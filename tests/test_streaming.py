@@ -0,0 +1,51 @@
+"""Tests of the streaming arts, whose frames are decoded only when they are displayed."""
+from gamarts import GIFFile, ImageFolder
+from gamarts.art.lazy import LazyFrames
+from gamarts.transform import Invert, Zoom
+from conftest import surface_bytes
+
+GIF = 'images/wikipedia_earth.gif'
+
+def frames_bytes(art):
+    return [surface_bytes(art.surfaces[index]) for index in range(len(art.durations))]
+
+def test_streamed_gif_frames_are_the_decoded_frames():
+    decoded, streamed = GIFFile(GIF), GIFFile(GIF, streaming=True)
+    decoded.load()
+    streamed.load()
+    assert isinstance(streamed.surfaces, LazyFrames)
+    assert streamed.durations == decoded.durations
+    assert frames_bytes(streamed) == frames_bytes(decoded)
+
+def test_streamed_folder_frames_are_the_decoded_frames():
+    decoded, streamed = ImageFolder('images/squares', 100), ImageFolder('images/squares', 100, streaming=True)
+    decoded.load()
+    streamed.load()
+    assert isinstance(streamed.surfaces, LazyFrames)
+    assert frames_bytes(streamed) == frames_bytes(decoded)
+
+def test_only_the_window_is_kept_decoded():
+    art = GIFFile(GIF, streaming=True, window=(1, 3))
+    art.load()
+    art.surfaces[20]
+    decoded = art.surfaces.decoded()
+    assert 1 <= len(decoded) <= 5
+    art.surfaces[40]
+    assert len(art.surfaces.decoded()) <= 5
+
+def test_the_window_loops_after_the_introduction():
+    art = GIFFile(GIF, introduction=10, streaming=True, window=(0, 3))
+    art.load()
+    assert art.surfaces._window(43) == [43, 10, 11, 12] # pylint: disable=protected-access
+
+def test_streamed_frames_are_transformed_when_decoded():
+    decoded, streamed = GIFFile(GIF, transformation=Zoom(0.5)), GIFFile(GIF, transformation=Zoom(0.5), streaming=True)
+    decoded.load()
+    streamed.load()
+    decoded.transform(Invert())
+    streamed.transform(Invert())
+    decoded.get(cost_threshold=float('inf'))
+    streamed.get(cost_threshold=float('inf'))
+    assert isinstance(streamed.surfaces, LazyFrames)
+    assert streamed.size == decoded.size == (150, 150)
+    assert frames_bytes(streamed) == frames_bytes(decoded)
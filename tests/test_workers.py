@@ -0,0 +1,152 @@
+"""Tests of the thread budget shared by the worker pools, and of the routing of the transformations to the executor."""
+from threading import Event, Lock, current_thread
+import time
+import pytest
+from gamarts import _workers
+from gamarts._workers import ThreadBudget, WorkerPool
+from gamarts.art.executor import TransformationExecutor
+from gamarts.transform import Flip, Invert, cost_model
+
+@pytest.fixture
+def budget(monkeypatch):
+    """Replace the thread budget by one of two threads for the pools created in the test."""
+    budget = ThreadBudget(2)
+    monkeypatch.setattr(_workers, 'thread_budget', budget)
+    return budget
+
+def wait_until(predicate, timeout=5):
+    end = time.perf_counter() + timeout
+    while not predicate():
+        assert time.perf_counter() < end
+        time.sleep(0.005)
+
+class Probe:
+    """Tasks blocking until released, recording the maximum number of them running at once."""
+
+    def __init__(self):
+        self.released = Event()
+        self.running = 0
+        self.max_running = 0
+        self.order = []
+        self._lock = Lock()
+
+    def __call__(self, name=None):
+        with self._lock:
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+        self.released.wait(10)
+        with self._lock:
+            self.running -= 1
+            self.order.append(name)
+        return name
+
+def test_the_pools_share_the_threads_of_the_budget(budget):
+    probe = Probe()
+    pools = [WorkerPool(None, f"pool-{i}") for i in range(3)]
+    tasks = [pool.submit(probe) for pool in pools for _ in range(2)]
+    wait_until(lambda: probe.running == 2)
+    time.sleep(0.05)
+    assert probe.running == 2 and len(budget._workers) == 2
+    assert budget.active_workers == 2 and budget.queue_depth == 4
+    probe.released.set()
+    for task in tasks:
+        task.result(5)
+    assert probe.max_running == 2 and len(budget._workers) == 2
+    assert budget.queue_depth == 0 and budget.active_workers == 0
+
+def test_a_pool_executes_at_most_its_number_of_workers_at_once(budget):
+    probe = Probe()
+    pool = WorkerPool(1, "capped")
+    tasks = [pool.submit(probe) for _ in range(3)]
+    wait_until(lambda: probe.running == 1)
+    time.sleep(0.05)
+    assert pool.active_workers == 1 and pool.queue_depth == 2
+    probe.released.set()
+    assert pool.join(5)
+    assert probe.max_running == 1 and all(task.done() for task in tasks)
+
+def test_the_tasks_of_all_the_pools_are_executed_by_priority(monkeypatch):
+    budget = ThreadBudget(1)
+    monkeypatch.setattr(_workers, 'thread_budget', budget)
+    probe = Probe()
+    first, second = WorkerPool(None, "first"), WorkerPool(None, "second")
+    blocking = first.submit(probe, "blocking", priority=10)
+    wait_until(lambda: probe.running == 1)
+    first.submit(probe, "low", priority=0)
+    second.submit(probe, "high", priority=5)
+    first.submit(probe, "middle", priority=1)
+    second.submit(probe, "low again", priority=0)
+    probe.released.set()
+    assert first.join(5) and second.join(5) and blocking.done()
+    assert probe.order == ["blocking", "high", "middle", "low", "low again"]
+
+def test_a_task_waited_before_being_started_is_executed_by_the_waiting_thread(monkeypatch):
+    budget = ThreadBudget(1)
+    monkeypatch.setattr(_workers, 'thread_budget', budget)
+    probe = Probe()
+    pool = WorkerPool(None, "pool")
+    pool.submit(probe)
+    wait_until(lambda: probe.running == 1)
+    task = pool.submit(current_thread)
+    assert pool.queue_depth == 1
+    assert task.result(5) is current_thread()
+    assert pool.queue_depth == 0
+    probe.released.set()
+    assert pool.join(5)
+
+def test_nested_waits_do_not_deadlock(monkeypatch):
+    budget = ThreadBudget(1)
+    monkeypatch.setattr(_workers, 'thread_budget', budget)
+    outer_pool, inner_pool = WorkerPool(None, "outer"), WorkerPool(None, "inner")
+
+    def outer(i):
+        return sum(inner_pool.submit(lambda j=j: i*j).result() for j in range(3))
+
+    tasks = [outer_pool.submit(outer, i) for i in range(4)]
+    assert [task.result(5) for task in tasks] == [0, 3, 6, 9]
+
+def test_the_exceptions_are_raised_by_the_result(budget):
+    pool = WorkerPool(None, "failing")
+    task = pool.submit(lambda: 1/0)
+    with pytest.raises(ZeroDivisionError):
+        task.result(5)
+    assert isinstance(task.exception(), ZeroDivisionError)
+    assert pool.join(5)
+
+def test_the_utilisation_is_measured_and_reset(budget):
+    pool = WorkerPool(1, "sleeping")
+    other = WorkerPool(1, "idle")
+    pool.submit(time.sleep, 0.2)
+    assert pool.join(5)
+    assert pool.utilisation > 0.5
+    assert other.utilisation == 0
+    assert 0.25 < budget.utilisation <= 0.5 # One of the two threads has been busy.
+    budget.reset_statistics()
+    assert pool.utilisation < 0.1 and budget.utilisation < 0.1
+
+def test_the_transformations_are_routed_by_cost():
+    executor = TransformationExecutor(1)
+    invert = Invert()
+    assert invert.cost(100, 100, 2) == 20_000
+    assert executor.routes_to_background(invert, 100, 100, 2, cost_threshold=20_000)
+    assert not executor.routes_to_background(invert, 100, 100, 2, cost_threshold=20_001)
+    assert executor.routes_to_background(invert, 500, 500, 1) # The default threshold is 200_000.
+    assert not executor.routes_to_background(invert, 400, 400, 1)
+
+def test_the_transformations_are_routed_by_predicted_duration_when_calibrated():
+    executor = TransformationExecutor(1)
+    invert = Invert()
+    cost_model.record(invert, 100, 100, 1, 10.)
+    cost_model.fit()
+    try:
+        # 10 ms are predicted for 100x100 pixels, whatever the cost threshold.
+        assert executor.routes_to_background(invert, 100, 100, 1, time_threshold=5, cost_threshold=10**12)
+        assert not executor.routes_to_background(invert, 100, 100, 1, time_threshold=20, cost_threshold=0)
+        assert executor.routes_to_background(invert, 300, 300, 1, time_threshold=20, cost_threshold=10**12)
+        # Without time threshold, or for the transformations that have not been calibrated, the cost threshold is used.
+        assert not executor.routes_to_background(invert, 100, 100, 1, cost_threshold=10**12)
+        flip = Flip(True, False)
+        assert executor.routes_to_background(flip, 100, 100, 1, time_threshold=10**6, cost_threshold=0)
+        assert not executor.routes_to_background(flip, 100, 100, 1, time_threshold=0, cost_threshold=10**12)
+    finally:
+        cost_model.clear()